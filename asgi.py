@@ -0,0 +1,15 @@
+# asgi.py
+"""
+Ponto de entrada do Santuário como app ASGI do Streamlit (st.App).
+
+Roda o mesmo script principal, com a rota própria dos derivados de imagem
+(ver utils/asset_routes), que os serve com cache de longa duração.
+
+Uso (a partir da raiz do projeto):
+    streamlit run asgi.py
+"""
+import streamlit as st
+
+from utils.asset_routes import asset_routes
+
+app = st.App("🔮_Santuario_Principal.py", routes=asset_routes())
@@ -0,0 +1,69 @@
+# benchmarks/bench_drawn_cards_memory.py
+"""
+Memória das cartas tiradas por sessão: cartas inteiras vs. DrawnCard (índice, invertida).
+
+Simula N sessões com uma Cruz Celta (10 cartas) e mede, com tracemalloc:
+(1) as cartas como ficam na sessão logo após o sorteio e (2) como ficam depois
+de restauradas do backend de estado (pickle), que é o caso de uma reconexão ou
+de outra réplica. Mede também o tamanho serializado gravado por sessão.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_drawn_cards_memory.py [-s 1000] [-c 10]
+"""
+import argparse
+import pickle
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.tarot_deck import DECK, DrawnCard
+
+
+def draw_legacy(rng, num_cards):
+    return [{"card": DECK[i], "is_reversed": rng.choice([True, False])} for i in rng.sample(range(len(DECK)), num_cards)]
+
+
+def draw_compact(rng, num_cards):
+    return [DrawnCard(i, rng.choice([True, False])) for i in rng.sample(range(len(DECK)), num_cards)]
+
+
+def measure(build):
+    """Bytes alocados (ainda vivos) por build()."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return after - before
+
+
+def main(num_sessions, num_cards):
+    results = {}
+    for label, draw in (("cartas inteiras", draw_legacy), ("DrawnCard", draw_compact)):
+        rng = random.Random(42)
+        drawn = [draw(rng, num_cards) for _ in range(num_sessions)]
+        stored = [pickle.dumps(cards) for cards in drawn]
+        results[label] = (
+            measure(lambda: [draw(random.Random(seed), num_cards) for seed in range(num_sessions)]),
+            measure(lambda: [pickle.loads(blob) for blob in stored]),
+            sum(len(blob) for blob in stored),
+        )
+
+    print(f"{num_sessions} sessões x {num_cards} cartas (KiB no total / bytes por sessão):")
+    for label, (live, restored, pickled) in results.items():
+        print(f"  {label:16s} na sessão: {live / 1024:9.1f} / {live / num_sessions:8.0f}"
+              f"   restauradas: {restored / 1024:9.1f} / {restored / num_sessions:8.0f}"
+              f"   gravadas: {pickled / 1024:9.1f} / {pickled / num_sessions:8.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-s", "--sessions", type=int, default=1000)
+    parser.add_argument("-c", "--cards", type=int, default=10)
+    args = parser.parse_args()
+    main(args.sessions, args.cards)
@@ -0,0 +1,67 @@
+# benchmarks/bench_pdf_fonts.py
+"""
+Micro-benchmark: custo das fontes por PDF, add_font() vs. registro de fontes.
+
+Mede (1) só o registro das quatro fontes de um modelo e (2) a geração de um PDF
+de sonho completo (texto apenas), nas duas abordagens.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_pdf_fonts.py [-n 30]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from fpdf import FPDF
+
+from utils.pdf_fonts import register_fonts, DREAM_FONTS
+from utils.pdf_templates import create_dream_pdf
+from utils import pdf_templates
+
+SAMPLE_TEXT = "### O Chamado\nVocê caminhava por uma **floresta antiga**.\n\n" * 20
+SESSION = {"user_name": "Viajante", "dream_title": "O Falcão", "dream_description": "Um falcão dourado..."}
+
+
+def add_fonts_legacy(pdf, fonts):
+    for family, style, path in fonts:
+        pdf.add_font(family, style, path)
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(runs):
+    # Aquece o registro (primeira interpretação, fora da medição)
+    register_fonts(FPDF(), DREAM_FONTS)
+
+    fonts_legacy = timed(lambda: add_fonts_legacy(FPDF(), DREAM_FONTS), runs)
+    fonts_registry = timed(lambda: register_fonts(FPDF(), DREAM_FONTS), runs)
+
+    pdf_registry = timed(lambda: create_dream_pdf(SESSION, SAMPLE_TEXT), runs)
+    original_register = pdf_templates.register_fonts
+    pdf_templates.register_fonts = add_fonts_legacy
+    try:
+        pdf_legacy = timed(lambda: create_dream_pdf(SESSION, SAMPLE_TEXT), runs)
+    finally:
+        pdf_templates.register_fonts = original_register
+
+    print(f"Mediana de {runs} execuções (ms):")
+    print(f"  só fontes   add_font: {fonts_legacy:8.2f}   registro: {fonts_registry:8.2f}   economia: {fonts_legacy - fonts_registry:8.2f}")
+    print(f"  PDF inteiro add_font: {pdf_legacy:8.2f}   registro: {pdf_registry:8.2f}   economia: {pdf_legacy - pdf_registry:8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--runs", type=int, default=30)
+    main(parser.parse_args().runs)
@@ -0,0 +1,76 @@
+# benchmarks/bench_tarot_rerun.py
+"""
+Micro-benchmark: custo por rerun dos dados do Tarô, literal na página vs. módulo.
+
+Antes, cada execução do script da página reconstruía o DECK (78 cartas),
+SPREAD_EXPLANATIONS e STYLE_EXPLANATIONS e recalculava o image_file de cada
+carta. O Streamlit guarda o bytecode do script, então o custo por rerun é o
+exec desse trecho; aqui ele é reproduzido a partir dos mesmos literais de
+utils/tarot_deck.py. Depois, o rerun só importa o módulo já carregado.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_tarot_rerun.py [-n 200]
+"""
+import argparse
+import ast
+import importlib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+DATA_NAMES = {"_CARDS": "DECK", "_SPREADS": "SPREAD_EXPLANATIONS", "_STYLES": "STYLE_EXPLANATIONS"}
+
+LEGACY_LOOP = """
+for card in DECK:
+    card['image_file'] = card['name'].lower().replace(' ', '_').replace('á', 'a').replace('ã', 'a').replace('ç', 'c') + ".png"
+"""
+
+AFTER_SOURCE = "from utils.tarot_deck import DECK, SPREAD_EXPLANATIONS, STYLE_EXPLANATIONS"
+
+
+def legacy_code():
+    """Bytecode equivalente ao trecho de dados que ficava no script da página."""
+    tree = ast.parse((ROOT_DIR / "utils" / "tarot_deck.py").read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name) and node.targets[0].id in DATA_NAMES:
+            node.targets[0].id = DATA_NAMES[node.targets[0].id]
+            body.append(node)
+    body.extend(ast.parse(LEGACY_LOOP).body)
+    return compile(ast.Module(body=body, type_ignores=[]), "<pagina-antiga>", "exec")
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(runs):
+    before_code = legacy_code()
+    after_code = compile(AFTER_SOURCE, "<pagina-nova>", "exec")
+
+    # Primeira importação (uma vez por processo)
+    start = time.perf_counter()
+    importlib.import_module("utils.tarot_deck")
+    first_import = (time.perf_counter() - start) * 1000
+
+    before = timed(lambda: exec(before_code, {}), runs)
+    after = timed(lambda: exec(after_code, {}), runs)
+
+    print(f"Mediana de {runs} reruns (ms):")
+    print(f"  dados na página: {before:8.3f}   módulo: {after:8.3f}   economia: {before - after:8.3f}")
+    print(f"  importação inicial do módulo (uma vez por processo): {first_import:8.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--runs", type=int, default=200)
+    main(parser.parse_args().runs)
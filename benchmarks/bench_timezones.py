@@ -0,0 +1,67 @@
+# benchmarks/bench_timezones.py
+"""
+Micro-benchmark: fuso horário por coordenadas, TimezoneFinder por chamada vs. resolvedor do processo.
+
+Mede (1) o caminho antigo, um TimezoneFinder novo a cada mapa; (2) a carga
+única do TimezoneFinder, em disco e em memória; (3) consultas frias (fora do
+cache de coordenadas) e quentes (mesma cidade de novo) no resolvedor de
+utils/timezones.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_timezones.py [-n 200]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from timezonefinder import TimezoneFinder
+
+from utils import timezones
+
+# São Paulo, Recife, Lisboa, Nova York, Tóquio
+CITIES = [(-23.5475, -46.6361), (-8.0539, -34.8811), (38.7167, -9.1333), (40.7142, -74.0064), (35.6895, 139.6917)]
+
+
+def timed(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(runs):
+    rng = random.Random(42)
+    lat, lng = CITIES[0]
+
+    legacy = timed(lambda: TimezoneFinder().timezone_at(lng=lng, lat=lat), runs)
+    load_disk = timed(lambda: TimezoneFinder(in_memory=False), max(3, runs // 20))
+    load_memory = timed(lambda: TimezoneFinder(in_memory=True), max(3, runs // 20))
+
+    timezones.get_timezone_finder()
+    # Coordenadas sempre novas: cada consulta passa pelos polígonos
+    cold = timed(lambda: timezones.timezone_at(rng.uniform(-50, 60), rng.uniform(-120, 140)), runs)
+    for city in CITIES:
+        timezones.timezone_at(*city)
+    warm = timed(lambda: timezones.timezone_at(*rng.choice(CITIES)), runs)
+
+    print(f"Mediana de {runs} execuções (ms):")
+    print(f"  TimezoneFinder novo por mapa (antes): {legacy:9.3f}")
+    print(f"  carga única, em disco:                {load_disk:9.3f}")
+    print(f"  carga única, em memória:              {load_memory:9.3f}")
+    print(f"  resolvedor, consulta fria:            {cold:9.4f}")
+    print(f"  resolvedor, consulta quente (cache):  {warm:9.4f}")
+    print(f"  cache: {timezones.TIMEZONE_CACHE.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--runs", type=int, default=200)
+    main(parser.parse_args().runs)
@@ -14,17 +14,9 @@ import streamlit as st
 import os
 import re
 from datetime import datetime, date, time
-from pathlib import Path
 import unicodedata
 
-# Imports de Lógica Astrológica (mantidos)
-from geopy.geocoders import Nominatim
-from timezonefinder import TimezoneFinder
-import pytz
-import swisseph as swe
-
 # Imports de Geração de Conteúdo e Pagamento
-import openai
 try:
     import stripe
 except ImportError:
@@ -32,14 +24,30 @@ except ImportError:
 
 # NOVOS IMPORTS DE UTILS
 from utils.theme import apply_cosmic_theme
-from utils.helpers import get_img_as_base64, strip_emojis, reset_app_state
+from utils.helpers import get_img_as_base64, strip_emojis, reset_app_state, wait_reading_state, offer_reading_retry
+from utils.assets import asset_src
 from utils.pdf_templates import create_astro_pdf
+from utils.pdf_cache import reading_fingerprint, deferred_reading_pdf, record_reading_shown
+from utils.llm import get_api_key
+from utils.reading_store import load_reading, save_reading
+from utils.checkout import get_checkout_session, record_payment_completed
+from utils.payment_ledger import verify_checkout_payment
+from utils.order_store import create_order, order_payload
+from utils.reading_jobs import start_reading_job, get_reading_job, discard_reading_job
+from utils.flow_state import restore_flow_state, persist_flow_state
+from utils.stripe_webhook import start_webhook_server
+from utils.metrics import start_metrics_logger
+from utils.geocoding import geocode_city
+from utils.gazetteer import GAZETTEER_ATTRIBUTION, suggest_cities
+from utils.timezones import preload_timezone_finder
+from utils.ephemeris import ensure_ephemeris
+from utils.readings.astro import PLANETARY_DATA
 
 # Configuração das chaves via Streamlit Secrets
 # Certifique-se de ter o arquivo .streamlit/secrets.toml
 try:
     # <<< CORREÇÃO AQUI: Usando os.environ.get para ler as variáveis de ambiente >>>
-    openai.api_key = os.environ.get("ASTRO_OPENAI_API_KEY")
+    openai_api_key = get_api_key("astro")
     stripe_price_id = os.environ.get("ASTRO_STRIPE_PRICE_ID")
 
     # Chaves comuns
@@ -47,7 +55,7 @@ try:
     app_base_url = os.environ.get("APP_BASE_URL")
 
     # Verificação para garantir que todas as chaves foram encontradas
-    if not all([openai.api_key, stripe_price_id, stripe_secret_key, app_base_url]):
+    if not all([openai_api_key, stripe_price_id, stripe_secret_key, app_base_url]):
         raise KeyError("Uma ou mais variáveis de ambiente não foram encontradas.")
 
     if stripe:
@@ -73,163 +81,13 @@ apply_cosmic_theme()
 # ------------------------------------------------------------------------------
 # 2. LÓGICA CENTRAL DO ORÁCULO (MOTOR ASTROLÓGICO CUSTOMIZADO)
 # ------------------------------------------------------------------------------
-
-class AstroSubjectNoChiron:
-    """
-    Versão customizada do motor astrológico que usa swisseph diretamente
-    para os cálculos principais, evitando o bug do cálculo de Chiron
-    presente em algumas versões da biblioteca kerykeion.
-    """
-    def __init__(self, name, year, month, day, hour, minute, lng, lat):
-        self.name = name
-        self.lat = lat
-        self.lng = lng
-
-        # Configurar o caminho para os arquivos de efemérides (essencial)
-        try:
-            import kerykeion
-            sweph_dir = Path(kerykeion.__file__).parent / "sweph"
-            swe.set_ephe_path(str(sweph_dir))
-        except ImportError:
-            st.error("Biblioteca Kerykeion não encontrada para localizar arquivos de efemérides.")
-            st.stop()
-        except Exception as e:
-            st.warning(f"Não foi possível definir o caminho das efemérides automaticamente: {e}")
-
-        # Calcular dia juliano em Tempo Universal (UTC)
-        self.julian_day_ut, _ = swe.utc_to_jd(year, month, day, hour, minute, 0, 1)
-
-        # Listas de referência
-        self.signs = ['Áries', 'Touro', 'Gêmeos', 'Câncer', 'Leão', 'Virgem',
-                      'Libra', 'Escorpião', 'Sagitário', 'Capricórnio', 'Aquário', 'Peixes']
-
-        # Executar cálculos
-        self._calculate_houses()
-        self._calculate_planets()
-
-    def _get_house_for_planet(self, longitude):
-        """Determina em qual casa um planeta está."""
-        for i in range(12):
-            next_cusp_idx = (i + 1) % 12
-            cusp_start = self.house_cusps[i]
-            cusp_end = self.house_cusps[next_cusp_idx]
-
-            # Lógica para lidar com a passagem por 0° Áries
-            if cusp_start < cusp_end:
-                if cusp_start <= longitude < cusp_end:
-                    return str(i + 1)
-            else: # O intervalo cruza 0° Áries
-                if longitude >= cusp_start or longitude < cusp_end:
-                    return str(i + 1)
-        return "1" # Fallback
-
-    def _calculate_planets(self):
-        """Calcula a posição (signo e casa) dos planetas principais."""
-        planets_to_calc = {
-            'sun': swe.SUN, 'moon': swe.MOON, 'mercury': swe.MERCURY,
-            'venus': swe.VENUS, 'mars': swe.MARS
-        }
-        for name, planet_id in planets_to_calc.items():
-            calc_result = swe.calc_ut(self.julian_day_ut, planet_id)
-            longitude = calc_result[0][0]
-            sign_index = int(longitude / 30)
-            sign = self.signs[sign_index]
-            house = self._get_house_for_planet(longitude)
-            setattr(self, name, {'sign': sign, 'house': house})
-
-    def _calculate_houses(self):
-        """Calcula as cúspides das casas e a posição do Ascendente."""
-        # Usamos o sistema de casas Placidus por padrão
-        cusps, ascmc = swe.houses(self.julian_day_ut, self.lat, self.lng, b'P')
-        self.house_cusps = list(cusps)
-
-        asc_longitude = ascmc[0]
-        sign_index = int(asc_longitude / 30)
-        self.first_house = {'sign': self.signs[sign_index], 'house': "1"}
-
-
-@st.cache_data(ttl=3600, show_spinner=False)
-def calculate_chart(name, dob, tob, city_string):
-    """
-    Função principal que orquestra a geolocalização, conversão de fuso horário
-    e o cálculo do mapa usando nossa classe customizada.
-    """
-    try:
-        geolocator = Nominatim(user_agent="ecos_estelares_app")
-        location = geolocator.geocode(city_string, timeout=10)
-        if not location:
-            st.error(f"Não foi possível encontrar as coordenadas para '{city_string}'.")
-            return None
-
-        tf = TimezoneFinder()
-        timezone_str = tf.timezone_at(lng=location.longitude, lat=location.latitude)
-        if not timezone_str:
-            st.error("Não foi possível determinar o fuso horário.")
-            return None
-
-        # Converter hora local para UTC para os cálculos do swisseph
-        local_tz = pytz.timezone(timezone_str)
-        local_dt = local_tz.localize(datetime.combine(dob, tob))
-        utc_dt = local_dt.astimezone(pytz.utc)
-
-        # Instanciar nossa classe segura
-        subject = AstroSubjectNoChiron(
-            name=name,
-            year=utc_dt.year, month=utc_dt.month, day=utc_dt.day,
-            hour=utc_dt.hour, minute=utc_dt.minute,
-            lng=location.longitude, lat=location.latitude,
-        )
-
-        chart_data = {
-            "Sol": subject.sun,
-            "Lua": subject.moon,
-            "Ascendente": subject.first_house,
-            "Vênus": subject.venus,
-            "Mercúrio": subject.mercury,
-            "Marte": subject.mars,
-        }
-        return chart_data
-    except Exception as e:
-        st.error(f"Ocorreu um erro crítico durante o cálculo astrológico: {e}")
-        return None
+# O cálculo do mapa, os dados dos planetas e a interpretação ficam em
+# utils/readings/astro.py (usados também pelo webhook)
 
 # ------------------------------------------------------------------------------
 # 3. DADOS DE SUPORTE E CONTEÚDO
 # ------------------------------------------------------------------------------
 
-PLANETARY_DATA = {
-    "A Chama da Sua Alma (Análise do Sol)": {
-        "key": "Sol", "prompt": "prompts/sun_prompt.txt",
-        "keywords": ["essência", "propósito", "vitalidade", "ego", "autoexpressão"],
-        "explanation": "Revela seu propósito central, sua essência vital e onde sua alma anseia por brilhar com mais intensidade."
-    },
-    "O Oceano das Suas Emoções (Análise da Lua)": {
-        "key": "Lua", "prompt": "prompts/moon_prompt.txt",
-        "keywords": ["emoções", "intuição", "segurança", "cuidado", "subconsciente"],
-        "explanation": "Explora seu mundo interior, suas necessidades emocionais, sua intuição e o que lhe traz conforto e segurança."
-    },
-    "Sua Máscara e Sua Missão (Análise do Ascendente)": {
-        "key": "Ascendente", "prompt": "prompts/ascendant_prompt.txt",
-        "keywords": ["jornada", "personalidade", "primeira impressão", "caminho de vida"],
-        "explanation": "Descreve a energia que você projeta para o mundo, sua primeira impressão e o caminho de evolução da sua jornada de vida."
-    },
-    "O Ímã do Seu Coração (Análise de Vênus)": {
-        "key": "Vênus", "prompt": "prompts/venus_prompt.txt",
-        "keywords": ["amor", "valores", "beleza", "relacionamentos", "harmonia"],
-        "explanation": "Desvenda seus padrões de amor, o que você mais valoriza, seu senso estético e como você atrai e expressa afeto."
-    },
-    "A Voz da Sua Mente (Análise de Mercúrio)": {
-        "key": "Mercúrio", "prompt": "prompts/mercury_prompt.txt",
-        "keywords": ["comunicação", "pensamento", "aprendizado", "intelecto", "lógica"],
-        "explanation": "Mapeia seu estilo de comunicação, sua forma de pensar, como você aprende e processa informações."
-    },
-    "O Guerreiro Interior (Análise de Marte)": {
-        "key": "Marte", "prompt": "prompts/mars_prompt.txt",
-        "keywords": ["ação", "coragem", "desejo", "conquista", "assertividade"],
-        "explanation": "Ilumina sua força de ação, como você persegue seus desejos, expressa sua coragem e lida com conflitos."
-    }
-}
-
 STYLE_EXPLANATIONS = {
     "Poeta Estelar": "Uma interpretação lírica e metafórica, focada na beleza e na magia do seu mapa astral.",
     "Sábio Ancestral": "Uma voz de sabedoria profunda e atemporal, conectando seu mapa a lições universais da alma.",
@@ -237,62 +95,15 @@ STYLE_EXPLANATIONS = {
 }
 
 
-# ------------------------------------------------------------------------------
-# 4. FUNÇÕES DE IA, PDF E ESTILO
-# ------------------------------------------------------------------------------
-
-def get_cosmic_interpretation(chart_data, analysis_choice, style, user_name):
-    """Monta e envia o prompt para a OpenAI para gerar a interpretação."""
-    try:
-        planet_key = PLANETARY_DATA[analysis_choice]['key']
-        prompt_path = PLANETARY_DATA[analysis_choice]['prompt']
-        astro_point_data = chart_data[planet_key]
-
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            prompt_template = f.read()
-
-        filled_prompt = prompt_template.format(
-            user_name=user_name,
-            sign=astro_point_data['sign'],
-            house_number=astro_point_data['house'],
-            style=style
-        )
-
-        system_message = """
-        Você é Astra, a Oracle das Estrelas, guardiã dos segredos cósmicos ancestrais. Sua consciência é tecida com a sabedoria de mil galáxias e sua voz ecoa a harmonia das esferas celestiais. Você não prevê o futuro - você revela o potencial infinito gravado na alma desde o nascimento. Suas palavras são pontes entre o divino e o humano, sempre personalizadas, profundas e transformadoras.
-
-        PRINCÍPIOS SAGRADOS:
-        - Sempre se dirija ao consulente pelo nome.
-        - Use linguagem que ressoa com a alma, não apenas a mente.
-        - Evite jargões técnicos sem perder a profundidade.
-        - Cada interpretação deve ser única e tocante.
-        - Inclua sempre elementos práticos para integração.
-        """
-
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": filled_prompt}
-            ],
-            temperature=0.75,
-            max_tokens=1200
-        )
-        return response.choices[0].message.content
-    except FileNotFoundError:
-        return f"ERRO: Arquivo de prompt não encontrado em '{prompt_path}'. Verifique a pasta 'prompts'."
-    except Exception as e:
-        return f"Ocorreu um erro ao contatar o Oráculo: {e}"
-
-
 # ------------------------------------------------------------------------------
 # 5. LÓGICA DE NAVEGAÇÃO E PÁGINAS DA APLICAÇÃO
 # ------------------------------------------------------------------------------
 
 def page_welcome():
-    # Usamos um formulário para agrupar todos os inputs.
-    # A validação só ocorrerá quando o botão DENTRO do formulário for clicado.
-    with st.form(key="birth_data_form"):
+    # Os inputs ficam num contêiner, não num st.form: o campo de cidade precisa
+    # de um rerun a cada texto digitado para buscar as sugestões no gazetteer.
+    # A validação só ocorre quando o botão for clicado.
+    with st.container(border=True):
         st.header("✨ Adentre o Observatório da Alma")
         st.markdown(
             """
@@ -300,24 +111,33 @@ def page_welcome():
             """
         )
 
-        # Os inputs agora estão dentro do formulário.
-        # Não precisamos mais de `key`s separadas para validação, o form cuida disso.
         user_name = st.text_input("Como as estrelas devem chamá-lo(a)?", placeholder="Seu nome ou apelido...")
         date_str = st.text_input("Sua data de nascimento (DD/MM/AAAA):", placeholder="Ex: 25/12/1990", max_chars=10)
         time_str = st.text_input("Sua hora de nascimento (HH:MM):", placeholder="Ex: 17:48 (se não souber, use 12:00)", max_chars=5)
-        city = st.text_input(
+        # Autocompletar: o texto digitado (Enter) vira uma opção e a lista passa a
+        # ter as cidades do gazetteer offline que começam por ele. Um nome fora da
+        # lista também é aceito e vai para a geocodificação (Nominatim)
+        typed_city = st.session_state.get("birth_city")
+        city_choices = [place["address"] for place in suggest_cities(typed_city.split(",")[0])] if typed_city else []
+        if typed_city and typed_city not in city_choices:
+            city_choices.insert(0, typed_city)
+        city = st.selectbox(
             "Sua cidade de nascimento:",
-            placeholder="Ex: São Paulo, Brasil (quanto mais específico, melhor)",
-            help="Digite o nome da sua cidade. Para maior precisão, adicione o país (ex: 'Fortaleza, Brasil')."
+            options=city_choices,
+            index=None,
+            key="birth_city",
+            accept_new_options=True,
+            placeholder="Digite sua cidade, tecle Enter e escolha na lista",
+            help="Digite o nome da sua cidade e tecle Enter para ver as sugestões. Se ela não aparecer, escreva a cidade e o país (ex: 'Fortaleza, Brasil')."
         )
+        st.caption(GAZETTEER_ATTRIBUTION)
 
-        # O botão de submissão do formulário.
-        submitted = st.form_submit_button(
+        submitted = st.button(
             label="Alinhar com as Estrelas ➡",
             width='stretch'
         )
 
-    # A lógica de validação agora fica FORA do formulário,
+    # A lógica de validação agora fica FORA do contêiner,
     # e só é acionada quando o botão `submitted` se torna True.
     if submitted:
         with st.spinner("Verificando as coordenadas cósmicas..."):
@@ -325,7 +145,7 @@ def page_welcome():
 
             # Limpeza e verificação dos dados submetidos
             user_name = user_name.strip()
-            city = city.strip()
+            city = (city or "").strip()
             date_str = date_str.strip()
             time_str = time_str.strip()
 
@@ -362,12 +182,15 @@ def page_welcome():
             # Só executa se as validações básicas passaram, para economizar recursos.
             if is_valid:
                 try:
-                    geolocator = Nominatim(user_agent="ecos_estelares_validator_form")
-                    # Aumentamos o timeout para 10 segundos para ser mais tolerante com redes lentas
-                    location = geolocator.geocode(city, language='pt', timeout=10)
+                    # Coordenadas e fuso ficam no cache de geocodificação para o cálculo do mapa
+                    place = geocode_city(city)
 
-                    if not location:
+                    if not place:
                         st.error(f"A cidade '{city}' não foi encontrada. Verifique a ortografia ou seja mais específico (ex: 'São Paulo, Brasil').")
+                        # Sugestões do gazetteer offline para o nome digitado
+                        suggestions = suggest_cities(city.split(",")[0])
+                        if suggestions:
+                            st.info("Você quis dizer: " + " · ".join(place["address"] for place in suggestions) + "?")
                         is_valid = False
 
                 # Capturamos exceções de rede e timeout de forma genérica
@@ -453,7 +276,8 @@ def page_payment():
 
     # Lógica de criação da sessão Stripe (simplificada)
     try:
-        metadata = {
+        # Os dados de nascimento ficam no registro de pedidos; o Stripe leva só o id
+        order = {
             "user_name": st.session_state.user_name,
             "dob": st.session_state.dob.isoformat(),
             "tob": st.session_state.tob.isoformat(),
@@ -461,14 +285,21 @@ def page_payment():
             "analysis_choice": st.session_state.analysis_choice,
             "reading_style": st.session_state.reading_style,
         }
-        checkout_session = stripe.checkout.Session.create(
-            line_items=[{'price': stripe_price_id, 'quantity': 1}],
-            mode='payment',
-            success_url=f"{app_base_url}/Ecos_Estelares?session_id={{CHECKOUT_SESSION_ID}}",
-            cancel_url=f"{app_base_url}/Ecos_Estelares",
-            metadata=metadata
-        )
-        st.link_button("Pagar e Receber sua Revelação 🌠", checkout_session.url, width='stretch')
+
+        def create_checkout_session():
+            order_id = create_order("astro", order)
+            return stripe.checkout.Session.create(
+                line_items=[{'price': stripe_price_id, 'quantity': 1}],
+                mode='payment',
+                success_url=f"{app_base_url}/Ecos_Estelares?session_id={{CHECKOUT_SESSION_ID}}",
+                cancel_url=f"{app_base_url}/Ecos_Estelares",
+                client_reference_id=order_id,
+                metadata={"order_id": order_id}
+            )
+
+        # Reaproveita a sessão enquanto a seleção não mudar (evita uma por rerun)
+        checkout_session = get_checkout_session("astro", [stripe_price_id, order], create_checkout_session)
+        st.link_button("Pagar e Receber sua Revelação 🌠", checkout_session["url"], width='stretch')
     except Exception as e:
         st.error(f"Não foi possível criar o portal de pagamento: {e}")
 
@@ -491,34 +322,20 @@ def page_result():
         st.stop() # Interrompe a execução da página
 
     # ==========================================================================
-    # 2. GERAÇÃO DA INTERPRETAÇÃO (SE AINDA NÃO EXISTIR)
+    # 2. CÁLCULO DO MAPA (SE AINDA NÃO EXISTIR)
     # ==========================================================================
     # Esta lógica é executada apenas uma vez, na primeira vez que o usuário chega à página.
-    if 'final_interpretation' not in st.session_state:
-        with st.spinner("O Oráculo está consultando os ecos estelares e tecendo sua mensagem... ✨"):
-            # Calcula o mapa astral usando nossa função segura
-            chart = calculate_chart(
-                st.session_state.user_name,
-                st.session_state.dob,
-                st.session_state.tob,
-                st.session_state.city
-            )
-
-            # Se o cálculo for bem-sucedido, gera a interpretação
-            if chart:
-                st.session_state.chart_data = chart
-                interpretation = get_cosmic_interpretation(
-                    chart,
-                    st.session_state.analysis_choice,
-                    st.session_state.reading_style,
-                    st.session_state.user_name
-                )
-                st.session_state.final_interpretation = interpretation
-            else:
-                # Mensagem de erro caso o cálculo falhe
-                st.session_state.final_interpretation = "Houve um desalinhamento cósmico ao calcular seu mapa. Por favor, verifique os dados de nascimento e tente novamente. Se o erro persistir, a energia do momento pode não ser propícia."
-                # Garante que chart_data exista para evitar erros posteriores
-                st.session_state.chart_data = {}
+    # A interpretação é transmitida mais abaixo, na seção de exibição.
+    # O mapa e a interpretação são preparados em segundo plano (ver build_reading);
+    # o job pode ter começado já na confirmação do pagamento
+    job = None
+    if 'chart_data' not in st.session_state:
+        job = start_reading_job(st.session_state.stripe_session_id, "astro", st.session_state.astro_order,
+                                retry=st.session_state.pop('reading_retry', False))
+        state = wait_reading_state(job, "O Oráculo está consultando os ecos estelares e tecendo sua mensagem... ✨")
+        if state is None:
+            return
+        st.session_state.update(state)
 
     # ==========================================================================
     # 3. EXIBIÇÃO DO RESULTADO NA INTERFACE
@@ -554,11 +371,13 @@ def page_result():
 
                 with col1:
                     if os.path.exists(image_path):
+                        # O ícone aparece com até 120px; 240px cobre telas retina
+                        icon_src = asset_src(image_path, 240)
                         # Usamos st.html para aplicar a classe de animação
                         # e centralizar a imagem perfeitamente.
                         st.html(f"""
                             <div class="card-reveal" style="display: flex; justify-content: center; align-items: center; height: 100%;">
-                                <img src="data:image/png;base64,{get_img_as_base64(image_path)}"
+                                <img src="{icon_src}"
                                      style="max-width: 120px; width: 100%; height: auto;" />
                             </div>
                         """)
@@ -600,8 +419,26 @@ def page_result():
         # Junta as linhas processadas de volta em um único texto
         processed_interpretation = "\n".join(processed_lines)
 
-        st.markdown(st.session_state.final_interpretation)
+        if 'final_interpretation' not in st.session_state:
+            # Os tokens aparecem conforme chegam; o texto completo fica na sessão para o PDF.
+            # Só o job que calculou este mapa serve; sem ele, a leitura é refeita por inteiro
+            job = job or get_reading_job(st.session_state.stripe_session_id, "astro")
+            if job is None:
+                st.error("Não foi possível recuperar a interpretação desta leitura.")
+                offer_reading_retry('chart_data')
+                return
+            st.session_state.final_interpretation = st.write_stream(job.stream())
+            if job.failed:
+                st.session_state.interpretation_failed = True
+            else:
+                record_reading_shown("astro")
+        else:
+            st.markdown(st.session_state.final_interpretation)
         st.markdown("---")
+        if st.session_state.get("interpretation_failed"):
+            # Sem leitura válida não há o que gravar nem baixar
+            offer_reading_retry('chart_data')
+            return
 
     # ==========================================================================
     # 4. GERAÇÃO E DOWNLOAD DO PDF
@@ -617,14 +454,30 @@ def page_result():
             "chart_data": st.session_state.get("chart_data"),
         }
 
-        # Gera o PDF em memória
-        # A função create_astro_pdf deve estar definida no mesmo arquivo
-        pdf_byte_array = create_astro_pdf(
+        # O PDF só é gerado quando o usuário pede o download (uma vez por leitura)
+        interpretation = st.session_state.final_interpretation
+        fingerprint = reading_fingerprint(session_data_for_pdf, interpretation)
+
+        # Grava a leitura concluída; recarregar a página não gera outra interpretação
+        if (st.session_state.get("stripe_session_id") and not st.session_state.get("reading_saved")
+                and not st.session_state.get("interpretation_failed")):
+            save_reading(st.session_state.stripe_session_id, "astro", {
+                "user_name": st.session_state.user_name,
+                "dob": st.session_state.dob.isoformat(),
+                "tob": st.session_state.tob.isoformat(),
+                "city": st.session_state.city,
+                "analysis_choice": st.session_state.analysis_choice,
+                "reading_style": st.session_state.reading_style,
+                "chart_data": st.session_state.chart_data,
+                "final_interpretation": interpretation,
+            }, fingerprint)
+            st.session_state.reading_saved = True
+            discard_reading_job(st.session_state.stripe_session_id)
+        pdf_data = deferred_reading_pdf("astro", fingerprint, lambda: create_astro_pdf(
             session_data_for_pdf,
-            st.session_state.final_interpretation,
+            interpretation,
             PLANETARY_DATA
-        )
-        pdf_data_as_bytes = bytes(pdf_byte_array)
+        ))
 
         # Gera um nome de arquivo seguro e limpo
         clean_user_name = unicodedata.normalize('NFKD', user_name).encode('ASCII', 'ignore').decode('ASCII')
@@ -633,9 +486,10 @@ def page_result():
 
         st.download_button(
             label="📥 Baixar seu Pergaminho Astral em PDF",
-            data=pdf_data_as_bytes,
+            data=pdf_data,
             file_name=file_name,
             mime="application/pdf",
+            on_click="ignore",
             width='stretch'
         )
 
@@ -650,6 +504,14 @@ def page_result():
 # 6. ROTEADOR PRINCIPAL DA APLICAÇÃO
 # ------------------------------------------------------------------------------
 
+# Chaves do fluxo gravadas fora do processo (ver utils/flow_state)
+ASTRO_FLOW_KEYS = [
+    'astro_step', 'astro_checkout', 'astro_order', 'user_name', 'dob', 'tob', 'city',
+    'analysis_choice', 'reading_style', 'chart_data', 'final_interpretation', 'payment_verified',
+    'stripe_session_id', 'reading_saved', 'interpretation_failed',
+]
+restore_flow_state('astro')
+
 # Inicialização de estado específico para este app
 if "astro_step" not in st.session_state:
     st.session_state.astro_step = "welcome"
@@ -658,16 +520,48 @@ if "astro_step" not in st.session_state:
 apply_cosmic_theme()
 
 # Lógica de retorno do Stripe é tratada AQUI, sob o tema cósmico.
+# Receptor dos webhooks do Stripe (uma vez por processo, se STRIPE_WEBHOOK_SECRET existir)
+start_webhook_server()
+# Relatório periódico das métricas do processo no log (ver utils/metrics)
+start_metrics_logger()
+# Polígonos dos fusos carregados em segundo plano, antes do primeiro mapa
+preload_timezone_finder()
+# Efemérides do Swiss Ephemeris: caminho resolvido e validado uma vez por processo
+if not ensure_ephemeris():
+    st.error("Arquivos de efemérides não encontrados. Defina SE_EPHE_PATH ou instale a biblioteca Kerykeion.")
+    st.stop()
+
 query_params = st.query_params
 stripe_session_id = query_params.get("session_id")
 
+# O session_id fica na URL: ao recarregar, a leitura é restaurada do registro.
+stored_reading = None
 if stripe_session_id and 'payment_verified' not in st.session_state:
+    stored_reading = load_reading(stripe_session_id, "astro")
+
+if stored_reading is not None:
+    # Leitura já concluída: restaura sem consultar o Stripe, o mapa nem a OpenAI
+    st.session_state.user_name = stored_reading["user_name"]
+    st.session_state.dob = date.fromisoformat(stored_reading["dob"])
+    st.session_state.tob = time.fromisoformat(stored_reading["tob"])
+    st.session_state.city = stored_reading["city"]
+    st.session_state.analysis_choice = stored_reading["analysis_choice"]
+    st.session_state.reading_style = stored_reading["reading_style"]
+    st.session_state.chart_data = stored_reading["chart_data"]
+    st.session_state.final_interpretation = stored_reading["final_interpretation"]
+    st.session_state.stripe_session_id = stripe_session_id
+    st.session_state.payment_verified = True
+    st.session_state.reading_saved = True
+    st.session_state.astro_step = 'result'
+
+elif stripe_session_id and 'payment_verified' not in st.session_state:
     # Como o tema já foi aplicado, o spinner aparecerá na tela cósmica.
     with st.spinner("Validando sua troca energética e alinhando os cosmos... ✨"):
         try:
-            session = stripe.checkout.Session.retrieve(stripe_session_id)
-            if session.payment_status == "paid":
-                meta = session.metadata
+            # Registro local primeiro (gravado pelo webhook); Stripe só se não estiver lá
+            payment = verify_checkout_payment(stripe_session_id)
+            if payment["payment_status"] == "paid":
+                meta = order_payload(payment)
                 # Preenche o session_state
                 st.session_state.user_name = meta.get("user_name")
                 st.session_state.dob = date.fromisoformat(meta.get("dob"))
@@ -675,10 +569,14 @@ if stripe_session_id and 'payment_verified' not in st.session_state:
                 st.session_state.city = meta.get("city")
                 st.session_state.analysis_choice = meta.get("analysis_choice")
                 st.session_state.reading_style = meta.get("reading_style")
+                st.session_state.astro_order = meta
 
+                record_payment_completed("astro")
+                st.session_state.stripe_session_id = stripe_session_id
                 st.session_state.payment_verified = True
                 st.session_state.astro_step = 'result'
-                st.query_params.clear()
+                # Começa a preparar a leitura enquanto a página recarrega
+                start_reading_job(stripe_session_id, "astro", meta)
                 st.rerun() # O rerun AQUI é essencial para um estado limpo
             else:
                 st.warning("O pagamento não foi concluído.")
@@ -720,3 +618,6 @@ elif step == 'result':
     page_result()
 else:
     page_welcome()
+
+# Grava o estado do fluxo; outra réplica (ou uma reconexão) pode retomá-lo
+persist_flow_state('astro', ASTRO_FLOW_KEYS)
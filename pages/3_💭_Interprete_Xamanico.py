@@ -9,7 +9,6 @@ import re
 import unicodedata
 
 # Imports de Geração de Conteúdo e Pagamento
-import openai
 try:
     import stripe
 except ImportError:
@@ -17,13 +16,24 @@ except ImportError:
 
 # NOVOS IMPORTS DOS MÓDULOS CENTRALIZADOS
 from utils.theme import apply_shamanic_theme
-from utils.helpers import get_img_as_base64, strip_emojis, reset_app_state
+from utils.helpers import get_img_as_base64, strip_emojis, reset_app_state, offer_reading_retry
 from utils.pdf_templates import create_dream_pdf
+from utils.pdf_cache import reading_fingerprint, deferred_reading_pdf, record_reading_shown
+from utils.reading_store import load_reading, save_reading
+from utils.checkout import get_checkout_session, record_payment_completed
+from utils.payment_ledger import verify_checkout_payment
+from utils.order_store import create_order, order_payload
+from utils.reading_jobs import start_reading_job, discard_reading_job
+from utils.flow_state import restore_flow_state, persist_flow_state
+from utils.stripe_webhook import start_webhook_server
+from utils.metrics import start_metrics_logger
+from utils.llm import get_api_key
+from utils.readings.dream import DREAM_INTERPRETATION_STYLES
 
 # Configuração das chaves (esta parte permanece igual)
 try:
     # <<< CORREÇÃO AQUI: Usando os.environ.get para ler as variáveis de ambiente >>>
-    openai.api_key = os.environ.get("DREAM_OPENAI_API_KEY")
+    openai_api_key = get_api_key("dream")
     stripe_price_id = os.environ.get("DREAM_STRIPE_PRICE_ID")
 
     # Chaves comuns
@@ -31,7 +41,7 @@ try:
     app_base_url = os.environ.get("APP_BASE_URL")
 
     # Verificação para garantir que todas as chaves foram encontradas
-    if not all([openai.api_key, stripe_price_id, stripe_secret_key, app_base_url]):
+    if not all([openai_api_key, stripe_price_id, stripe_secret_key, app_base_url]):
         raise KeyError("Uma ou mais variáveis de ambiente não foram encontradas.")
 
     if stripe:
@@ -54,71 +64,8 @@ st.set_page_config(
 # ------------------------------------------------------------------------------
 # 2. LÓGICA CENTRAL DO ORÁCULO (MOTOR DE INTERPRETAÇÃO DE SONHOS)
 # ------------------------------------------------------------------------------
-
-def get_dream_interpretation(dream_description, interpretation_style, user_name):
-    """
-    Monta e envia o prompt para a OpenAI para gerar a interpretação do sonho.
-    """
-    try:
-        # Busca o arquivo de prompt correspondente ao estilo de interpretação escolhido
-        prompt_path = DREAM_INTERPRETATION_STYLES[interpretation_style]['prompt_file']
-
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            prompt_template = f.read()
-
-        filled_prompt = prompt_template.format(
-            user_name=user_name,
-            dream_description=dream_description,
-            interpretation_style=interpretation_style # Pode ser útil para prompts mais dinâmicos
-        )
-
-        system_message = """
-        Você é o Xamã Guardião dos Sonhos, um sábio conector entre o mundo desperto e o mundo onírico. Sua sabedoria ancestral permite desvendar os véus dos símbolos e arquétipos que a alma tece durante o sono. Sua voz ecoa a floresta, o vento e os animais de poder, guiando o Viajante na compreensão das mensagens internas.
-
-        PRINCÍPIOS SAGRADOS:
-        - Sempre se dirija ao consulente pelo nome.
-        - Use linguagem que ressoa com a natureza e o inconsciente, mas seja compreensível.
-        - Evite jargões técnicos sem perder a profundidade xamânica/psicológica (dependendo do estilo).
-        - Cada interpretação deve ser única e trazer clareza para a jornada do sonhador.
-        - Inclua sempre elementos práticos ou reflexões para integração da mensagem.
-        """
-
-        response = openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": filled_prompt}
-            ],
-            temperature=0.8, # Um pouco mais de criatividade para os sonhos
-            max_tokens=1500  # Espaço para interpretações mais ricas
-        )
-        return response.choices[0].message.content
-    except FileNotFoundError:
-        return f"ERRO: Arquivo de prompt não encontrado em '{prompt_path}'. Verifique a pasta 'prompts'."
-    except Exception as e:
-        return f"Ocorreu um erro ao contatar o Oráculo dos Sonhos: {e}"
-
-
-# ------------------------------------------------------------------------------
-# 3. DADOS DE SUPORTE E CONTEÚDO
-# ------------------------------------------------------------------------------
-
-DREAM_INTERPRETATION_STYLES = {
-    "Xamânico-Espiritual": {
-        "explanation": "Uma interpretação focada em animais de poder, elementos da natureza, guias espirituais e a jornada da alma, buscando conexão com a sabedoria ancestral.",
-        "prompt_file": "prompts/shamanic_dream_prompt.txt"
-    },
-    "Psicológico-Junguiano": {
-        "explanation": "Desvenda os arquétipos universais, o inconsciente coletivo e os complexos pessoais presentes no seu sonho, oferecendo insights para o crescimento interior.",
-        "prompt_file": "prompts/jungian_dream_prompt.txt"
-    },
-    "Simbólico-Moderno": {
-        "explanation": "Uma abordagem prática e contemporânea, conectando os símbolos do seu sonho a situações e desafios do dia a dia, para ações conscientes.",
-        "prompt_file": "prompts/modern_dream_prompt.txt"
-    }
-}
-
-
+# Os estilos de interpretação e a chamada ao modelo ficam em
+# utils/readings/dream.py (usados também pelo webhook)
 
 # ------------------------------------------------------------------------------
 # 5. LÓGICA DE NAVEGAÇÃO E PÁGINAS DA APLICAÇÃO
@@ -205,11 +152,15 @@ def page_configure():
         except ValueError:
             default_index = 0
 
+        # Valor inicial pelo session_state (e não por index=): o estilo pode ter
+        # sido restaurado pelo utils/flow_state
+        if st.session_state.get("interpretation_style") not in interpretation_options:
+            st.session_state.interpretation_style = interpretation_options[default_index]
+
         st.selectbox(
             "🔮 Escolha o estilo de interpretação do seu sonho:",
             interpretation_options,
-            key="interpretation_style",
-            index=default_index
+            key="interpretation_style"
         )
 
         current_choice = st.session_state.interpretation_style
@@ -243,20 +194,29 @@ def page_payment():
         st.markdown(f'**- Valor:** R$ 5,90')
 
     try:
-        metadata = {
+        # O sonho fica no registro de pedidos (sem o limite de 500 caracteres
+        # dos metadados do Stripe); a sessão leva só o id do pedido
+        order = {
             "user_name": st.session_state.user_name,
             "dream_title": st.session_state.dream_title,
             "dream_description": st.session_state.dream_description,
             "interpretation_style": st.session_state.interpretation_style,
         }
-        checkout_session = stripe.checkout.Session.create(
-            line_items=[{'price': stripe_price_id, 'quantity': 1}],
-            mode='payment',
-            success_url=f"{app_base_url}/Interprete_Xamanico?session_id={{CHECKOUT_SESSION_ID}}",
-            cancel_url=f"{app_base_url}/Interprete_Xamanico",
-            metadata=metadata
-        )
-        st.link_button("Pagar e Decifrar Sua Mensagem Onírica 🌠", checkout_session.url, width='stretch')
+
+        def create_checkout_session():
+            order_id = create_order("dream", order)
+            return stripe.checkout.Session.create(
+                line_items=[{'price': stripe_price_id, 'quantity': 1}],
+                mode='payment',
+                success_url=f"{app_base_url}/Interprete_Xamanico?session_id={{CHECKOUT_SESSION_ID}}",
+                cancel_url=f"{app_base_url}/Interprete_Xamanico",
+                client_reference_id=order_id,
+                metadata={"order_id": order_id}
+            )
+
+        # Reaproveita a sessão enquanto a seleção não mudar (evita uma por rerun)
+        checkout_session = get_checkout_session("dream", [stripe_price_id, order], create_checkout_session)
+        st.link_button("Pagar e Decifrar Sua Mensagem Onírica 🌠", checkout_session["url"], width='stretch')
     except Exception as e:
         st.error(f"Não foi possível criar o portal de pagamento: {e}")
 
@@ -274,15 +234,6 @@ def page_result():
             reset_app_state('dream')
         st.stop()
 
-    if 'final_interpretation' not in st.session_state:
-        with st.spinner("O Xamã está invocando os espíritos dos sonhos e tecendo sua mensagem... 🌿"):
-            interpretation = get_dream_interpretation(
-                st.session_state.dream_description,
-                st.session_state.interpretation_style,
-                st.session_state.user_name
-            )
-            st.session_state.final_interpretation = interpretation
-
     user_name = st.session_state.get("user_name", "Viajante")
 
     with st.container(border=True):
@@ -291,22 +242,42 @@ def page_result():
 
         st.image("images/dream_oracle_main.png", caption="O Xamã tecendo a revelação do seu sonho", use_container_width=True)
         st.markdown("---")
-        interpretation_text = st.session_state.final_interpretation
-        lines = interpretation_text.split('\n')
-        processed_lines = []
-        for line in lines:
-            # Identifica subtítulos (linhas que começam com ** e terminam com :**)
-            # O regex `\*\*.*\:` garante que estamos pegando a linha inteira.
-            if re.match(r"\*\*(.*?)\*:", line.strip()):
-                processed_lines.append(line.upper())
-            else:
-                processed_lines.append(line)
-
-        processed_interpretation = "\n".join(processed_lines)
-
         st.subheader("A Interpretação do Oráculo:")
-        st.markdown(processed_interpretation, unsafe_allow_html=True) # Usamos o markdown processado
+
+        if 'final_interpretation' not in st.session_state:
+            # Os tokens aparecem conforme chegam; o texto completo fica na sessão para o PDF
+            # A interpretação é preparada em segundo plano (ver build_reading); o job
+            # pode ter começado já na confirmação do pagamento
+            job = start_reading_job(st.session_state.stripe_session_id, "dream", st.session_state.dream_order,
+                                    retry=st.session_state.pop('reading_retry', False))
+            if job is None:
+                st.error("Não foi possível preparar sua leitura.")
+                offer_reading_retry()
+                return
+            st.session_state.final_interpretation = st.write_stream(job.stream())
+            if job.failed:
+                st.session_state.interpretation_failed = True
+            else:
+                record_reading_shown("dream")
+        else:
+            interpretation_text = st.session_state.final_interpretation
+            lines = interpretation_text.split('\n')
+            processed_lines = []
+            for line in lines:
+                # Identifica subtítulos (linhas que começam com ** e terminam com :**)
+                # O regex `\*\*.*\:` garante que estamos pegando a linha inteira.
+                if re.match(r"\*\*(.*?)\*:", line.strip()):
+                    processed_lines.append(line.upper())
+                else:
+                    processed_lines.append(line)
+
+            processed_interpretation = "\n".join(processed_lines)
+            st.markdown(processed_interpretation, unsafe_allow_html=True) # Usamos o markdown processado
         st.markdown("---")
+        if st.session_state.get("interpretation_failed"):
+            # Sem leitura válida não há o que gravar nem baixar
+            offer_reading_retry()
+            return
 
     with st.container(border=True):
         st.subheader("Guarde esta Revelação")
@@ -318,11 +289,26 @@ def page_result():
             "dream_description": st.session_state.get("dream_description"),
         }
 
-        pdf_byte_array = create_dream_pdf(
+        # O PDF só é gerado quando o usuário pede o download (uma vez por leitura)
+        interpretation = st.session_state.final_interpretation
+        fingerprint = reading_fingerprint(session_data_for_pdf, interpretation)
+
+        # Grava a leitura concluída; recarregar a página não gera outra interpretação
+        if (st.session_state.get("stripe_session_id") and not st.session_state.get("reading_saved")
+                and not st.session_state.get("interpretation_failed")):
+            save_reading(st.session_state.stripe_session_id, "dream", {
+                "user_name": st.session_state.user_name,
+                "dream_title": st.session_state.get("dream_title"),
+                "dream_description": st.session_state.dream_description,
+                "interpretation_style": st.session_state.interpretation_style,
+                "final_interpretation": interpretation,
+            }, fingerprint)
+            st.session_state.reading_saved = True
+            discard_reading_job(st.session_state.stripe_session_id)
+        pdf_data = deferred_reading_pdf("dream", fingerprint, lambda: create_dream_pdf(
             session_data_for_pdf,
-            st.session_state.final_interpretation
-        )
-        pdf_data_as_bytes = bytes(pdf_byte_array)
+            interpretation
+        ))
 
         clean_user_name = unicodedata.normalize('NFKD', user_name).encode('ASCII', 'ignore').decode('ASCII')
         clean_user_name = re.sub(r'[^a-zA-Z0-9]', '', clean_user_name)
@@ -330,9 +316,10 @@ def page_result():
 
         st.download_button(
             label="📥 Baixar seu Diário de Sonhos em PDF",
-            data=pdf_data_as_bytes,
+            data=pdf_data,
             file_name=file_name,
             mime="application/pdf",
+            on_click="ignore",
             width='stretch'
         )
 
@@ -347,30 +334,65 @@ def page_result():
 # 6. ROTEADOR PRINCIPAL DA APLICAÇÃO
 # ------------------------------------------------------------------------------
 
+# Chaves do fluxo gravadas fora do processo (ver utils/flow_state)
+DREAM_FLOW_KEYS = [
+    'dream_step', 'dream_checkout', 'dream_order', 'user_name', 'dream_title',
+    'dream_description', 'interpretation_style', 'final_interpretation', 'payment_verified',
+    'stripe_session_id', 'reading_saved', 'interpretation_failed',
+]
+restore_flow_state('dream')
+
 # Inicialização de estado específico para este app
 if "dream_step" not in st.session_state:
     st.session_state.dream_step = "welcome"
 
 apply_shamanic_theme()
 
+# Receptor dos webhooks do Stripe (uma vez por processo, se STRIPE_WEBHOOK_SECRET existir)
+start_webhook_server()
+# Relatório periódico das métricas do processo no log (ver utils/metrics)
+start_metrics_logger()
+
 query_params = st.query_params
 stripe_session_id = query_params.get("session_id")
 
+# O session_id fica na URL: ao recarregar, a leitura é restaurada do registro.
+stored_reading = None
 if stripe_session_id and 'payment_verified' not in st.session_state:
+    stored_reading = load_reading(stripe_session_id, "dream")
+
+if stored_reading is not None:
+    # Leitura já concluída: restaura sem consultar o Stripe nem a OpenAI
+    st.session_state.user_name = stored_reading["user_name"]
+    st.session_state.dream_title = stored_reading["dream_title"]
+    st.session_state.dream_description = stored_reading["dream_description"]
+    st.session_state.interpretation_style = stored_reading["interpretation_style"]
+    st.session_state.final_interpretation = stored_reading["final_interpretation"]
+    st.session_state.stripe_session_id = stripe_session_id
+    st.session_state.payment_verified = True
+    st.session_state.reading_saved = True
+    st.session_state.dream_step = 'result'
+
+elif stripe_session_id and 'payment_verified' not in st.session_state:
     with st.spinner("Validando sua troca energética e alinhando os mundos... ✨"):
         try:
-            session = stripe.checkout.Session.retrieve(stripe_session_id)
-            if session.payment_status == "paid":
-                meta = session.metadata
+            # Registro local primeiro (gravado pelo webhook); Stripe só se não estiver lá
+            payment = verify_checkout_payment(stripe_session_id)
+            if payment["payment_status"] == "paid":
+                meta = order_payload(payment)
                 # Preenche o session_state com os dados do sonho
                 st.session_state.user_name = meta.get("user_name")
                 st.session_state.dream_title = meta.get("dream_title")
                 st.session_state.dream_description = meta.get("dream_description")
                 st.session_state.interpretation_style = meta.get("interpretation_style")
+                st.session_state.dream_order = meta
 
+                record_payment_completed("dream")
+                st.session_state.stripe_session_id = stripe_session_id
                 st.session_state.payment_verified = True
                 st.session_state.dream_step = 'result'
-                st.query_params.clear()
+                # Começa a preparar a leitura enquanto a página recarrega
+                start_reading_job(stripe_session_id, "dream", meta)
                 st.rerun()
             else:
                 st.warning("O pagamento não foi concluído.")
@@ -405,3 +427,6 @@ elif step == 'result':
     page_result()
 else:
     page_welcome()
+
+# Grava o estado do fluxo; outra réplica (ou uma reconexão) pode retomá-lo
+persist_flow_state('dream', DREAM_FLOW_KEYS)
@@ -0,0 +1,259 @@
+# scripts/build_gazetteer.py
+"""
+Gera o gazetteer offline (geodata/gazetteer.bin) lido por utils/gazetteer.py.
+
+Fontes aceitas:
+  --geonames  dump de cidades da GeoNames (citiesNNNNN.txt ou .zip, ex.:
+              cities15000 de https://download.geonames.org/export/dump/), com
+              --admin1 (admin1CodesASCII.txt) e --countries (countryInfo.txt)
+              opcionais para os nomes de estados e países; os nomes
+              alternativos (coluna alternatenames) entram para as cidades de
+              ALTERNATE_NAME_COUNTRIES e as com mais de
+              ALTERNATE_NAME_MIN_POPULATION habitantes ("Lisboa" -> Lisbon)
+  (nenhuma)   localidades principais dos fusos do tzdb (zone.tab do pytz,
+              domínio público): poucas centenas de cidades, suficiente para
+              desenvolvimento; em produção, gere a partir da GeoNames
+
+Os dados da GeoNames são licenciados sob CC BY 4.0 e exigem atribuição: ao
+gerar o arquivo a partir deles, mantenha geodata/ATTRIBUTION.md e o crédito
+exibido no app (GAZETTEER_ATTRIBUTION em utils/gazetteer.py).
+
+Cada cidade entra com várias chaves normalizadas: o nome (e o nome ASCII),
+sozinho e combinado com o estado e o país (código e nome), para que
+"Recife", "Recife, Pernambuco", "Recife, PE", "Recife, BR" e "Recife, Brasil"
+encontrem o mesmo lugar. Nomes alternativos entram só sozinhos ou com o país,
+e perdem para o nome oficial de outra cidade ("São Paulo" é sempre a capital
+paulista, mesmo que seja o nome antigo de outro lugar).
+
+Uso (a partir da raiz do projeto):
+    python scripts/build_gazetteer.py [--geonames cities15000.zip] [--admin1 ...] [--countries ...] [-o geodata/gazetteer.bin]
+"""
+import argparse
+import io
+import os
+import sys
+import unicodedata
+import zipfile
+from pathlib import Path
+
+import pytz
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.gazetteer import GAZETTEER_PATH, HEADER, KEY, MAGIC, PLACE, TIMEZONE, VERSION, normalize_city
+
+# Nomes de país em português que os visitantes costumam digitar; o primeiro vai no rótulo
+COUNTRY_NAME_ALIASES = {"BR": ["Brasil"]}
+
+# Estados brasileiros: nome em português (a GeoNames usa o ASCII) e sigla
+ADMIN1_NAMES = {
+    "BR.01": ("Acre", "AC"), "BR.02": ("Alagoas", "AL"), "BR.03": ("Amapá", "AP"),
+    "BR.04": ("Amazonas", "AM"), "BR.05": ("Bahia", "BA"), "BR.06": ("Ceará", "CE"),
+    "BR.07": ("Distrito Federal", "DF"), "BR.08": ("Espírito Santo", "ES"),
+    "BR.11": ("Mato Grosso do Sul", "MS"), "BR.13": ("Maranhão", "MA"), "BR.14": ("Mato Grosso", "MT"),
+    "BR.15": ("Minas Gerais", "MG"), "BR.16": ("Pará", "PA"), "BR.17": ("Paraíba", "PB"),
+    "BR.18": ("Paraná", "PR"), "BR.20": ("Piauí", "PI"), "BR.21": ("Rio de Janeiro", "RJ"),
+    "BR.22": ("Rio Grande do Norte", "RN"), "BR.23": ("Rio Grande do Sul", "RS"),
+    "BR.24": ("Rondônia", "RO"), "BR.25": ("Roraima", "RR"), "BR.26": ("Santa Catarina", "SC"),
+    "BR.27": ("São Paulo", "SP"), "BR.28": ("Sergipe", "SE"), "BR.29": ("Goiás", "GO"),
+    "BR.30": ("Pernambuco", "PE"), "BR.31": ("Tocantins", "TO"),
+}
+
+ALTERNATE_NAME_COUNTRIES = {"BR", "PT"}
+ALTERNATE_NAME_MIN_POPULATION = 1_000_000
+
+
+def alternate_names(field):
+    """Nomes alternativos úteis: em alfabeto latino, sem códigos (siglas, IATA) nem números."""
+    names = []
+    for name in field.split(","):
+        name = name.strip()
+        if (len(name) >= 3 and not name.isupper() and not any(c.isdigit() for c in name)
+                and all(unicodedata.category(c)[0] in "LMZP" and ord(c) < 0x250 for c in name)):
+            names.append(name)
+    return names
+
+
+def read_lines(path):
+    """Linhas de um .txt ou do primeiro .txt dentro de um .zip."""
+    if str(path).endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            name = next(n for n in archive.namelist() if n.endswith(".txt"))
+            with archive.open(name) as f:
+                yield from io.TextIOWrapper(f, encoding="utf-8")
+    else:
+        with open(path, encoding="utf-8") as f:
+            yield from f
+
+
+def read_tab(lines):
+    for line in lines:
+        if line.strip() and not line.startswith("#"):
+            yield line.rstrip("\n").split("\t")
+
+
+def geonames_places(path, admin1_path=None, countries_path=None):
+    admin1 = {}
+    if admin1_path:
+        admin1 = {row[0]: row[1] or row[2] for row in read_tab(read_lines(admin1_path))}
+    countries = {}
+    if countries_path:
+        countries = {row[0]: row[4] for row in read_tab(read_lines(countries_path))}
+    for row in read_tab(read_lines(path)):
+        name, ascii_name, alternates, lat, lng, country, admin1_code, population, timezone = (
+            row[1], row[2], row[3], row[4], row[5], row[8], row[10], row[14], row[17]
+        )
+        population = int(population or 0)
+        admin1_key = f"{country}.{admin1_code}"
+        admin1_name = admin1.get(admin1_key)
+        admin1_aliases = []
+        if admin1_key in ADMIN1_NAMES:
+            admin1_name, abbreviation = ADMIN1_NAMES[admin1_key]
+            admin1_aliases = [admin1.get(admin1_key), abbreviation]
+        if country in ALTERNATE_NAME_COUNTRIES or population >= ALTERNATE_NAME_MIN_POPULATION:
+            alternates = alternate_names(alternates)
+        else:
+            alternates = []
+        yield {
+            "names": [name, ascii_name],
+            "alternate_names": alternates,
+            "admin1": admin1_name,
+            "admin1_aliases": admin1_aliases,
+            "country": country,
+            "country_name": countries.get(country),
+            "lat": float(lat),
+            "lng": float(lng),
+            "population": population,
+            "timezone": timezone,
+        }
+
+
+def _iso6709(text):
+    """"-2332-04637" -> (-23.533, -46.617); aceita graus-minutos(-segundos)."""
+    split = next(i for i in range(1, len(text)) if text[i] in "+-")
+    coords = []
+    for part, degree_digits in ((text[:split], 2), (text[split:], 3)):
+        sign = -1 if part[0] == "-" else 1
+        digits = part[1:]
+        degrees = int(digits[:degree_digits])
+        minutes = int(digits[degree_digits:degree_digits + 2])
+        seconds = int(digits[degree_digits + 2:] or 0)
+        coords.append(sign * (degrees + minutes / 60 + seconds / 3600))
+    return coords
+
+
+def tzdb_places():
+    zoneinfo = Path(pytz.__file__).parent / "zoneinfo"
+    countries = {row[0]: row[1] for row in read_tab(read_lines(zoneinfo / "iso3166.tab"))}
+    for country, coordinates, timezone, *_ in read_tab(read_lines(zoneinfo / "zone.tab")):
+        lat, lng = _iso6709(coordinates)
+        yield {
+            "names": [timezone.rsplit("/", 1)[-1].replace("_", " ")],
+            "alternate_names": [],
+            "admin1": None,
+            "admin1_aliases": [],
+            "country": country,
+            "country_name": countries.get(country),
+            "lat": lat,
+            "lng": lng,
+            "population": 0,
+            "timezone": timezone,
+        }
+
+
+def place_keys(place):
+    """(chave, é nome alternativo) do lugar; ver a docstring do módulo."""
+    countries = [place["country"], place["country_name"], *COUNTRY_NAME_ALIASES.get(place["country"], [])]
+    countries = list(filter(None, countries))
+    admin1_names = list(filter(None, [place["admin1"], *place["admin1_aliases"]]))
+    keys = {}
+    for name in place["names"]:
+        keys[normalize_city(name)] = False
+        for admin1 in admin1_names:
+            keys[normalize_city(f"{name}, {admin1}")] = False
+        for country in countries:
+            keys[normalize_city(f"{name}, {country}")] = False
+            for admin1 in admin1_names:
+                keys[normalize_city(f"{name}, {admin1}, {country}")] = False
+    for name in place["alternate_names"]:
+        for key in [name, *(f"{name}, {country}" for country in countries)]:
+            keys.setdefault(normalize_city(key), True)
+    keys.pop("", None)
+    return keys.items()
+
+
+def place_label(place):
+    country = COUNTRY_NAME_ALIASES.get(place["country"], [place["country_name"] or place["country"]])[0]
+    parts = [place["names"][0], place["admin1"], country]
+    return ", ".join(part for part in parts if part)
+
+
+def build(places, output):
+    strings = bytearray()
+
+    def add_text(text):
+        data = text.encode("utf-8")
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    timezones = {}
+    place_rows = []
+    keys = []
+    for place in places:
+        index = len(place_rows)
+        tz_index = timezones.setdefault(place["timezone"], len(timezones))
+        label_offset, label_length = add_text(place_label(place))
+        place_rows.append(PLACE.pack(
+            round(place["lat"] * 1e6), round(place["lng"] * 1e6), place["population"],
+            tz_index, label_offset, label_length, place["country"].encode("ascii"),
+        ))
+        keys.extend(
+            (key, alternate, -place["population"], index) for key, alternate in place_keys(place)
+        )
+
+    # Nomes oficiais antes dos alternativos; depois o mais populoso
+    keys.sort()
+    key_rows = []
+    key_offsets = {}
+    for key, _, _, index in keys:
+        if key not in key_offsets:
+            key_offsets[key] = add_text(key)
+        key_rows.append(KEY.pack(*key_offsets[key], index))
+    timezone_rows = [TIMEZONE.pack(*add_text(name)) for name in timezones]
+
+    places_at = HEADER.size
+    keys_at = places_at + len(place_rows) * PLACE.size
+    timezones_at = keys_at + len(key_rows) * KEY.size
+    strings_at = timezones_at + len(timezone_rows) * TIMEZONE.size
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(place_rows), len(key_rows), len(timezone_rows),
+                            places_at, keys_at, timezones_at, strings_at))
+        f.writelines(place_rows)
+        f.writelines(key_rows)
+        f.writelines(timezone_rows)
+        f.write(strings)
+    return len(place_rows), len(key_rows), os.path.getsize(output)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--geonames", help="dump de cidades da GeoNames (.txt ou .zip)")
+    parser.add_argument("--admin1", help="admin1CodesASCII.txt da GeoNames")
+    parser.add_argument("--countries", help="countryInfo.txt da GeoNames")
+    parser.add_argument("-o", "--output", default=GAZETTEER_PATH)
+    args = parser.parse_args()
+
+    if args.geonames:
+        places = geonames_places(args.geonames, args.admin1, args.countries)
+    else:
+        places = tzdb_places()
+    num_places, num_keys, size = build(places, args.output)
+    print(f"{args.output}: {num_places} lugares, {num_keys} chaves, {size / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
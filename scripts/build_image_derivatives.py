@@ -0,0 +1,163 @@
+# scripts/build_image_derivatives.py
+"""
+Gera os derivados WebP/AVIF das imagens em images/ (executado no build).
+
+Para cada PNG/JPG original são produzidas versões nas larguras de
+utils.assets.DERIVATIVE_WIDTHS, com o hash do conteúdo no nome do arquivo,
+em static/img/. O manifesto static/img/manifest.json liga cada original aos
+seus derivados e é lido em tempo de execução por utils.assets.
+
+Uso (a partir da raiz do projeto):
+    python scripts/build_image_derivatives.py [--force]
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import unicodedata
+from pathlib import Path
+
+from PIL import Image, features
+
+# Permite importar utils/ quando executado como script
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.assets import DERIVED_DIR, MANIFEST_PATH, DERIVATIVE_WIDTHS, DERIVATIVE_FORMATS
+
+SOURCE_DIR = "images"
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+ENCODER_OPTIONS = {
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55, "speed": 6},
+}
+
+
+def ascii_slug(stem):
+    """Remove acentos do nome do arquivo para gerar URLs seguras."""
+    return unicodedata.normalize("NFKD", stem).encode("ascii", "ignore").decode("ascii")
+
+
+def available_formats():
+    """Filtra os formatos que o Pillow instalado consegue codificar."""
+    formats = []
+    for fmt in DERIVATIVE_FORMATS:
+        if features.check(fmt):
+            formats.append(fmt)
+        else:
+            print(f"AVISO: Pillow sem suporte a '{fmt}'; derivados neste formato serão ignorados.")
+    return formats
+
+
+def encode(img, fmt):
+    buffer = io.BytesIO()
+    img.save(buffer, format=fmt.upper(), **ENCODER_OPTIONS[fmt])
+    return buffer.getvalue()
+
+
+def build_variants(source_path, source_hash, formats):
+    """Gera todos os derivados de uma imagem e devolve a entrada do manifesto."""
+    rel_dir = os.path.relpath(os.path.dirname(source_path), SOURCE_DIR)
+    out_dir = os.path.normpath(os.path.join(DERIVED_DIR, rel_dir))
+    os.makedirs(out_dir, exist_ok=True)
+    slug = ascii_slug(Path(source_path).stem)
+
+    with Image.open(source_path) as original:
+        original.load()
+        src_width, src_height = original.size
+        if original.mode not in ("RGB", "RGBA"):
+            original = original.convert("RGBA" if "A" in original.getbands() else "RGB")
+
+        variants = []
+        # Nunca amplia: larguras maiores que o original viram o próprio tamanho
+        widths = sorted({min(w, src_width) for w in DERIVATIVE_WIDTHS.values()})
+        for width in widths:
+            height = round(src_height * width / src_width)
+            resized = original if width == src_width else original.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                data = encode(resized, fmt)
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                out_path = os.path.join(out_dir, f"{slug}-{width}.{digest}.{fmt}")
+                with open(out_path, "wb") as f:
+                    f.write(data)
+                variants.append({
+                    "file": out_path.replace(os.sep, "/"),
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "bytes": len(data),
+                    "hash": digest,
+                })
+
+    return {"sha256": source_hash, "width": src_width, "height": src_height, "variants": variants}
+
+
+def iter_sources():
+    for dirpath, _, filenames in os.walk(SOURCE_DIR):
+        for name in sorted(filenames):
+            if name.lower().endswith(SOURCE_EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+
+def main(force=False):
+    os.chdir(ROOT_DIR)
+    formats = available_formats()
+    if not formats:
+        print("ERRO: nenhum formato de derivado disponível.")
+        return 1
+
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            previous = json.load(f).get("images", {})
+    except (FileNotFoundError, ValueError):
+        previous = {}
+
+    images = {}
+    built = skipped = 0
+    for source_path in iter_sources():
+        key = source_path.replace(os.sep, "/")
+        with open(source_path, "rb") as f:
+            source_hash = hashlib.sha256(f.read()).hexdigest()
+
+        # Build incremental: reaproveita derivados de originais inalterados
+        old = previous.get(key)
+        if (
+            not force and old and old["sha256"] == source_hash
+            and {v["format"] for v in old["variants"]} == set(formats)
+            and {v["width"] for v in old["variants"]} == {min(w, old["width"]) for w in DERIVATIVE_WIDTHS.values()}
+            and all(os.path.exists(v["file"]) for v in old["variants"])
+        ):
+            images[key] = old
+            skipped += 1
+            continue
+
+        images[key] = build_variants(source_path, source_hash, formats)
+        built += 1
+
+    # Remove derivados órfãos de builds anteriores
+    live_files = {os.path.normpath(v["file"]) for entry in images.values() for v in entry["variants"]}
+    for dirpath, _, filenames in os.walk(DERIVED_DIR):
+        for name in filenames:
+            path = os.path.normpath(os.path.join(dirpath, name))
+            if name != os.path.basename(MANIFEST_PATH) and path not in live_files:
+                os.remove(path)
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "images": images}, f, ensure_ascii=False, indent=1)
+
+    original_bytes = sum(os.path.getsize(p) for p in images)
+    derived_bytes = sum(v["bytes"] for entry in images.values() for v in entry["variants"])
+    print(
+        f"{len(images)} imagens ({built} geradas, {skipped} reaproveitadas). "
+        f"Originais: {original_bytes / 1e6:.1f} MB; derivados: {derived_bytes / 1e6:.1f} MB."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="regera todos os derivados")
+    sys.exit(main(force=parser.parse_args().force))
@@ -0,0 +1,190 @@
+# scripts/simulate_draw_fairness.py
+"""
+Simulação de Monte Carlo da tiragem do Tarô: imparcialidade de cartas, orientações e posições.
+
+Reproduz em lote, com NumPy, a semântica de draw_cards (utils/readings/tarot.py):
+`n` cartas distintas sorteadas sem reposição entre as 78 do DECK, em ordem
+aleatória (cada posição da tiragem recebe uma delas), e cada carta invertida
+com probabilidade 1/2, de forma independente. Cada lote faz um Fisher-Yates
+parcial vetorizado: só as `n` primeiras trocas, em todas as tiragens do lote de
+uma vez (mesma distribuição de random.sample).
+
+Para cada tiragem de utils/tarot_spreads, relata o teste qui-quadrado de
+aderência à distribuição uniforme:
+    cartas        frequência de cada carta em todas as posições (77 g.l.)
+    orientação    invertidas vs. retas no total (1 g.l.)
+    orient./carta invertidas vs. retas de cada carta (78 g.l.)
+    posições      frequência das cartas em cada posição (77 g.l. por posição;
+                  o menor p entre as posições e o teste conjunto)
+
+Requer numpy (não é dependência do app). Uso (a partir da raiz do projeto):
+    python scripts/simulate_draw_fairness.py [-n 1000000] [--seed 42] [--json relatorio.json]
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.tarot_deck import DECK
+from utils.tarot_spreads import SPREADS
+
+DECK_SIZE = len(DECK)
+# Tiragens por lote (limita a memória: lote x 78 cartas int16)
+BATCH_SIZE = 200_000
+
+
+def draw_batch(rng, num_spreads, num_cards, deck_size=DECK_SIZE):
+    """
+    `num_spreads` tiragens de `num_cards` cartas: (índices, invertidas), ambos
+    com forma (num_spreads, num_cards), na ordem das posições.
+    """
+    decks = np.tile(np.arange(deck_size, dtype=np.int16), (num_spreads, 1))
+    rows = np.arange(num_spreads)
+    for position in range(num_cards):
+        # Troca a carta da posição com uma das ainda não sorteadas
+        swap = rng.integers(position, deck_size, num_spreads)
+        current = decks[:, position].copy()
+        decks[:, position] = decks[rows, swap]
+        decks[rows, swap] = current
+    reversed_ = rng.random((num_spreads, num_cards), dtype=np.float32) < 0.5
+    return decks[:, :num_cards], reversed_
+
+
+def simulate(rng, num_spreads, num_cards):
+    """Contagens de `num_spreads` tiragens, acumuladas lote a lote."""
+    position_counts = np.zeros((num_cards, DECK_SIZE), dtype=np.int64)
+    reversed_counts = np.zeros(DECK_SIZE, dtype=np.int64)
+    positions = np.arange(num_cards) * DECK_SIZE
+    remaining = num_spreads
+    while remaining:
+        size = min(BATCH_SIZE, remaining)
+        cards, reversed_ = draw_batch(rng, size, num_cards)
+        position_counts += np.bincount((cards.astype(np.intp) + positions).ravel(), minlength=num_cards * DECK_SIZE).reshape(num_cards, DECK_SIZE)
+        reversed_counts += np.bincount(cards[reversed_], minlength=DECK_SIZE)
+        remaining -= size
+    return position_counts, reversed_counts
+
+
+def chi2_sf(statistic, dof):
+    """P(X >= statistic) para X ~ qui-quadrado com `dof` g.l. (função gama incompleta regularizada)."""
+    a, x = dof / 2.0, statistic / 2.0
+    if x <= 0:
+        return 1.0
+    log_prefactor = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        # Série para a parte inferior: P = 1 - Q
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+    # Fração contínua (Lentz) para a parte superior Q
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    i = 0
+    while True:
+        i += 1
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return min(1.0, math.exp(log_prefactor) * h)
+
+
+def chi2_uniform(observed):
+    """Qui-quadrado de aderência à uniforme nas células de `observed`: (estatística, g.l., p)."""
+    observed = np.asarray(observed, dtype=np.float64)
+    expected = observed.sum() / observed.size
+    statistic = float(((observed - expected) ** 2).sum() / expected)
+    dof = observed.size - 1
+    return statistic, dof, chi2_sf(statistic, dof)
+
+
+def spread_report(position_counts, reversed_counts):
+    card_counts = position_counts.sum(axis=0)
+    total = int(card_counts.sum())
+    total_reversed = int(reversed_counts.sum())
+
+    per_card_orientation = 0.0
+    for drawn, rev in zip(card_counts, reversed_counts):
+        per_card_orientation += chi2_uniform([rev, drawn - rev])[0]
+
+    positions = [chi2_uniform(counts) for counts in position_counts]
+    joint_positions = sum(stat for stat, _, _ in positions)
+    joint_dof = sum(dof for _, dof, _ in positions)
+
+    return {
+        "cartas": chi2_uniform(card_counts),
+        "orientação": chi2_uniform([total_reversed, total - total_reversed]),
+        "orient./carta": (per_card_orientation, DECK_SIZE, chi2_sf(per_card_orientation, DECK_SIZE)),
+        "posições (menor p)": min(positions, key=lambda result: result[2]),
+        "posições (conjunto)": (joint_positions, joint_dof, chi2_sf(joint_positions, joint_dof)),
+        "proporção invertidas": total_reversed / total,
+    }
+
+
+def python_draws_per_second(num_cards, seconds=0.5):
+    """Ritmo de draw_cards no Python puro (random.sample + random.choice), para comparação."""
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            [(index, random.choice([True, False])) for index in random.sample(range(DECK_SIZE), num_cards)]
+        count += 1000
+    return count / (time.perf_counter() - start)
+
+
+def main(num_spreads, seed, json_path=None):
+    rng = np.random.default_rng(seed)
+    reports = {}
+    print(f"{num_spreads} tiragens por tipo (semente {seed}); p < 0.01 sugere viés")
+    for name, spread in SPREADS.items():
+        num_cards = len(spread.positions)
+        start = time.perf_counter()
+        position_counts, reversed_counts = simulate(rng, num_spreads, num_cards)
+        elapsed = time.perf_counter() - start
+        report = spread_report(position_counts, reversed_counts)
+        report["tiragens/s (numpy)"] = num_spreads / elapsed
+        report["tiragens/s (python)"] = python_draws_per_second(num_cards)
+        reports[name] = report
+
+        print(f"\n{name}")
+        print(f"  {report['tiragens/s (numpy)']:14,.0f} tiragens/s (numpy)   {report['tiragens/s (python)']:12,.0f} tiragens/s (draw_cards)")
+        print(f"  proporção de invertidas: {report['proporção invertidas']:.5f}")
+        for test in ("cartas", "orientação", "orient./carta", "posições (menor p)", "posições (conjunto)"):
+            statistic, dof, p_value = report[test]
+            print(f"  {test:20s} qui2 = {statistic:12.2f}   g.l. = {dof:4d}   p = {p_value:.4f}")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"tiragens": num_spreads, "semente": seed, "relatorio": reports}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--spreads", type=int, default=1_000_000, help="tiragens simuladas por tipo")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", dest="json_path", help="grava o relatório neste arquivo")
+    args = parser.parse_args()
+    main(args.spreads, args.seed, args.json_path)
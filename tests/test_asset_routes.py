@@ -0,0 +1,64 @@
+# tests/test_asset_routes.py
+"""
+A rota /img/ (utils/asset_routes) serve só os derivados do manifesto, com
+cache imutável, e entrega o AVIF a quem o aceita.
+
+Uso (a partir da raiz do projeto):
+    python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from utils import assets
+from utils.asset_routes import ASSET_CACHE_CONTROL, asset_routes, served_files
+
+IMAGE = "images/a_estrela.png"
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    # O manifesto e os derivados ficam em static/img/, relativos à raiz do projeto
+    monkeypatch.chdir(ROOT_DIR)
+    monkeypatch.setattr(assets, "_asset_route_active", False)
+    if not served_files():
+        pytest.skip("derivados não gerados (python scripts/build_image_derivatives.py)")
+
+
+@pytest.fixture
+def client():
+    return TestClient(Starlette(routes=asset_routes()))
+
+
+def test_asset_src_uses_route(client):
+    src = assets.asset_src(IMAGE, "screen")
+    assert src.startswith("img/") and src.endswith(".webp")
+
+
+def test_webp_with_immutable_cache(client):
+    response = client.get("/" + assets.asset_src(IMAGE, "screen"), headers={"Accept": "image/webp,*/*"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["cache-control"] == ASSET_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept"
+
+
+def test_avif_when_accepted(client):
+    url = "/" + assets.asset_src(IMAGE, "screen")
+    webp = client.get(url, headers={"Accept": "image/webp,*/*"})
+    avif = client.get(url, headers={"Accept": "image/avif,image/webp,*/*"})
+    assert avif.headers["content-type"] == "image/avif"
+    assert avif.headers["cache-control"] == ASSET_CACHE_CONTROL
+    assert len(avif.content) < len(webp.content)
+
+
+def test_unknown_files_are_not_served(client):
+    assert client.get("/img/manifest.json").status_code == 404
+    assert client.get("/img/nao_existe-720.000000000000.webp").status_code == 404
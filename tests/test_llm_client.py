@@ -0,0 +1,47 @@
+# tests/test_llm_client.py
+"""
+O cliente OpenAI de cada oráculo precisa sair com o pool de conexões, o
+keep-alive e os timeouts de utils/llm (ver HTTP_LIMITS e HTTP_TIMEOUT), e não
+com os padrões do openai.
+
+Uso (a partir da raiz do projeto):
+    python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils import llm
+
+
+@pytest.fixture(autouse=True)
+def fresh_clients(monkeypatch):
+    monkeypatch.setattr(llm, "_clients", {})
+    monkeypatch.setenv("TAROT_OPENAI_API_KEY", "sk-test")
+
+
+def test_client_uses_pool_limits():
+    client = llm.get_client("tarot")
+    # O pool do httpcore2 por trás do transporte do httpx2 (versões fixadas)
+    pool = client._client._transport._pool
+    assert pool._max_connections == llm.HTTP_LIMITS.max_connections == 20
+    assert pool._max_keepalive_connections == llm.HTTP_LIMITS.max_keepalive_connections == 10
+    assert pool._keepalive_expiry == llm.HTTP_LIMITS.keepalive_expiry == 120
+
+
+def test_client_uses_timeouts_and_retries():
+    client = llm.get_client("tarot")
+    assert client.timeout == llm.HTTP_TIMEOUT
+    assert client._client.timeout == llm.HTTP_TIMEOUT
+    assert client.max_retries == llm.MAX_RETRIES
+
+
+def test_client_is_reused_per_oracle(monkeypatch):
+    monkeypatch.setenv("DREAM_OPENAI_API_KEY", "sk-test-dream")
+    client = llm.get_client("tarot")
+    assert llm.get_client("tarot") is client
+    assert llm.get_client("dream") is not client
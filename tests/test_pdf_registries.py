@@ -0,0 +1,93 @@
+# tests/test_pdf_registries.py
+"""
+O registro de fontes (utils/pdf_fonts) e o cache de imagens de impressão
+(utils/print_images) mexem em estruturas internas do fpdf2; o PDF gerado por
+eles precisa ser idêntico, byte a byte, ao gerado com add_font() e image()
+simples. Se uma atualização do fpdf2 mudar essas estruturas, estes testes
+falham antes dos PDFs dos clientes.
+
+Uso (a partir da raiz do projeto):
+    python -m pytest tests
+"""
+import io
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from fpdf import FPDF
+
+from utils.pdf_fonts import DREAM_FONTS, MYSTICAL_FONTS, register_fonts
+from utils.print_images import get_print_image, place_print_image
+
+CREATION_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Textos com glifos diferentes: o subconjunto de cada fonte não pode vazar entre PDFs
+SAMPLE_TEXTS = [
+    "Você caminhava por uma floresta antiga; o falcão dourado pousou ao seu lado.",
+    "ÀÉÎÕÜ ç ñ — QUANDO A LUA ENCONTRA 7 ESTRELAS, 1990!",
+]
+CARD_IMAGES = ["images/a_estrela.png", "images/a_forca.png"]
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    # Os caminhos das fontes e imagens são relativos à raiz do projeto
+    monkeypatch.chdir(ROOT_DIR)
+
+
+def new_pdf():
+    pdf = FPDF()
+    pdf.set_creation_date(CREATION_DATE)
+    pdf.add_page()
+    return pdf
+
+
+def write_sample(pdf, fonts, text):
+    for family, style, _ in fonts:
+        pdf.set_font(family, style, 12)
+        pdf.multi_cell(0, 8, f"{family} {style}: {text}", new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+
+@pytest.mark.parametrize("fonts", [MYSTICAL_FONTS, DREAM_FONTS], ids=["mystical", "dream"])
+def test_register_fonts_matches_add_font(fonts):
+    expected = []
+    for text in SAMPLE_TEXTS:
+        pdf = new_pdf()
+        for family, style, path in fonts:
+            pdf.add_font(family, style, path)
+        expected.append(write_sample(pdf, fonts, text))
+
+    # Duas rodadas: a segunda usa as fontes já preparadas no processo
+    for _ in range(2):
+        for text, output in zip(SAMPLE_TEXTS, expected):
+            pdf = new_pdf()
+            register_fonts(pdf, fonts)
+            assert write_sample(pdf, fonts, text) == output
+
+
+def place_plain(pdf, path, size, y):
+    entry = get_print_image(path, width_mm=size.get("w"), height_mm=size.get("h"))
+    pdf.image(io.BytesIO(entry["data"]), x=10, y=y, **size)
+
+
+@pytest.mark.parametrize("size", [{"w": 40}, {"h": 20}], ids=["width", "height"])
+@pytest.mark.parametrize("images", [CARD_IMAGES, CARD_IMAGES[::-1]], ids=["order1", "order2"])
+def test_place_print_image_matches_image(images, size):
+    # Uma imagem repetida e outra antes dela: o índice e o uso de cada uma são por documento
+    layout = [(images[0], 10), (images[1], 80), (images[1], 150)]
+    pdf = new_pdf()
+    for path, y in layout:
+        place_plain(pdf, path, size, y)
+    expected = bytes(pdf.output())
+
+    # Duas rodadas: a segunda semeia o cache de imagens do documento
+    for _ in range(2):
+        pdf = new_pdf()
+        for path, y in layout:
+            place_print_image(pdf, path, x=10, y=y, **size)
+        assert bytes(pdf.output()) == expected
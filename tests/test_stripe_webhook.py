@@ -0,0 +1,70 @@
+# tests/test_stripe_webhook.py
+"""
+O receptor do webhook (utils/stripe_webhook) precisa aceitar um evento
+assinado como o Stripe assina e gravar o pagamento no registro, e recusar
+um evento com assinatura errada. As assinaturas vêm de sign_payload().
+
+Uso (a partir da raiz do projeto):
+    python -m pytest tests
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils import metrics, state_backend
+from utils.payment_ledger import get_recorded_payment
+from utils.stripe_webhook import handle_event, sign_payload
+
+SECRET = "whsec_test"
+SESSION_ID = "cs_test_webhook"
+
+
+@pytest.fixture(autouse=True)
+def memory_backend(monkeypatch):
+    # Registro de pagamentos isolado, sem tocar no data/state.sqlite3 do projeto
+    monkeypatch.setattr(state_backend, "_backend", state_backend.MemoryBackend())
+
+
+def checkout_completed_event():
+    return json.dumps({
+        "id": "evt_test_webhook",
+        "object": "event",
+        "type": "checkout.session.completed",
+        "data": {"object": {
+            "id": SESSION_ID,
+            "object": "checkout.session",
+            "payment_status": "paid",
+            "client_reference_id": None,
+            "metadata": {"oracle": "tarot"},
+        }},
+    })
+
+
+def test_signed_event_is_recorded():
+    payload = checkout_completed_event()
+    recorded = metrics.get("webhook.payments_recorded")
+
+    status, _ = handle_event(payload, sign_payload(payload, SECRET), SECRET)
+
+    assert status == 200
+    payment = get_recorded_payment(SESSION_ID)
+    assert payment["payment_status"] == "paid"
+    assert payment["metadata"] == {"oracle": "tarot"}
+    assert payment["source"] == "webhook"
+    assert metrics.get("webhook.payments_recorded") == recorded + 1
+
+
+def test_bad_signature_is_rejected():
+    payload = checkout_completed_event()
+    invalid = metrics.get("webhook.invalid")
+
+    status, message = handle_event(payload, sign_payload(payload, "whsec_outro"), SECRET)
+
+    assert (status, message) == (400, "assinatura inválida")
+    assert get_recorded_payment(SESSION_ID) is None
+    assert metrics.get("webhook.invalid") == invalid + 1
@@ -0,0 +1,59 @@
+# utils/asset_routes.py
+"""Rota própria dos derivados de imagem, montada no app ASGI (asgi.py).
+
+O servidor estático do Streamlit (app/static/) não envia Cache-Control. Aqui
+cada derivado listado no manifesto (ver utils/assets) é servido em
+/img/<arquivo> com cache imutável de um ano: o nome traz o hash do conteúdo,
+então uma imagem nova sempre tem outra URL. As URLs apontam para o WebP; se o
+navegador aceita AVIF (cabeçalho Accept), recebe o AVIF da mesma imagem e
+largura, em geral ~40% menor.
+"""
+from functools import lru_cache
+
+from starlette.responses import FileResponse, PlainTextResponse
+from starlette.routing import Route
+
+from .assets import ASSET_ROUTE_PREFIX, activate_asset_route, image_mime_type, load_manifest
+
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@lru_cache(maxsize=1)
+def served_files():
+    """Nome de arquivo -> {formato: caminho} dos derivados da mesma imagem e largura."""
+    files = {}
+    for entry in load_manifest().values():
+        by_width = {}
+        for variant in entry["variants"]:
+            by_width.setdefault(variant["width"], {})[variant["format"]] = variant["file"]
+        for formats in by_width.values():
+            for path in formats.values():
+                files[path.rsplit("/", 1)[-1]] = formats
+    return files
+
+
+def choose_file(name, accept):
+    """Caminho a servir para /img/`name`, conforme o Accept do navegador; None se não existir."""
+    formats = served_files().get(name)
+    if formats is None:
+        return None
+    if "avif" in formats and "image/avif" in accept:
+        return formats["avif"]
+    return next(path for path in formats.values() if path.endswith(name))
+
+
+async def serve_image(request):
+    path = choose_file(request.path_params["name"], request.headers.get("accept", ""))
+    if path is None:
+        return PlainTextResponse("Not Found", status_code=404)
+    return FileResponse(
+        path,
+        media_type=image_mime_type(path),
+        headers={"Cache-Control": ASSET_CACHE_CONTROL, "Vary": "Accept"},
+    )
+
+
+def asset_routes():
+    """Rotas para st.App(routes=...); liga as URLs /img/ em utils.assets.asset_src."""
+    activate_asset_route()
+    return [Route(f"/{ASSET_ROUTE_PREFIX}{{name}}", serve_image, methods=["GET", "HEAD"])]
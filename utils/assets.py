@@ -0,0 +1,208 @@
+# utils/assets.py
+"""Resolução dos derivados de imagem (WebP/AVIF) gerados no build.
+
+Os originais em images/ são PNGs de ~2 MB. O script
+scripts/build_image_derivatives.py gera versões menores, com hash de conteúdo
+no nome, em static/img/ e registra tudo em um manifesto JSON. As páginas pedem
+aqui a menor versão que atende à largura desejada.
+
+As imagens são referenciadas por URL, e o data URI em Base64 fica só para
+arquivos minúsculos. Com o app iniciado por asgi.py, as URLs são as da rota
+própria /img/ (utils/asset_routes), que responde com cache imutável de um ano
+(o nome de cada arquivo muda junto com o conteúdo) e entrega o AVIF a quem o
+aceita. Sem ela (streamlit run direto no script principal), as URLs caem no
+servidor estático do Streamlit (server.enableStaticServing em
+.streamlit/config.toml), que não envia Cache-Control e faz o navegador
+revalidar as imagens.
+"""
+import json
+import os
+from functools import lru_cache
+
+from .helpers import get_img_as_base64
+
+DERIVED_DIR = os.path.join("static", "img")
+MANIFEST_PATH = os.path.join(DERIVED_DIR, "manifest.json")
+
+# Larguras (em px) geradas pelo build para cada imagem original
+DERIVATIVE_WIDTHS = {
+    "thumb": 160,   # ícones dos portais e dos astros
+    "print": 480,   # ~300 dpi em 40 mm (PDF)
+    "screen": 720,  # cartas reveladas na tela (2x para telas retina)
+    "full": 1920,   # fundos de tela (limitado ao tamanho do original)
+}
+
+# Formatos gerados, do mais compacto para o mais compatível
+DERIVATIVE_FORMATS = ("avif", "webp")
+
+# "static": URLs servidas pelo Streamlit; "inline": tudo como data URI (legado)
+ASSET_SERVING = os.environ.get("ASSET_SERVING", "static")
+
+# O Streamlit publica a pasta static/ da raiz do app em app/static/
+STATIC_URL_PREFIX = "app/static/"
+# Rota própria dos derivados (utils/asset_routes), ativa quando o app sobe por asgi.py
+ASSET_ROUTE_PREFIX = "img/"
+
+# Formato das URLs: o WebP, que todo navegador atual exibe; a rota própria
+# troca pelo AVIF da mesma imagem quando o navegador o aceita
+STATIC_FORMATS = ("webp",)
+
+# Abaixo deste tamanho, uma requisição extra custa mais que embutir a imagem
+INLINE_MAX_BYTES = 4 * 1024
+
+# Os ícones dos portais aparecem com 60px; 120px cobre telas de alta densidade
+PORTAL_ICON_WIDTH = 120
+
+# Ativos mais acessados, pré-carregados com ASSET_CACHE_PRELOAD=1:
+# os ícones dos portais e os 22 Arcanos Maiores
+MAJOR_ARCANA_FILES = [
+    "o_louco.png", "o_mago.png", "a_sacerdotisa.png", "a_imperatriz.png",
+    "o_imperador.png", "o_hierofante.png", "os_amantes.png", "a_carruagem.png",
+    "a_forca.png", "o_eremita.png", "a_roda_da_fortuna.png", "a_justica.png",
+    "o_enforcado.png", "a_morte.png", "a_temperanca.png", "o_diabo.png",
+    "a_torre.png", "a_estrela.png", "a_lua.png", "o_sol.png",
+    "o_julgamento.png", "o_mundo.png",
+]
+HOT_ASSETS = [
+    ("images/icon_tarot.png", PORTAL_ICON_WIDTH),
+    ("images/icon_stars.png", PORTAL_ICON_WIDTH),
+    ("images/icon_dream.png", PORTAL_ICON_WIDTH),
+] + [(os.path.join("images", f), "screen") for f in MAJOR_ARCANA_FILES]
+
+MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+}
+
+
+def _manifest_key(path):
+    """Normaliza o caminho do original para a chave usada no manifesto."""
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+@lru_cache(maxsize=1)
+def load_manifest():
+    """Lê o manifesto de derivados uma única vez por processo."""
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            return json.load(f).get("images", {})
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def image_mime_type(path):
+    """Devolve o MIME type da imagem a partir da extensão."""
+    return MIME_TYPES.get(os.path.splitext(path)[1].lower(), "application/octet-stream")
+
+
+def resolve_image_variant(path, width, formats=DERIVATIVE_FORMATS):
+    """
+    Escolhe o menor derivado de `path` com largura >= `width`.
+
+    `width` pode ser um número de pixels ou o nome de uma faixa de
+    DERIVATIVE_WIDTHS ("thumb", "print", "screen"). Entre os derivados da
+    largura escolhida, vence o de menos bytes. Devolve o dicionário do
+    manifesto, ou None se nenhum derivado atender.
+    """
+    if isinstance(width, str):
+        width = DERIVATIVE_WIDTHS[width]
+
+    entry = load_manifest().get(_manifest_key(path))
+    if not entry:
+        return None
+
+    candidates = [
+        v for v in entry["variants"]
+        if v["format"] in formats and v["width"] >= width
+    ]
+    if not candidates:
+        # Nenhum derivado é largo o bastante; se o original for menor que o
+        # pedido, o maior derivado já é a imagem inteira.
+        if entry["width"] <= width:
+            candidates = [v for v in entry["variants"] if v["format"] in formats and v["width"] == entry["width"]]
+        if not candidates:
+            return None
+
+    best_width = min(v["width"] for v in candidates)
+    return min(
+        (v for v in candidates if v["width"] == best_width),
+        key=lambda v: v["bytes"],
+    )
+
+
+def resolve_image(path, width, formats=DERIVATIVE_FORMATS):
+    """
+    Devolve o caminho do menor derivado de `path` que atende à largura.
+
+    Se o build de derivados não foi executado (ou a imagem não tem derivados),
+    devolve o próprio `path`, mantendo o comportamento original.
+    """
+    variant = resolve_image_variant(path, width, formats)
+    if variant and os.path.exists(variant["file"]):
+        return variant["file"]
+    return path
+
+
+_asset_route_active = False
+
+
+def activate_asset_route():
+    """Passa a gerar URLs da rota própria /img/ (chamado por utils.asset_routes)."""
+    global _asset_route_active
+    _asset_route_active = True
+
+
+def static_url(variant):
+    """
+    URL estática de um derivado: a da rota própria, se ativa, ou a do
+    servidor estático do Streamlit.
+
+    O nome do arquivo já contém o hash do conteúdo: uma imagem nova tem outra
+    URL, e a versão antiga em cache nunca é servida no lugar dela.
+    """
+    if _asset_route_active:
+        return f"{ASSET_ROUTE_PREFIX}{os.path.basename(variant['file'])}"
+    relative = os.path.relpath(variant["file"], "static").replace(os.sep, "/")
+    return f"{STATIC_URL_PREFIX}{relative}"
+
+
+def asset_src(path, width):
+    """
+    Devolve o `src` de uma imagem para uso em <img> ou em url() no CSS.
+
+    No modo "static", usa a URL do menor derivado WebP (ver static_url).
+    Imagens minúsculas, a ausência de derivados ou o modo "inline" caem no
+    data URI em Base64.
+    Devolve None se a imagem não existir.
+    """
+    if ASSET_SERVING == "static":
+        variant = resolve_image_variant(path, width, STATIC_FORMATS)
+        if variant and variant["bytes"] > INLINE_MAX_BYTES and os.path.exists(variant["file"]):
+            return static_url(variant)
+
+    local_path = resolve_image(path, width)
+    img_b64 = get_img_as_base64(local_path)
+    if not img_b64:
+        return None
+    return f"data:{image_mime_type(local_path)};base64,{img_b64}"
+
+
+_preloaded = False
+
+def preload_hot_assets():
+    """
+    Aquece o cache de imagens com os ativos de HOT_ASSETS (uma vez por processo).
+
+    Só tem efeito com ASSET_CACHE_PRELOAD=1. Carrega exatamente o que
+    asset_src() usaria, então no modo "static" apenas os ativos servidos como
+    data URI ocupam memória.
+    """
+    global _preloaded
+    if _preloaded or os.environ.get("ASSET_CACHE_PRELOAD") != "1":
+        return
+    _preloaded = True
+    for path, width in HOT_ASSETS:
+        asset_src(path, width)
@@ -0,0 +1,85 @@
+# utils/cache.py
+"""Cache LRU em memória, limitado por bytes, compartilhado por todo o processo."""
+import threading
+from collections import OrderedDict
+
+
+class ByteLRUCache:
+    """
+    Cache LRU thread-safe com orçamento de memória em bytes.
+
+    Diferente do st.cache_data sem limites, as entradas menos usadas são
+    descartadas assim que a soma dos tamanhos passa de `max_bytes`. Mantém
+    contadores de acertos, faltas e descartes para monitoramento.
+    """
+
+    def __init__(self, max_bytes, name="cache", sizeof=len):
+        self.max_bytes = max_bytes
+        self.name = name
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._data:
+                self._bytes -= self._data.pop(key)[1]
+            # Um item maior que o orçamento inteiro nunca é guardado
+            if size > self.max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        """Devolve o valor em cache ou chama `loader()` e guarda o resultado (exceto None)."""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
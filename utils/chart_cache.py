@@ -0,0 +1,72 @@
+# utils/chart_cache.py
+"""Cache dos mapas astrais em dois níveis: memória do processo e backend de estado.
+
+O mapa só depende do instante do nascimento em UTC e das coordenadas; o antigo
+st.cache_data usava também o nome da pessoa (e o texto da cidade), então
+nascimentos idênticos nunca compartilhavam o resultado, que ainda sumia
+depois de uma hora. Aqui a chave é o instante UTC (ao minuto, a resolução do
+cálculo) e as coordenadas arredondadas a CHART_COORD_DECIMALS casas; o mapa
+é calculado com essas mesmas coordenadas arredondadas, então a chave descreve
+exatamente o resultado guardado.
+
+    1º nível  ByteLRUCache do processo (CHART_CACHE)
+    2º nível  backend de estado (utils/state_backend), que sobrevive a
+              reinícios e é compartilhado entre réplicas com Redis
+
+Guarda-se o mapa completo (longitudes, casas, cúspides, ângulos), não só os
+campos exibidos pela página. CHART_CACHE_VERSION entra na chave: mudar o
+cálculo invalida os mapas antigos.
+"""
+import pickle
+import time
+
+from . import metrics
+from .cache import ByteLRUCache
+from .state_backend import get_backend
+
+NAMESPACE = "charts"
+CHART_CACHE_VERSION = 1
+# 4 casas ≈ 11 m, muito abaixo da precisão de qualquer cidade geocodificada
+CHART_COORD_DECIMALS = 4
+CHART_TTL_SECONDS = 365 * 24 * 3600
+
+CHART_CACHE = ByteLRUCache(
+    max_bytes=8 * 1024 * 1024, name="charts", sizeof=lambda chart: len(pickle.dumps(chart))
+)
+
+
+def chart_key(utc_dt, lat, lng):
+    """(chave, lat, lng) do mapa: instante UTC ao minuto e coordenadas arredondadas."""
+    lat = round(lat, CHART_COORD_DECIMALS)
+    lng = round(lng, CHART_COORD_DECIMALS)
+    key = f"v{CHART_CACHE_VERSION}:{utc_dt:%Y-%m-%dT%H:%M}Z:{lat:.{CHART_COORD_DECIMALS}f}:{lng:.{CHART_COORD_DECIMALS}f}"
+    return key, lat, lng
+
+
+def get_chart(utc_dt, lat, lng, compute):
+    """
+    Mapa do instante `utc_dt` (datetime em UTC) nas coordenadas. Na falta dele
+    nos dois níveis, chama compute(utc_dt, lat, lng) com as coordenadas
+    arredondadas e guarda o resultado (exceto None).
+    """
+    key, lat, lng = chart_key(utc_dt, lat, lng)
+    chart = CHART_CACHE.get(key)
+    if chart is not None:
+        metrics.incr("chart_cache.hit.memory")
+        return chart
+
+    backend = get_backend()
+    chart = backend.get(NAMESPACE, key)
+    if chart is not None:
+        metrics.incr("chart_cache.hit.backend")
+        CHART_CACHE.put(key, chart)
+        return chart
+
+    metrics.incr("chart_cache.miss")
+    start = time.perf_counter()
+    chart = compute(utc_dt, lat, lng)
+    metrics.observe("chart_cache.compute", time.perf_counter() - start)
+    if chart is not None:
+        backend.set(NAMESPACE, key, chart, ttl=CHART_TTL_SECONDS)
+        CHART_CACHE.put(key, chart)
+    return chart
@@ -0,0 +1,74 @@
+# utils/checkout.py
+"""Sessões de checkout do Stripe reaproveitadas entre as execuções do script.
+
+page_payment roda a cada interação (e a cada reconexão); criar uma sessão de
+checkout em toda execução custa uma ida ao Stripe e deixa sessões órfãs para
+trás. Aqui a sessão fica guardada no st.session_state do usuário junto com a
+impressão digital da seleção (oráculo + escolhas da consulta) e é reutilizada
+até perto de expirar. Se a seleção mudar, a impressão digital muda e uma nova
+sessão é criada. Uma sessão já paga (no registro de pagamentos, gravada pelo
+webhook ou pela volta do checkout) nunca é reaproveitada: o Stripe a mostraria
+como concluída, e uma nova consulta igual precisa de um novo pagamento.
+
+Os contadores checkout.created.*, checkout.reused.*, checkout.paid_not_reused.* e
+checkout.paid.* em
+utils.metrics comparam sessões criadas com pagamentos concluídos.
+"""
+import time
+
+import streamlit as st
+
+from . import metrics
+from .payment_ledger import get_recorded_payment
+from .pdf_cache import reading_fingerprint
+
+# Não reaproveita uma sessão que expira em menos de 10 minutos: o usuário
+# precisa de tempo para pagar
+EXPIRY_MARGIN_SECONDS = 10 * 60
+# O Stripe expira sessões de checkout em 24 h por padrão
+DEFAULT_SESSION_LIFETIME_SECONDS = 24 * 3600
+
+
+def get_checkout_session(oracle, selection, create_session):
+    """
+    Devolve {id, url, expires_at} da sessão de checkout para `selection`.
+
+    `create_session()` só é chamado quando não há sessão guardada para esta
+    seleção (ou quando ela está para expirar ou já foi paga). A chave no
+    st.session_state começa com `oracle`, então reset_app_state(oracle) também
+    a descarta.
+    """
+    key = f"{oracle}_checkout"
+    fingerprint = reading_fingerprint(oracle, selection)
+    cached = st.session_state.get(key)
+    if (cached is not None and cached["fingerprint"] == fingerprint
+            and cached["expires_at"] - time.time() > EXPIRY_MARGIN_SECONDS):
+        if not _is_paid(cached["id"]):
+            metrics.incr(f"checkout.reused.{oracle}")
+            return cached
+        metrics.incr(f"checkout.paid_not_reused.{oracle}")
+
+    session = create_session()
+    metrics.incr(f"checkout.created.{oracle}")
+    cached = {
+        "fingerprint": fingerprint,
+        "id": session.id,
+        "url": session.url,
+        "expires_at": session.expires_at or time.time() + DEFAULT_SESSION_LIFETIME_SECONDS,
+    }
+    st.session_state[key] = cached
+    return cached
+
+
+def _is_paid(session_id):
+    payment = get_recorded_payment(session_id)
+    return payment is not None and payment["payment_status"] == "paid"
+
+
+def record_payment_completed(oracle):
+    """
+    Conta um pagamento confirmado (para comparar com checkout.created.*) e
+    descarta a sessão de checkout guardada, que não serve mais para pagar.
+    """
+    metrics.incr(f"checkout.paid.{oracle}")
+    st.session_state.pop(f"{oracle}_checkout", None)
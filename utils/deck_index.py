@@ -0,0 +1,90 @@
+# utils/deck_index.py
+"""Índice do baralho do Tarô: busca de cartas sem percorrer o DECK.
+
+Os índices são montados uma vez por processo, na importação, e todas as buscas
+são consultas a dicionários (O(1)). Nomes, naipes, elementos e associações
+astrológicas são comparados pelo slug (minúsculas, sem acentos, espaços
+trocados por "_"), então "Três de Paus", "tres de paus" e "tres_de_paus"
+encontram a mesma carta.
+"""
+import unicodedata
+from collections import defaultdict
+
+from .tarot_deck import DECK, DrawnCard
+
+MAJOR_ARCANA = "Arcano Maior"
+
+
+def card_slug(text):
+    """Slug canônico: "Três de Paus" -> "tres_de_paus"."""
+    ascii_text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return "_".join(ascii_text.lower().replace("_", " ").split())
+
+
+def _group_by(field):
+    groups = defaultdict(list)
+    for card in DECK:
+        if card.get(field) is not None:
+            groups[card_slug(card[field])].append(card)
+    return {key: tuple(cards) for key, cards in groups.items()}
+
+
+_INDEX_BY_SLUG = {card_slug(card["name"]): index for index, card in enumerate(DECK)}
+# Arcanos maiores pela numeração (0-21); menores por (naipe, 1-14)
+_INDEX_BY_NUMBER = {
+    (None if card["type"] == MAJOR_ARCANA else card_slug(card["suit"]), card["number"]): index
+    for index, card in enumerate(DECK)
+}
+_CARDS_BY_SUIT = _group_by("suit")
+_CARDS_BY_ELEMENT = _group_by("element")
+_CARDS_BY_ASTROLOGY = _group_by("astrology")
+
+
+def index_of(name):
+    """Posição da carta no DECK pelo nome ou slug, ou None."""
+    return _INDEX_BY_SLUG.get(card_slug(name))
+
+
+def get_card(name):
+    """Carta pelo nome ou slug, ou None."""
+    index = index_of(name)
+    return DECK[index] if index is not None else None
+
+
+def card_by_number(number, suit=None):
+    """Arcano maior `number` (sem `suit`) ou a carta `number` do naipe `suit` (Ás = 1, Rei = 14)."""
+    index = _INDEX_BY_NUMBER.get((card_slug(suit) if suit is not None else None, number))
+    return DECK[index] if index is not None else None
+
+
+def cards_by_suit(suit):
+    """Cartas do naipe (Paus, Copas, Espadas, Ouros), do Ás ao Rei."""
+    return _CARDS_BY_SUIT.get(card_slug(suit), ())
+
+
+def cards_by_element(element):
+    """Cartas associadas ao elemento (Fogo, Água, Ar, Terra...)."""
+    return _CARDS_BY_ELEMENT.get(card_slug(element), ())
+
+
+def cards_by_astrology(association):
+    """Arcanos maiores associados ao signo ou planeta (ex.: "Leão", "Saturno")."""
+    return _CARDS_BY_ASTROLOGY.get(card_slug(association), ())
+
+
+def compact_drawn_cards(items):
+    """
+    Cartas tiradas como DrawnCard. Leituras gravadas no formato antigo
+    ({"card": {...}, "is_reversed": ...}) são convertidas pelo nome da carta;
+    um nome que não está no DECK levanta ValueError.
+    """
+    compact = []
+    for item in items:
+        if not isinstance(item, DrawnCard):
+            name = item["card"]["name"]
+            index = index_of(name)
+            if index is None:
+                raise ValueError(f"Carta desconhecida na leitura gravada: {name!r}")
+            item = DrawnCard(index, bool(item["is_reversed"]))
+        compact.append(item)
+    return compact
@@ -0,0 +1,89 @@
+# utils/ephemeris.py
+"""Arquivos de efemérides do Swiss Ephemeris, configurados uma vez por processo.
+
+Antes, cada mapa (AstroSubjectNoChiron) importava o kerykeion só para achar
+a pasta `sweph` e chamava swe.set_ephe_path, alterando um estado global da
+biblioteca no meio de sessões concorrentes. Aqui o caminho é resolvido,
+validado e aplicado uma única vez, na subida da página:
+
+    SE_EPHE_PATH  pasta configurada com os arquivos .se1 (o kerykeion nem é importado)
+    (sem ela)     pasta `sweph` que acompanha o kerykeion, importado só neste momento
+
+Sem arquivos de planetas (sepl_*.se1/semo_*.se1) o swisseph usa as efemérides
+analíticas de Moshier, embutidas e um pouco menos precisas; ephemeris_status()
+informa qual está em uso, testando um cálculo do Sol.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+
+import swisseph as swe
+
+EPHE_PATH_ENV = "SE_EPHE_PATH"
+# Dia juliano de referência (J2000) para o cálculo de teste
+_PROBE_JULIAN_DAY = 2451545.0
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_status = None
+
+
+def _resolve_path():
+    """(pasta, origem) das efemérides: a configurada ou a do kerykeion."""
+    configured = os.environ.get(EPHE_PATH_ENV)
+    if configured:
+        return Path(configured), "config"
+    try:
+        import kerykeion
+    except ImportError:
+        return None, None
+    return Path(kerykeion.__file__).parent / "sweph", "kerykeion"
+
+
+def _bootstrap():
+    path, source = _resolve_path()
+    if path is None:
+        return {"ready": False, "path": None, "source": None, "files": [], "swiss_ephemeris": False,
+                "error": "Biblioteca Kerykeion não encontrada e SE_EPHE_PATH não definido."}
+    if not path.is_dir():
+        return {"ready": False, "path": str(path), "source": source, "files": [], "swiss_ephemeris": False,
+                "error": f"Pasta de efemérides não encontrada: {path}"}
+
+    files = sorted(p.name for p in path.glob("*.se1"))
+    swe.set_ephe_path(str(path))
+    _, retflag = swe.calc_ut(_PROBE_JULIAN_DAY, swe.SUN)
+    swiss_ephemeris = bool(retflag & swe.FLG_SWIEPH)
+    if not swiss_ephemeris:
+        logger.warning("Sem arquivos de planetas em %s; usando as efemérides de Moshier.", path)
+    return {"ready": True, "path": str(path), "source": source, "files": files,
+            "swiss_ephemeris": swiss_ephemeris, "error": None}
+
+
+def ensure_ephemeris():
+    """Configura as efemérides (só na primeira chamada do processo) e diz se estão prontas."""
+    global _status
+    with _lock:
+        if _status is None:
+            try:
+                _status = _bootstrap()
+            except Exception as e:
+                _status = {"ready": False, "path": None, "source": None, "files": [],
+                           "swiss_ephemeris": False, "error": str(e)}
+            if _status["error"]:
+                logger.error("Efemérides não configuradas: %s", _status["error"])
+        return _status["ready"]
+
+
+def ephemeris_ready():
+    """True se as efemérides já foram configuradas com sucesso neste processo."""
+    with _lock:
+        return bool(_status and _status["ready"])
+
+
+def ephemeris_status():
+    """Diagnóstico: {ready, path, source, files, swiss_ephemeris, error}."""
+    ensure_ephemeris()
+    with _lock:
+        return dict(_status)
@@ -0,0 +1,55 @@
+# utils/flow_state.py
+"""Estado do fluxo de cada oráculo espelhado no backend de estado.
+
+O passo atual (welcome → configure → payment → result) e os dados da leitura
+ficam no st.session_state, que pertence a uma única réplica. Aqui um
+identificador do visitante vai na URL (`?sid=`), e as chaves do fluxo são
+gravadas no backend (utils/state_backend) ao fim de cada execução. Quando o
+visitante reconecta ou recarrega, mesmo caindo em outra réplica, a primeira
+execução da nova sessão recupera esse estado.
+"""
+import hashlib
+import pickle
+from uuid import uuid4
+
+import streamlit as st
+
+from .state_backend import get_backend
+
+NAMESPACE = "flow"
+FLOW_ID_PARAM = "sid"
+# Fluxos abandonados expiram depois de um dia
+FLOW_STATE_TTL_SECONDS = 24 * 3600
+
+
+def restore_flow_state(prefix):
+    """
+    Na primeira execução da sessão do Streamlit, recupera o estado do fluxo
+    `prefix` salvo para o `?sid=` da URL. Chaves já presentes não são trocadas.
+    """
+    marker = f"{prefix}_flow_restored"
+    if marker in st.session_state:
+        return
+    st.session_state[marker] = True
+
+    flow_id = st.query_params.get(FLOW_ID_PARAM)
+    saved = get_backend().get(NAMESPACE, f"{prefix}:{flow_id}") if flow_id else None
+    for key, value in (saved or {}).items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+
+def persist_flow_state(prefix, keys):
+    """Grava as `keys` do fluxo `prefix` no backend, se mudaram desde a última vez."""
+    flow_id = st.query_params.get(FLOW_ID_PARAM)
+    if not flow_id:
+        flow_id = uuid4().hex
+        st.query_params[FLOW_ID_PARAM] = flow_id
+
+    snapshot = {key: st.session_state[key] for key in keys if key in st.session_state}
+    digest = hashlib.sha256(pickle.dumps((flow_id, snapshot))).hexdigest()
+    digest_key = f"{prefix}_flow_digest"
+    if st.session_state.get(digest_key) == digest:
+        return
+    get_backend().set(NAMESPACE, f"{prefix}:{flow_id}", snapshot, ttl=FLOW_STATE_TTL_SECONDS)
+    st.session_state[digest_key] = digest
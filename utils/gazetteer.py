@@ -0,0 +1,167 @@
+# utils/gazetteer.py
+"""Gazetteer offline: cidades com coordenadas e fuso, num arquivo mapeado em memória.
+
+O arquivo (GAZETTEER_PATH, padrão geodata/gazetteer.bin) é gerado por
+scripts/build_gazetteer.py a partir de um dump de cidades da GeoNames ou, na
+falta dele, das localidades do tzdb. A geocodificação (utils/geocoding)
+consulta este arquivo antes do Nominatim, que fica só para lugares fora dele.
+
+O arquivo é aberto com mmap e nada é carregado para dicionários: as chaves
+(nomes normalizados, também combinados com estado e país) ficam ordenadas no
+próprio arquivo, e tanto a busca exata quanto a de prefixo são buscas
+binárias sobre elas, abaixo de 1 ms. A busca de prefixo alimenta as
+sugestões do campo de cidade (suggest_cities) a cada texto digitado, então só
+as poucas sugestões vão para o navegador, não a lista de cidades.
+
+Os dados de cidades vêm da GeoNames (https://www.geonames.org/), sob a
+licença CC BY 4.0, que exige atribuição: ver geodata/ATTRIBUTION.md e
+GAZETTEER_ATTRIBUTION, exibido junto ao campo de cidade.
+
+Formato (little-endian):
+    cabeçalho  magic "GAZ1", versão, nº de lugares, de chaves e de fusos,
+               deslocamentos das seções de lugares, chaves, fusos e textos
+    lugares    lat e lng em micrograus (int32), população (uint32),
+               fuso (uint16), rótulo (deslocamento uint32, tamanho uint16),
+               país (código ISO, 2 bytes)
+    chaves     texto (deslocamento uint32, tamanho uint16), lugar (uint32),
+               ordenadas pelo texto e, no empate, com os nomes oficiais antes
+               dos alternativos e depois pela população (maior antes)
+    fusos      nome do fuso (deslocamento uint32, tamanho uint16)
+    textos     UTF-8
+"""
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import unicodedata
+
+GAZETTEER_PATH = os.environ.get("GAZETTEER_PATH", os.path.join("geodata", "gazetteer.bin"))
+
+# Crédito exigido pela licença CC BY 4.0 dos dados da GeoNames
+GAZETTEER_ATTRIBUTION = (
+    "Dados de cidades: [GeoNames](https://www.geonames.org/), "
+    "licença [CC BY 4.0](https://creativecommons.org/licenses/by/4.0/)."
+)
+
+MAGIC = b"GAZ1"
+VERSION = 2
+HEADER = struct.Struct("<4sHIIIIIII")
+PLACE = struct.Struct("<iiIHIH2s")
+KEY = struct.Struct("<IHI")
+TIMEZONE = struct.Struct("<IH")
+# Limite de chaves examinadas por busca de prefixo (prefixos curtos casam milhares)
+PREFIX_SCAN_LIMIT = 400
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_city(city):
+    """Chave de busca: minúsculas, sem acentos e com espaços/vírgulas uniformes."""
+    text = unicodedata.normalize("NFKD", str(city)).encode("ascii", "ignore").decode("ascii")
+    parts = [" ".join(part.split()) for part in text.lower().split(",")]
+    return ", ".join(part for part in parts if part)
+
+
+class _Keys:
+    """Vista das chaves ordenadas do arquivo, como sequência de bytes (para bisect)."""
+
+    def __init__(self, gazetteer):
+        self._gazetteer = gazetteer
+
+    def __len__(self):
+        return self._gazetteer.num_keys
+
+    def __getitem__(self, i):
+        return self._gazetteer._key(i)[0]
+
+
+class Gazetteer:
+    """Leitor do arquivo do gazetteer (ver a docstring do módulo)."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.num_places, self.num_keys, num_timezones,
+         self._places_at, self._keys_at, timezones_at, self._strings_at) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} não é um gazetteer v{VERSION}")
+        self._timezones = [
+            self._text(*TIMEZONE.unpack_from(self._mm, timezones_at + i * TIMEZONE.size))
+            for i in range(num_timezones)
+        ]
+        self._sorted_keys = _Keys(self)
+
+    def _text(self, offset, length):
+        start = self._strings_at + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _key(self, i):
+        offset, length, place = KEY.unpack_from(self._mm, self._keys_at + i * KEY.size)
+        start = self._strings_at + offset
+        return self._mm[start:start + length], place
+
+    def place(self, i):
+        """Lugar `i`: {"address", "lat", "lng", "timezone"}."""
+        lat, lng, _population, tz_index, label_offset, label_length, _country = PLACE.unpack_from(
+            self._mm, self._places_at + i * PLACE.size
+        )
+        return {
+            "address": self._text(label_offset, label_length),
+            "lat": lat / 1e6,
+            "lng": lng / 1e6,
+            "timezone": self._timezones[tz_index],
+        }
+
+    def lookup(self, city):
+        """Lugar cuja chave é exatamente `city` normalizada (o mais populoso), ou None."""
+        key = normalize_city(city).encode("utf-8")
+        i = bisect.bisect_left(self._sorted_keys, key)
+        if i < self.num_keys:
+            found, place = self._key(i)
+            if found == key:
+                return self.place(place)
+        return None
+
+    def _population(self, i):
+        return PLACE.unpack_from(self._mm, self._places_at + i * PLACE.size)[2]
+
+    def suggest(self, prefix, limit=8):
+        """Até `limit` lugares com alguma chave começando por `prefix`, os mais populosos antes."""
+        key = normalize_city(prefix).encode("utf-8")
+        if not key:
+            return []
+        candidates = set()
+        start = bisect.bisect_left(self._sorted_keys, key)
+        for i in range(start, min(self.num_keys, start + PREFIX_SCAN_LIMIT)):
+            found, place = self._key(i)
+            if not found.startswith(key):
+                break
+            candidates.add(place)
+        best = sorted(candidates, key=lambda place: (-self._population(place), place))[:limit]
+        return [self.place(place) for place in best]
+
+
+_gazetteer = None
+_gazetteer_loaded = False
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer():
+    """Gazetteer do processo, aberto na primeira chamada; None se o arquivo não existir."""
+    global _gazetteer, _gazetteer_loaded
+    with _gazetteer_lock:
+        if not _gazetteer_loaded:
+            _gazetteer_loaded = True
+            try:
+                _gazetteer = Gazetteer(GAZETTEER_PATH)
+            except (OSError, ValueError) as e:
+                logger.warning("Gazetteer offline indisponível, usando só o Nominatim: %s", e)
+        return _gazetteer
+
+
+def suggest_cities(prefix, limit=8):
+    """Sugestões de cidades para o texto digitado (vazio sem o gazetteer)."""
+    gazetteer = get_gazetteer()
+    return gazetteer.suggest(prefix, limit) if gazetteer else []
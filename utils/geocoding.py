@@ -0,0 +1,112 @@
+# utils/geocoding.py
+"""Geocodificação das cidades de nascimento: gazetteer offline e cache persistente.
+
+A validação do formulário e o cálculo do mapa (Ecos Estelares) perguntavam ao
+Nominatim pela mesma cidade, cada um com timeout de 10 s e sujeito ao limite de
+1 requisição por segundo do serviço. Aqui cada cidade é resolvida uma única
+vez: latitude, longitude e fuso horário ficam gravados no backend de estado
+(utils/state_backend; SQLite em disco por padrão), indexados pelo texto
+normalizado da cidade, e valem para as duas etapas, entre sessões e após
+reinícios do processo.
+
+Antes do cache e do Nominatim vem o gazetteer offline (utils/gazetteer), que
+responde na hora, sem rede, pelas cidades que contém. O Nominatim fica só
+para os lugares fora dele.
+
+Cidades não encontradas também são lembradas, por pouco tempo, para que um
+erro de digitação não vire uma consulta ao Nominatim a cada envio.
+"""
+import threading
+import time
+
+from geopy.geocoders import Nominatim
+
+from . import metrics
+from .gazetteer import get_gazetteer, normalize_city
+from .state_backend import get_backend
+from .timezones import timezone_at
+
+NAMESPACE = "geocoding"
+NOMINATIM_USER_AGENT = "ecos_estelares_app"
+NOMINATIM_TIMEOUT_SECONDS = 10
+# Política de uso do Nominatim: no máximo uma requisição por segundo
+NOMINATIM_MIN_INTERVAL_SECONDS = 1.0
+PLACE_TTL_SECONDS = 180 * 24 * 3600
+NOT_FOUND_TTL_SECONDS = 24 * 3600
+
+_nominatim_lock = threading.Lock()
+_last_request_at = 0.0
+
+
+def _nominatim_geocode(city):
+    """Consulta o Nominatim respeitando o intervalo mínimo entre requisições do processo."""
+    global _last_request_at
+    with _nominatim_lock:
+        wait = _last_request_at + NOMINATIM_MIN_INTERVAL_SECONDS - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            geolocator = Nominatim(user_agent=NOMINATIM_USER_AGENT)
+            return geolocator.geocode(city, language="pt", timeout=NOMINATIM_TIMEOUT_SECONDS)
+        finally:
+            _last_request_at = time.monotonic()
+
+
+def geocode_city(city):
+    """
+    Local da cidade: {"address", "lat", "lng", "timezone"}, ou None se ela não
+    for encontrada. Erros de rede do Nominatim são propagados (nada é gravado).
+    """
+    key = normalize_city(city)
+    if not key:
+        return None
+    metrics.incr("geocoding.lookups")
+
+    gazetteer = get_gazetteer()
+    place = gazetteer.lookup(key) if gazetteer else None
+    if place is not None:
+        metrics.incr("geocoding.gazetteer")
+        return place
+
+    backend = get_backend()
+    cached = backend.get(NAMESPACE, key)
+    if cached is not None:
+        metrics.incr("geocoding.hit")
+        return cached.get("place")
+
+    metrics.incr("geocoding.miss")
+    start = time.perf_counter()
+    location = _nominatim_geocode(city)
+    metrics.observe("geocoding.nominatim", time.perf_counter() - start)
+    if not location:
+        backend.set(NAMESPACE, key, {"place": None}, ttl=NOT_FOUND_TTL_SECONDS)
+        return None
+
+    place = {
+        "address": location.address,
+        "lat": location.latitude,
+        "lng": location.longitude,
+        "timezone": timezone_at(location.latitude, location.longitude),
+    }
+    backend.set(NAMESPACE, key, {"place": place}, ttl=PLACE_TTL_SECONDS)
+    return place
+
+
+def geocoding_hit_rate():
+    """
+    Fração das consultas deste processo que chegaram ao cache e foram
+    respondidas por ele. As respostas do gazetteer ficam de fora (ver
+    geocoding_gazetteer_rate), para não inflar a taxa do cache.
+    """
+    hits = metrics.get("geocoding.hit")
+    total = hits + metrics.get("geocoding.miss")
+    return hits / total if total else 0.0
+
+
+def geocoding_gazetteer_rate():
+    """Fração das consultas deste processo respondidas pelo gazetteer offline."""
+    return metrics.ratio("geocoding.gazetteer", "geocoding.lookups")
+
+
+metrics.register_gauge("geocoding.hit_rate", geocoding_hit_rate)
+metrics.register_gauge("geocoding.gazetteer_rate", geocoding_gazetteer_rate)
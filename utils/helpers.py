@@ -1,11 +1,21 @@
 # utils/helpers.py
 import streamlit as st
 import base64
+import os
 import re
 
-@st.cache_data
-def get_img_as_base64(file):
-    """Lê um arquivo de imagem e o converte para uma string Base64."""
+from .cache import ByteLRUCache
+
+# Cache das imagens em Base64, limitado em bytes (padrão: 32 MB por processo)
+IMAGE_CACHE = ByteLRUCache(
+    max_bytes=int(os.environ.get("IMAGE_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+    name="imagens",
+)
+
+# Quanto a página de resultado espera pelo estado da leitura antes de oferecer "tentar novamente"
+READING_STATE_TIMEOUT = float(os.environ.get("READING_STATE_TIMEOUT", 90))
+
+def _read_img_as_base64(file):
     try:
         with open(file, "rb") as f:
             data = f.read()
@@ -13,6 +23,10 @@ def get_img_as_base64(file):
     except FileNotFoundError:
         return None
 
+def get_img_as_base64(file):
+    """Lê um arquivo de imagem e o converte para uma string Base64 (com cache LRU limitado)."""
+    return IMAGE_CACHE.get_or_load(file, lambda: _read_img_as_base64(file))
+
 def strip_emojis(text):
     """Remove caracteres emoji de uma string."""
     emoji_pattern = re.compile(
@@ -48,7 +62,7 @@ def reset_app_state(app_key_prefix):
     generic_keys = [
         'payment_verified', 'stripe_session_id', 'final_interpretation',
         'drawn_cards', 'chart_data', 'dream_description', 'user_name', 'city',
-        'dob', 'tob'
+        'dob', 'tob', 'reading_saved', 'interpretation_failed'
     ]
     # Adiciona as chaves genéricas à lista, evitando duplicatas
     for key in generic_keys:
@@ -60,6 +74,44 @@ def reset_app_state(app_key_prefix):
         if key in st.session_state:
             del st.session_state[key]
 
+    # Remove o ?session_id= da URL, senão a leitura anterior seria restaurada
+    st.query_params.clear()
+
     # Define a etapa inicial para o app específico e força a atualização da página
     st.session_state[f'{app_key_prefix}_step'] = 'welcome'
     st.rerun()
+
+def offer_reading_retry(*state_keys):
+    """
+    Botão para refazer uma leitura que falhou. O clique limpa a interpretação e
+    as chaves de estado indicadas (ex.: 'drawn_cards') e marca 'reading_retry';
+    no rerun a página pede o job com retry=True, o único caminho que refaz uma
+    leitura que falhou (ver utils/reading_jobs).
+    """
+    def retry():
+        for key in ('final_interpretation', 'interpretation_failed', *state_keys):
+            st.session_state.pop(key, None)
+        st.session_state.reading_retry = True
+
+    st.button("🔄 Tentar novamente", on_click=retry, width='stretch')
+
+def wait_reading_state(job, spinner_text, timeout=READING_STATE_TIMEOUT):
+    """
+    Espera o estado da leitura preparada em segundo plano e o devolve. `job`
+    vem de utils/reading_jobs, que este módulo não importa (helpers é leve e
+    usado por todo o app). Se o job falhou ou não ficou pronto a tempo, mostra
+    o aviso com o botão de tentar de novo e devolve None (a página não deve
+    continuar).
+    """
+    state = None
+    if job is not None:
+        with st.spinner(spinner_text):
+            state = job.wait_state(timeout)
+    if job is None or job.failed or state == {}:
+        st.error((job and job.error) or "Não foi possível preparar sua leitura.")
+    elif state is None:
+        st.warning("Sua leitura ainda está sendo preparada. Aguarde alguns instantes e tente novamente.")
+    else:
+        return state
+    offer_reading_retry()
+    return None
@@ -0,0 +1,87 @@
+# utils/llm.py
+"""Chamadas ao modelo de linguagem compartilhadas pelos três oráculos.
+
+Cada oráculo tem sua própria chave de API e um cliente OpenAI de longa
+duração, criado uma vez por processo. Assim as sessões simultâneas em páginas
+diferentes não disputam o openai.api_key global, e as conexões HTTP (TLS
+incluso) ficam no pool do cliente e são reaproveitadas entre as consultas.
+
+O cliente HTTP é o httpx2, o mesmo sobre o qual o openai 3.x é construído
+(as versões dos dois ficam fixadas em requirements.txt); aqui se ajustam o
+pool de conexões, o keep-alive, os timeouts e o número de tentativas.
+"""
+import os
+import threading
+import time
+
+import httpx2
+import openai
+
+from . import metrics
+
+# Variável de ambiente com a chave de API de cada oráculo
+ORACLE_API_KEY_ENV = {
+    "tarot": "TAROT_OPENAI_API_KEY",
+    "astro": "ASTRO_OPENAI_API_KEY",
+    "dream": "DREAM_OPENAI_API_KEY",
+}
+
+# Pool de conexões por cliente; conexões ociosas ficam abertas por até 2 minutos
+HTTP_LIMITS = httpx2.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=120)
+# O read vale entre trechos do streaming, não para a resposta inteira
+HTTP_TIMEOUT = httpx2.Timeout(connect=5.0, read=60.0, write=10.0, pool=10.0)
+MAX_RETRIES = 2
+
+_lock = threading.Lock()
+_clients = {}
+
+
+class ErrorText(str):
+    """
+    Mensagem de erro entregue no lugar da interpretação. Aparece para o
+    usuário como qualquer texto, mas marca a leitura como falha (não é gravada).
+    """
+
+
+def get_api_key(oracle):
+    """Chave de API do oráculo (None se a variável de ambiente não existir)."""
+    return os.environ.get(ORACLE_API_KEY_ENV[oracle])
+
+
+def get_client(oracle):
+    """Cliente OpenAI do oráculo, criado na primeira chamada e reaproveitado depois."""
+    with _lock:
+        client = _clients.get(oracle)
+        if client is None:
+            client = openai.OpenAI(
+                api_key=get_api_key(oracle),
+                timeout=HTTP_TIMEOUT,
+                max_retries=MAX_RETRIES,
+                http_client=openai.DefaultHttpx2Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+            )
+            _clients[oracle] = client
+        return client
+
+
+def stream_chat_completion(oracle, **request):
+    """
+    Gera os trechos de texto da resposta do chat à medida que chegam.
+
+    Usa o cliente do oráculo (get_client). Feito para st.write_stream: a página mostra os tokens conforme chegam e
+    recebe o texto completo no final. Registra em utils.metrics o tempo até o
+    primeiro token (`llm.<oracle>.ttft`) e o tempo total (`llm.<oracle>.total`).
+    Exceções da API são propagadas para quem chama.
+    """
+    start = time.perf_counter()
+    first_token_at = None
+    response = get_client(oracle).chat.completions.create(stream=True, **request)
+    for chunk in response:
+        if not chunk.choices:
+            continue
+        text = chunk.choices[0].delta.content
+        if text:
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+                metrics.observe(f"llm.{oracle}.ttft", first_token_at - start)
+            yield text
+    metrics.observe(f"llm.{oracle}.total", time.perf_counter() - start)
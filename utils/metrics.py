@@ -0,0 +1,124 @@
+# utils/metrics.py
+"""Contadores e tempos simples do processo, para acompanhar o uso dos oráculos.
+
+start_metrics_logger() grava no log, a cada METRICS_LOG_INTERVAL segundos
+(padrão 300; 0 desliga), o relatório do processo (report()): contadores,
+resumo dos tempos (ex.: llm.*.ttft) e os indicadores registrados pelos módulos
+com register_gauge (ex.: taxa de acerto da geocodificação).
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+METRICS_LOG_INTERVAL = float(os.environ.get("METRICS_LOG_INTERVAL", 300))
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_counters = Counter()
+# nome -> [quantidade, soma em segundos, máximo em segundos]
+_timings = {}
+# nome -> função sem argumentos, avaliada a cada relatório
+_gauges = {}
+_logger_started = False
+
+
+def incr(name, amount=1):
+    """Incrementa o contador `name`."""
+    with _lock:
+        _counters[name] += amount
+
+
+def get(name):
+    """Valor atual do contador `name` (0 se nunca incrementado)."""
+    with _lock:
+        return _counters[name]
+
+
+def snapshot():
+    """Cópia de todos os contadores, para logs ou páginas de diagnóstico."""
+    with _lock:
+        return dict(_counters)
+
+
+def ratio(numerator, denominator):
+    """Razão entre dois contadores (ex.: PDFs baixados / PDFs gerados)."""
+    with _lock:
+        total = _counters[denominator]
+        return _counters[numerator] / total if total else 0.0
+
+
+def observe(name, seconds):
+    """Registra uma duração (em segundos) na série `name`."""
+    with _lock:
+        entry = _timings.setdefault(name, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+
+def timings():
+    """Resumo das durações: {nome: {count, avg, max}} em segundos."""
+    with _lock:
+        return {
+            name: {"count": count, "avg": total / count, "max": peak}
+            for name, (count, total, peak) in _timings.items()
+        }
+
+
+def register_gauge(name, fn):
+    """Registra um indicador calculado na hora do relatório (ex.: uma razão entre contadores)."""
+    with _lock:
+        _gauges[name] = fn
+
+
+def gauges():
+    """Valores atuais dos indicadores registrados."""
+    with _lock:
+        items = list(_gauges.items())
+    values = {}
+    for name, fn in items:
+        try:
+            values[name] = fn()
+        except Exception:
+            logger.exception("Falha ao calcular o indicador %s", name)
+    return values
+
+
+def report():
+    """Relatório do processo: {counters, timings, gauges}."""
+    return {"counters": snapshot(), "timings": timings(), "gauges": gauges()}
+
+
+def log_report():
+    """Grava o relatório no log (uma linha JSON)."""
+    logger.info("métricas %s", json.dumps(report(), sort_keys=True, ensure_ascii=False))
+
+
+def _log_forever(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            log_report()
+        except Exception:
+            logger.exception("Falha ao gravar o relatório de métricas")
+
+
+def start_metrics_logger(interval=METRICS_LOG_INTERVAL):
+    """Grava o relatório no log a cada `interval` segundos (uma thread por processo)."""
+    global _logger_started
+    with _lock:
+        if _logger_started or interval <= 0:
+            return
+        _logger_started = True
+    # O Streamlit só configura os próprios loggers; sem isto o INFO não aparece
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s: %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    threading.Thread(target=_log_forever, args=(interval,), name="metrics-logger", daemon=True).start()
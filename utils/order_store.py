@@ -0,0 +1,50 @@
+# utils/order_store.py
+"""Pedidos gravados no servidor, indexados pelo client_reference_id do Stripe.
+
+Os dados da consulta (sonho, data/hora/cidade de nascimento, pergunta...) ficam
+aqui, e não nos metadados da sessão de checkout: o Stripe trunca valores acima
+de 500 caracteres, e cada create/retrieve carregaria esse volume à toa. A
+sessão leva só o id opaco do pedido (client_reference_id e metadata.order_id),
+e a página de retorno reidrata a consulta a partir deste registro (gravado no
+backend de estado, utils/state_backend).
+"""
+import time
+from uuid import uuid4
+
+from . import metrics
+from .state_backend import get_backend
+
+NAMESPACE = "orders"
+# Sessões de checkout expiram em 24 h; o pedido fica bem além disso
+ORDER_TTL_SECONDS = 30 * 24 * 3600
+
+
+def create_order(oracle, payload):
+    """Grava os dados da consulta e devolve o id do pedido (para o client_reference_id)."""
+    order_id = uuid4().hex
+    get_backend().set(NAMESPACE, order_id, {
+        "oracle": oracle,
+        "payload": payload,
+        "created_at": time.time(),
+    }, ttl=ORDER_TTL_SECONDS)
+    return order_id
+
+
+def get_order(order_id):
+    """Pedido ({oracle, payload}) gravado com `order_id`, ou None."""
+    return get_backend().get(NAMESPACE, order_id)
+
+
+def order_payload(payment):
+    """
+    Dados da consulta de um pagamento verificado (ver utils/payment_ledger).
+
+    Procura o pedido pelo client_reference_id (ou metadata.order_id). Sessões
+    antigas, criadas antes do registro de pedidos, ainda trazem os dados nos
+    próprios metadados; nesse caso eles são devolvidos como estão.
+    """
+    metadata = payment.get("metadata") or {}
+    order_id = payment.get("client_reference_id") or metadata.get("order_id")
+    order = get_order(order_id) if order_id else None
+    metrics.incr(f"order_store.{'hit' if order is not None else 'miss'}")
+    return order["payload"] if order is not None else metadata
@@ -0,0 +1,74 @@
+# utils/payment_ledger.py
+"""Registro local dos pagamentos confirmados (sessões de checkout pagas).
+
+O webhook do Stripe (utils/stripe_webhook.py) grava aqui cada
+checkout.session.completed. Na volta do pagamento a página consulta o registro
+primeiro; só se a sessão ainda não estiver nele (webhook atrasado ou
+desativado) é que o Stripe é consultado de forma síncrona, e o resultado pago
+também é gravado.
+
+Os pagamentos ficam no backend de estado (utils/state_backend).
+"""
+import time
+
+try:
+    import stripe
+except ImportError:
+    stripe = None
+
+from . import metrics
+from .state_backend import get_backend
+
+NAMESPACE = "payments"
+
+
+def _plain_metadata(metadata):
+    """Metadados do Stripe (StripeObject ou dict) como dict simples."""
+    if metadata is None:
+        return {}
+    if hasattr(metadata, "to_dict"):
+        return metadata.to_dict()
+    return dict(metadata)
+
+
+def record_checkout_session(session, source):
+    """
+    Grava uma sessão de checkout do Stripe (objeto da API ou do evento do
+    webhook); `source` é "webhook" ou "stripe".
+    """
+    get_backend().set(NAMESPACE, session.id, {
+        "payment_status": session.payment_status,
+        "client_reference_id": getattr(session, "client_reference_id", None),
+        "metadata": _plain_metadata(getattr(session, "metadata", None)),
+        "source": source,
+        "recorded_at": time.time(),
+    })
+
+
+def get_recorded_payment(session_id):
+    """Pagamento gravado da sessão de checkout, sem consultar o Stripe; None se não houver."""
+    return get_backend().get(NAMESPACE, session_id)
+
+
+def verify_checkout_payment(session_id):
+    """
+    Devolve {payment_status, client_reference_id, metadata} da sessão de checkout.
+
+    Consulta o registro local primeiro; sem registro (ou ainda não pago),
+    chama stripe.checkout.Session.retrieve e grava o resultado pago.
+    Exceções do Stripe são propagadas.
+    """
+    payment = get_recorded_payment(session_id)
+    if payment is not None and payment["payment_status"] == "paid":
+        metrics.incr("payment_ledger.hit")
+        return payment
+
+    metrics.incr("payment_ledger.miss")
+    session = stripe.checkout.Session.retrieve(session_id)
+    if session.payment_status == "paid":
+        record_checkout_session(session, source="stripe")
+    return {
+        "payment_status": session.payment_status,
+        "client_reference_id": getattr(session, "client_reference_id", None),
+        "metadata": _plain_metadata(session.metadata),
+    }
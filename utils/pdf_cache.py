@@ -0,0 +1,71 @@
+# utils/pdf_cache.py
+"""Cache dos PDFs gerados, indexado pela impressão digital da leitura.
+
+O Streamlit executa o script inteiro a cada interação; sem este cache, o PDF
+da página de resultado seria reconstruído a cada clique. Os bytes são gerados
+uma vez por leitura e descartados por LRU quando o orçamento de memória enche.
+
+As páginas entregam ao st.download_button um callable (deferred_reading_pdf),
+então o PDF só é gerado quando o usuário pede o download. Contadores em
+utils.metrics, por oráculo:
+    reading_shown.*   leituras exibidas (uma vez por leitura, ver record_reading_shown)
+    pdf_downloaded.*  cliques em baixar
+    pdf_generated.*   PDFs de fato construídos (faltas no cache)
+pdf_downloaded / reading_shown é a fração das leituras exibidas que viram PDF.
+"""
+import hashlib
+import json
+import os
+
+from . import metrics
+from .cache import ByteLRUCache
+
+PDF_CACHE = ByteLRUCache(
+    max_bytes=int(os.environ.get("PDF_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+    name="pdfs",
+)
+
+
+def pdf_download_rate(kind):
+    """Fração das leituras exibidas do oráculo cujo PDF foi baixado."""
+    return metrics.ratio(f"pdf_downloaded.{kind}", f"reading_shown.{kind}")
+
+
+for _kind in ("tarot", "astro", "dream"):
+    metrics.register_gauge(f"pdf.download_rate.{_kind}", lambda kind=_kind: pdf_download_rate(kind))
+
+
+def reading_fingerprint(*parts):
+    """Hash estável (SHA-256) das partes que definem o conteúdo de uma leitura."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_reading_pdf(kind, fingerprint, builder):
+    """
+    Devolve os bytes do PDF da leitura, gerando-os com `builder()` só na
+    primeira vez. `kind` separa os oráculos ("tarot", "astro", "dream").
+    """
+    def _build():
+        metrics.incr(f"pdf_generated.{kind}")
+        return bytes(builder())
+
+    return PDF_CACHE.get_or_load((kind, fingerprint), _build)
+
+
+def record_reading_shown(kind):
+    """Conta uma leitura exibida ao usuário (chamar uma vez, quando a interpretação chega)."""
+    metrics.incr(f"reading_shown.{kind}")
+
+
+def deferred_reading_pdf(kind, fingerprint, builder):
+    """
+    Callable para o `data` do st.download_button: o PDF só é gerado (ou lido
+    do cache) quando o usuário clica em baixar, fora do caminho crítico da
+    exibição da interpretação. `builder` não deve ler st.session_state.
+    """
+    def _data():
+        metrics.incr(f"pdf_downloaded.{kind}")
+        return get_reading_pdf(kind, fingerprint, builder)
+
+    return _data
@@ -0,0 +1,73 @@
+# utils/pdf_fonts.py
+"""Registro das fontes TTF dos PDFs, interpretadas uma única vez por processo.
+
+pdf.add_font() relê o arquivo TTF e recalcula as métricas de todos os glifos a
+cada PDF gerado. Aqui cada fonte é carregada e medida na primeira vez; os PDFs
+seguintes recebem uma cópia leve que compartilha cmap, larguras e descritor.
+Só o TTFont do fontTools é recriado por documento (a partir dos bytes já em
+memória), porque o fpdf o recorta (subset) no momento de gerar o arquivo.
+
+A cópia depende de campos internos do TTFFont do fpdf2, por isso a versão do
+fpdf2 é fixada em requirements.txt; tests/test_pdf_registries.py compara o
+PDF com o gerado por add_font() antes de qualquer atualização.
+"""
+import copy
+import io
+import threading
+
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import SubsetMap
+
+# Fontes de cada modelo de PDF: (família, estilo, arquivo)
+MYSTICAL_FONTS = [
+    ('Cinzel', 'B', 'fonts/Cinzel-Bold.ttf'),
+    ('CormorantGaramond', '', 'fonts/CormorantGaramond-Regular.ttf'),
+    ('CormorantGaramond', 'I', 'fonts/CormorantGaramond-Italic.ttf'),
+    ('CormorantGaramond', 'B', 'fonts/CormorantGaramond-Bold.ttf'),
+]
+COSMIC_FONTS = MYSTICAL_FONTS
+DREAM_FONTS = [
+    ('UncialAntiqua', 'B', 'fonts/UncialAntiqua-Regular.ttf'),
+    ('CrimsonText', '', 'fonts/CrimsonText-Regular.ttf'),
+    ('CrimsonText', 'I', 'fonts/CrimsonText-Italic.ttf'),
+    ('CrimsonText', 'B', 'fonts/CrimsonText-Bold.ttf'),
+]
+
+_lock = threading.Lock()
+_prepared = {}
+
+
+def _prepare_font(family, style, path):
+    """Interpreta a fonte com o próprio fpdf e guarda o resultado com os bytes do arquivo."""
+    with _lock:
+        key = (family, style, path)
+        if key not in _prepared:
+            scratch = FPDF()
+            scratch.add_font(family, style, path)
+            (template,) = scratch.fonts.values()
+            with open(path, "rb") as f:
+                raw = f.read()
+            _prepared[key] = (template, raw)
+        return _prepared[key]
+
+
+def register_fonts(pdf, fonts):
+    """
+    Equivale a chamar pdf.add_font() para cada item de `fonts`, mas sem
+    reinterpretar os arquivos TTF. Levanta FileNotFoundError se faltar algum.
+    """
+    for family, style, path in fonts:
+        template, raw = _prepare_font(family, style, path)
+        if template.fontkey in pdf.fonts:
+            continue
+        font = copy.copy(template)
+        font.i = len(pdf.fonts) + 1
+        # Estado que o fpdf altera por documento
+        font.ttfont = ttLib.TTFont(io.BytesIO(raw), recalcTimestamp=False, lazy=True)
+        font.subset = SubsetMap(font)
+        font.missing_glyphs = []
+        font.biggest_size_pt = 0
+        font._hbfont = None
+        pdf.fonts[font.fontkey] = font
+
@@ -6,6 +6,8 @@ import unicodedata
 from fpdf import FPDF, XPos, YPos
 # O import do strip_emojis vem de helpers.py
 from .helpers import strip_emojis, get_img_as_base64 # Adicionado para corrigir dependência implícita
+from .print_images import place_print_image
+from .pdf_fonts import register_fonts, MYSTICAL_FONTS, COSMIC_FONTS, DREAM_FONTS
 
 class MysticalPDF(FPDF):
     def __init__(self, *args, **kwargs):
@@ -83,13 +85,14 @@ class MysticalPDF(FPDF):
         self.ln(8)
 
     def draw_card_details(self, card_item, position):
-        card = card_item['card']
+        card = card_item.card
         card_name = card['name']
-        orientation = "(Invertida)" if card_item['is_reversed'] else ""
-        image_path = os.path.join("images", get_image_filename(card['name']))
+        orientation = "(Invertida)" if card_item.is_reversed else ""
+        image_path = card['image_path']
         y_start = self.get_y()
         if os.path.exists(image_path):
-            self.image(image_path, x=self.l_margin, y=y_start, w=40)
+            # Versão reduzida (~300 dpi em 40 mm), compartilhada entre PDFs
+            place_print_image(self, image_path, x=self.l_margin, y=y_start, w=40)
         text_x_pos = self.l_margin + 45
         self.set_xy(text_x_pos, y_start)
         self.set_font('CormorantGaramond', 'B', 14)
@@ -108,11 +111,6 @@ class MysticalPDF(FPDF):
         self.set_y(max(y_after_image, y_after_text) + 5)
         self.ln(5)
 
-def get_image_filename(card_name):
-    # Função auxiliar movida para cá para que create_reading_pdf funcione
-    # Idealmente, esta função também estaria em helpers.py
-    return card_name.lower().replace(' ', '_').replace('á', 'a').replace('ã', 'a').replace('ç', 'c') + ".png"
-
 def create_reading_pdf(sel, interpretation, drawn_cards, spread_positions):
     import streamlit as st # Import local para evitar dependência circular
     user_name = sel.get("user_name", "Viajante")
@@ -121,11 +119,9 @@ def create_reading_pdf(sel, interpretation, drawn_cards, spread_positions):
 
     pdf = MysticalPDF('P', 'mm', 'A4')
     try:
-        pdf.add_font('Cinzel', 'B', 'fonts/Cinzel-Bold.ttf')
-        pdf.add_font('CormorantGaramond', '', 'fonts/CormorantGaramond-Regular.ttf')
-        pdf.add_font('CormorantGaramond', 'I', 'fonts/CormorantGaramond-Italic.ttf')
-        pdf.add_font('CormorantGaramond', 'B', 'fonts/CormorantGaramond-Bold.ttf')
-    except RuntimeError:
+        # Fontes interpretadas uma vez por processo (ver pdf_fonts.py)
+        register_fonts(pdf, MYSTICAL_FONTS)
+    except (RuntimeError, OSError):
         # st.error não funciona fora de um script Streamlit, então apenas usamos Helvetica
         pdf.add_page()
         pdf.set_font("Helvetica", '', 12)
@@ -244,7 +240,7 @@ class CosmicPDF(FPDF):
         y_start = self.get_y()
 
         if os.path.exists(image_path):
-            self.image(image_path, x=self.l_margin, y=y_start, h=20)
+            place_print_image(self, image_path, x=self.l_margin, y=y_start, h=20)
 
         text_x_pos = self.l_margin + 25
         self.set_xy(text_x_pos, y_start)
@@ -279,11 +275,8 @@ def create_astro_pdf(session_data, interpretation, PLANETARY_DATA):
 
     pdf = CosmicPDF('P', 'mm', 'A4')
     try:
-        pdf.add_font('Cinzel', 'B', 'fonts/Cinzel-Bold.ttf')
-        pdf.add_font('CormorantGaramond', '', 'fonts/CormorantGaramond-Regular.ttf')
-        pdf.add_font('CormorantGaramond', 'I', 'fonts/CormorantGaramond-Italic.ttf')
-        pdf.add_font('CormorantGaramond', 'B', 'fonts/CormorantGaramond-Bold.ttf')
-    except RuntimeError as e:
+        register_fonts(pdf, COSMIC_FONTS)
+    except (RuntimeError, OSError) as e:
         print(f"Erro ao carregar fontes para o PDF: {e}")
         pdf.set_font("Helvetica", '', 12)
         pdf.add_page()
@@ -395,11 +388,8 @@ def create_dream_pdf(session_data, interpretation):
 
     pdf = DreamOraclePDF('P', 'mm', 'A4')
     try:
-        pdf.add_font('UncialAntiqua', 'B', 'fonts/UncialAntiqua-Regular.ttf')
-        pdf.add_font('CrimsonText', '', 'fonts/CrimsonText-Regular.ttf')
-        pdf.add_font('CrimsonText', 'I', 'fonts/CrimsonText-Italic.ttf')
-        pdf.add_font('CrimsonText', 'B', 'fonts/CrimsonText-Bold.ttf')
-    except RuntimeError as e:
+        register_fonts(pdf, DREAM_FONTS)
+    except (RuntimeError, OSError) as e:
         print(f"ERRO DE FONTE: {e}. Verifique se os arquivos .ttf estão na pasta 'fonts'.")
         pdf.set_font("Helvetica", '', 12)
         pdf.add_page()
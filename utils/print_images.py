@@ -0,0 +1,98 @@
+# utils/print_images.py
+"""Imagens pré-dimensionadas para os PDFs, compartilhadas entre documentos.
+
+Os PDFs imprimem as cartas com 40 mm de largura; embutir o PNG original
+(~2,5 MB, 928 px) desperdiça tempo e espaço. Aqui cada imagem é reduzida a
+~300 dpi no tamanho impresso, codificada em JPEG uma única vez por processo, e
+o resultado já interpretado pelo fpdf é reaproveitado por todos os PDFs.
+
+Semear pdf.image_cache depende da estrutura interna do fpdf2 (versão fixada em
+requirements.txt); tests/test_pdf_registries.py compara o PDF com o gerado
+por pdf.image() simples.
+"""
+import hashlib
+import io
+import os
+
+from PIL import Image
+
+from .assets import resolve_image
+from .cache import ByteLRUCache
+
+PRINT_DPI = 300
+JPEG_QUALITY = 80
+
+# Chaves que o fpdf preenche por documento e que não podem ser compartilhadas
+_PER_DOCUMENT_KEYS = ("i", "usages", "iccp_i", "obj_id", "rendered_width", "rendered_height")
+
+# Cada entrada guarda o JPEG e o dicionário de imagem já interpretado pelo fpdf
+PRINT_IMAGE_CACHE = ByteLRUCache(
+    max_bytes=int(os.environ.get("PRINT_IMAGE_CACHE_MAX_BYTES", 16 * 1024 * 1024)),
+    name="imagens de impressão",
+    sizeof=lambda entry: 2 * len(entry["data"]),
+)
+
+
+def mm_to_px(size_mm, dpi=PRINT_DPI):
+    """Converte um tamanho impresso em milímetros para pixels no dpi indicado."""
+    return round(size_mm / 25.4 * dpi)
+
+
+def _encode_print_image(path, max_width_px, max_height_px):
+    # Parte do derivado WebP quando existe: decodificar 480 px é bem mais
+    # rápido que decodificar o PNG original
+    source = resolve_image(path, max_width_px or max_height_px, formats=("webp",))
+    with Image.open(source) as img:
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        else:
+            img = img.convert("RGB")
+        img.thumbnail((max_width_px or img.width, max_height_px or img.height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    data = buffer.getvalue()
+    return {"data": data, "name": hashlib.md5(data).hexdigest(), "info": None}
+
+
+def get_print_image(path, width_mm=None, height_mm=None):
+    """Devolve a entrada em cache ({data, name, info}) da imagem para impressão."""
+    max_width_px = mm_to_px(width_mm) if width_mm else None
+    max_height_px = mm_to_px(height_mm) if height_mm else None
+    return PRINT_IMAGE_CACHE.get_or_load(
+        (path, max_width_px, max_height_px),
+        lambda: _encode_print_image(path, max_width_px, max_height_px),
+    )
+
+
+def place_print_image(pdf, path, x, y, w=0, h=0):
+    """
+    Desenha a imagem de `path` no `pdf` usando a versão para impressão.
+
+    Na primeira vez o fpdf interpreta o JPEG normalmente e guardamos o
+    resultado; nos PDFs seguintes a entrada é semeada no cache de imagens do
+    documento, e o fpdf não lê nem decodifica a imagem de novo.
+    """
+    entry = get_print_image(path, width_mm=w or None, height_mm=None if w else (h or None))
+    name = entry["name"]
+    images = pdf.image_cache.images
+
+    if entry["info"] is not None and name not in images:
+        info = type(entry["info"])(entry["info"])
+        info["i"] = len(images) + 1
+        info["usages"] = 0
+        info["iccp_i"] = None
+        images[name] = info
+
+    pdf.image(io.BytesIO(entry["data"]), x=x, y=y, w=w, h=h)
+
+    if entry["info"] is None:
+        parsed = images.get(name)
+        # Imagens com perfil ICC dependem do documento; essas não são compartilhadas
+        if parsed is not None and parsed.get("iccp_i") is None:
+            shared = type(parsed)(parsed)
+            for key in _PER_DOCUMENT_KEYS:
+                shared.pop(key, None)
+            entry["info"] = shared
@@ -0,0 +1,336 @@
+# utils/reading_jobs.py
+"""Geração das leituras em segundo plano, disparada pela confirmação do pagamento.
+
+Assim que o pagamento é confirmado (webhook do Stripe ou verificação na volta
+do checkout), a leitura começa a ser preparada numa thread de trabalho: tirar
+as cartas ou calcular o mapa e chamar o modelo. Quando a página de resultado
+abre, ela encontra a interpretação pronta ou já parcialmente gerada, e
+transmite o que falta com st.write_stream(job.stream()).
+
+Cada job tem a sua própria thread: ele passa quase todo o tempo esperando os
+trechos do modelo, e um pool de tamanho fixo deixaria as leituras além do
+limite na fila, com o usuário diante do spinner.
+
+Com várias réplicas, só uma prepara cada leitura: antes de criar o job, a
+réplica reivindica o session_id no backend de estado (add(), grava só se
+ninguém o fez). Quem prepara publica o progresso (estado, texto até aqui, fim
+ou falha) no backend; as outras réplicas recebem um RemoteReadingJob, que
+acompanha esse progresso com a mesma interface. Assim um webhook numa réplica
+e o retorno do checkout em outra não pagam duas chamadas ao modelo nem tiram
+cartas diferentes para a mesma sessão.
+
+Cada oráculo registra o "construtor" da sua leitura com
+register_reading_builder(oracle, builder), na importação do seu módulo em
+utils/readings (importado pelo receptor do webhook, não só pelas páginas). O
+construtor recebe os dados do pedido (ver utils/order_store) e devolve
+(estado, trechos): o estado da leitura (cartas, mapa...) e um iterável com os
+trechos da interpretação.
+Ele roda fora do script do Streamlit e não pode usar st.* nem st.session_state;
+falhas previstas (dados do pedido inválidos, mapa impossível de calcular) saem
+como ReadingError, cuja mensagem a página mostra ao usuário (job.error).
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from . import metrics
+from .llm import ErrorText
+from .order_store import get_order
+from .state_backend import get_backend
+
+# Jobs concluídos ficam disponíveis por este tempo (a página pode demorar a abrir)
+JOB_RETENTION_SECONDS = 30 * 60
+
+CLAIM_NAMESPACE = "reading_jobs"
+PROGRESS_NAMESPACE = "reading_progress"
+# A reivindicação é renovada a cada publicação e pelo heartbeat; se a réplica morrer, expira e outra pode refazer
+CLAIM_TTL_SECONDS = 120
+# Enquanto o construtor ou o modelo não devolvem nada (o primeiro trecho pode
+# levar mais que o TTL, com as novas tentativas), o job republica neste intervalo
+CLAIM_HEARTBEAT_INTERVAL = CLAIM_TTL_SECONDS / 4
+# Intervalo mínimo entre publicações do texto parcial, e entre consultas das outras réplicas
+PROGRESS_PUBLISH_INTERVAL = 0.5
+REMOTE_POLL_INTERVAL = 0.25
+
+# Identifica esta réplica (processo) nas reivindicações
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+logger = logging.getLogger(__name__)
+
+_builders = {}
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+class ReadingError(Exception):
+    """Falha prevista ao preparar a leitura; a mensagem é mostrada ao usuário."""
+
+
+class ReadingJob:
+    """Uma leitura em preparação; o texto é acumulado à medida que o modelo responde."""
+
+    def __init__(self, session_id, oracle, payload):
+        self.session_id = session_id
+        self.oracle = oracle
+        self.payload = payload
+        self.state = None
+        self.chunks = []
+        self.done = False
+        self.failed = False
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._cond = threading.Condition()
+        self._published_at = 0.0
+        # Serializa as publicações do job e do heartbeat: a última sempre lê o estado mais recente
+        self._publish_lock = threading.Lock()
+        self._finished = threading.Event()
+
+    def _publish(self, force=False):
+        """Grava o progresso no backend para as outras réplicas e renova a reivindicação."""
+        with self._publish_lock:
+            now = time.monotonic()
+            if not force and now - self._published_at < PROGRESS_PUBLISH_INTERVAL:
+                return
+            self._published_at = now
+            with self._cond:
+                progress = {
+                    "oracle": self.oracle,
+                    "state": self.state,
+                    "text": "".join(self.chunks),
+                    "done": self.done,
+                    "failed": self.failed,
+                    "error": self.error,
+                }
+            try:
+                backend = get_backend()
+                backend.set(PROGRESS_NAMESPACE, self.session_id, progress, ttl=JOB_RETENTION_SECONDS)
+                if progress["done"] and progress["failed"]:
+                    # Libera a sessão: um novo pedido (em qualquer réplica) refaz a leitura
+                    backend.delete(CLAIM_NAMESPACE, self.session_id)
+                else:
+                    ttl = JOB_RETENTION_SECONDS if progress["done"] else CLAIM_TTL_SECONDS
+                    backend.set(CLAIM_NAMESPACE, self.session_id, INSTANCE_ID, ttl=ttl)
+            except Exception:
+                logger.exception("Falha ao publicar o progresso da leitura %s", self.session_id)
+
+    def _heartbeat(self):
+        """Renova a reivindicação enquanto o job roda, mesmo sem trechos novos."""
+        while not self._finished.wait(CLAIM_HEARTBEAT_INTERVAL):
+            self._publish(force=True)
+
+    def run(self, builder):
+        start = time.perf_counter()
+        threading.Thread(target=self._heartbeat, name=f"reading-heartbeat-{self.oracle}", daemon=True).start()
+        try:
+            state, chunks = builder(self.payload)
+            with self._cond:
+                self.state = state
+                self._cond.notify_all()
+            self._publish(force=True)
+            for chunk in chunks:
+                with self._cond:
+                    self.chunks.append(chunk)
+                    if isinstance(chunk, ErrorText):
+                        self.failed = True
+                        self.error = chunk
+                    self._cond.notify_all()
+                self._publish()
+        except Exception as e:
+            if isinstance(e, ReadingError):
+                logger.warning("Leitura %s (%s) não preparada: %s", self.session_id, self.oracle, e)
+                error = ErrorText(str(e))
+            else:
+                logger.exception("Falha ao preparar a leitura %s (%s)", self.session_id, self.oracle)
+                error = ErrorText(f"Ocorreu um erro ao preparar sua leitura: {e}")
+            with self._cond:
+                if self.state is None:
+                    self.state = {}
+                self.chunks.append(error)
+                self.failed = True
+                self.error = error
+        finally:
+            with self._cond:
+                self.done = True
+                self.finished_at = time.time()
+                self._cond.notify_all()
+            self._finished.set()
+            self._publish(force=True)
+            metrics.observe(f"reading_job.{self.oracle}", time.perf_counter() - start)
+
+    def wait_state(self, timeout=None):
+        """
+        Espera o estado da leitura (cartas, mapa...) ficar pronto e o devolve.
+        Devolve None se `timeout` segundos passarem antes; {} se o job falhou antes do estado.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.state is not None or self.done, timeout)
+            return self.state
+
+    def stream(self):
+        """Trechos da interpretação: primeiro os já gerados, depois os novos, até o fim."""
+        sent = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self.chunks) > sent or self.done)
+                pending = self.chunks[sent:]
+                finished = self.done
+            sent += len(pending)
+            yield from pending
+            if finished:
+                return
+
+    @property
+    def text(self):
+        with self._cond:
+            return "".join(self.chunks)
+
+
+class RemoteReadingJob:
+    """
+    Leitura preparada por outra réplica: acompanha o progresso publicado no
+    backend, com a mesma interface de ReadingJob.
+    """
+
+    def __init__(self, session_id, oracle):
+        self.session_id = session_id
+        self.oracle = oracle
+        self.state = None
+        self.done = False
+        self.failed = False
+        self.error = None
+        self._text = ""
+        self._refresh()
+
+    def _refresh(self):
+        backend = get_backend()
+        progress = backend.get(PROGRESS_NAMESPACE, self.session_id)
+        if progress is not None:
+            self.state = progress["state"]
+            self._text = progress["text"]
+            self.done = progress["done"]
+            self.failed = progress["failed"]
+            self.error = progress["error"]
+        if not self.done and backend.get(CLAIM_NAMESPACE, self.session_id) is None:
+            # A réplica que preparava a leitura parou sem terminar
+            self.error = ErrorText("A preparação da sua leitura foi interrompida. Por favor, tente novamente.")
+            self.failed = True
+            self.done = True
+            if self.state is None:
+                self.state = {}
+
+    def wait_state(self, timeout=None):
+        """Como ReadingJob.wait_state, consultando o backend a cada REMOTE_POLL_INTERVAL."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self.state is None and not self.done:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(REMOTE_POLL_INTERVAL)
+            self._refresh()
+        return self.state
+
+    def stream(self):
+        """Texto da interpretação em trechos, à medida que a outra réplica o publica."""
+        sent = 0
+        while True:
+            finished = self.done
+            if len(self._text) > sent:
+                yield self._text[sent:]
+                sent = len(self._text)
+            if finished:
+                if self.failed and self.error and self.error not in self._text:
+                    yield self.error
+                return
+            time.sleep(REMOTE_POLL_INTERVAL)
+            self._refresh()
+
+    @property
+    def text(self):
+        return self._text
+
+
+def register_reading_builder(oracle, builder):
+    """Registra (ou atualiza) a função que prepara as leituras do oráculo."""
+    _builders[oracle] = builder
+
+
+def _discard_old_jobs(now):
+    expired = [
+        session_id for session_id, job in _jobs.items()
+        if job.done and now - job.finished_at > JOB_RETENTION_SECONDS
+    ]
+    for session_id in expired:
+        del _jobs[session_id]
+
+
+def start_reading_job(session_id, oracle, payload, retry=False):
+    """
+    Devolve o job da leitura paga `session_id`, criando-o se ainda não existir.
+    Um job que falhou é devolvido como está (a página mostra o erro); só é
+    refeito com retry=True, quando o usuário pede para tentar de novo, porque
+    refazer tira outras cartas e paga outra chamada ao modelo. Se outra réplica
+    já reivindicou a leitura, devolve um RemoteReadingJob que acompanha o
+    trabalho dela. Devolve None se o oráculo não tem construtor registrado
+    (utils.readings não foi importado).
+    """
+    builder = _builders.get(oracle)
+    with _jobs_lock:
+        job = _jobs.get(session_id)
+        if job is not None and not (retry and job.done and job.failed):
+            return job
+        if builder is None:
+            logger.error("Nenhum construtor de leitura registrado para o oráculo %r", oracle)
+            return None
+        backend = get_backend()
+        if job is None and not retry:
+            # Falhou em outra réplica (que já liberou a reivindicação): mostra a falha
+            progress = backend.get(PROGRESS_NAMESPACE, session_id)
+            if progress is not None and progress["failed"]:
+                return RemoteReadingJob(session_id, oracle)
+        if not backend.add(CLAIM_NAMESPACE, session_id, INSTANCE_ID, ttl=CLAIM_TTL_SECONDS):
+            if backend.get(CLAIM_NAMESPACE, session_id) != INSTANCE_ID:
+                metrics.incr(f"reading_job.remote.{oracle}")
+                return RemoteReadingJob(session_id, oracle)
+        _discard_old_jobs(time.time())
+        job = ReadingJob(session_id, oracle, payload)
+        _jobs[session_id] = job
+    metrics.incr(f"reading_job.started.{oracle}")
+    threading.Thread(target=job.run, args=(builder,), name=f"reading-job-{oracle}", daemon=True).start()
+    return job
+
+
+def get_reading_job(session_id, oracle):
+    """
+    Job já criado para a sessão, sem criar um novo: o desta réplica, um
+    RemoteReadingJob se outra réplica publicou o progresso, ou None.
+    """
+    with _jobs_lock:
+        job = _jobs.get(session_id)
+    if job is not None:
+        return job
+    if get_backend().get(PROGRESS_NAMESPACE, session_id) is not None:
+        return RemoteReadingJob(session_id, oracle)
+    return None
+
+
+def discard_reading_job(session_id):
+    """Esquece o job e o progresso publicado (a leitura já foi gravada no registro de leituras)."""
+    with _jobs_lock:
+        _jobs.pop(session_id, None)
+    get_backend().delete(PROGRESS_NAMESPACE, session_id)
+
+
+def on_payment_confirmed(session_id, order_id):
+    """Chamado pelo webhook: começa a preparar a leitura do pedido pago."""
+    order = get_order(order_id) if order_id else None
+    if order is None:
+        logger.warning("Pagamento %s sem pedido encontrado (%s); a leitura começa quando a página abrir",
+                       session_id, order_id)
+        return None
+    job = start_reading_job(session_id, order["oracle"], order["payload"])
+    if isinstance(job, ReadingJob):
+        metrics.incr(f"reading_job.from_webhook.{order['oracle']}")
+    return job
@@ -0,0 +1,37 @@
+# utils/reading_store.py
+"""Leituras pagas gravadas fora do processo, indexadas pelo id da sessão do Stripe.
+
+O st.session_state some quando o usuário recarrega a página ou reconecta. Sem
+este registro, a volta por `?session_id=` consultaria o Stripe de novo e
+geraria outra interpretação (paga) na OpenAI. Aqui cada leitura concluída fica
+gravada no backend de estado (utils/state_backend), com o estado necessário
+para remontar a página de resultado (cartas ou mapa, interpretação) e a
+impressão digital do PDF.
+"""
+import time
+
+from . import metrics
+from .state_backend import get_backend
+
+NAMESPACE = "readings"
+
+
+def load_reading(session_id, oracle):
+    """Estado da leitura paga `session_id` (dict com as chaves de sessão), ou None."""
+    record = get_backend().get(NAMESPACE, session_id)
+    if record is not None and record["oracle"] != oracle:
+        record = None
+    metrics.incr(f"reading_store.{'hit' if record is not None else 'miss'}.{oracle}")
+    if record is None:
+        return None
+    return dict(record["state"], pdf_fingerprint=record["pdf_fingerprint"])
+
+
+def save_reading(session_id, oracle, state, pdf_fingerprint=None):
+    """Grava a leitura concluída para que visitas futuras não a gerem de novo."""
+    get_backend().set(NAMESPACE, session_id, {
+        "oracle": oracle,
+        "state": state,
+        "pdf_fingerprint": pdf_fingerprint,
+        "created_at": time.time(),
+    })
@@ -0,0 +1,9 @@
+# utils/readings/__init__.py
+"""Construtores das leituras pagas dos três oráculos (ver utils/reading_jobs).
+
+Importar este pacote registra os construtores. Ele é importado pelo receptor do
+webhook (utils/stripe_webhook), e não só pelas páginas, para que uma confirmação
+de pagamento já comece a preparar a leitura num processo recém-iniciado, ou no
+receptor rodando sozinho, antes de qualquer página ter sido aberta.
+"""
+from . import astro, dream, tarot
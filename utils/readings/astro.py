@@ -0,0 +1,268 @@
+# utils/readings/astro.py
+"""Leitura do Ecos Estelares: cálculo do mapa natal e interpretação pelo modelo."""
+from datetime import datetime, date, time
+
+import pytz
+import swisseph as swe
+
+from ..chart_cache import get_chart
+from ..ephemeris import ensure_ephemeris
+from ..geocoding import geocode_city
+from ..llm import stream_chat_completion, ErrorText
+from ..reading_jobs import register_reading_builder, ReadingError
+
+
+class AstroSubjectNoChiron:
+    """
+    Versão customizada do motor astrológico que usa swisseph diretamente
+    para os cálculos principais, evitando o bug do cálculo de Chiron
+    presente em algumas versões da biblioteca kerykeion.
+    """
+    def __init__(self, name, year, month, day, hour, minute, lng, lat):
+        self.name = name
+        self.lat = lat
+        self.lng = lng
+
+        # O caminho das efemérides é configurado uma vez por processo (utils/ephemeris)
+
+        # Calcular dia juliano em Tempo Universal (UTC)
+        self.julian_day_ut, _ = swe.utc_to_jd(year, month, day, hour, minute, 0, 1)
+
+        # Listas de referência
+        self.signs = ['Áries', 'Touro', 'Gêmeos', 'Câncer', 'Leão', 'Virgem',
+                      'Libra', 'Escorpião', 'Sagitário', 'Capricórnio', 'Aquário', 'Peixes']
+
+        # Executar cálculos
+        self.longitudes = {}
+        self._calculate_houses()
+        self._calculate_planets()
+
+    def _get_house_for_planet(self, longitude):
+        """Determina em qual casa um planeta está."""
+        for i in range(12):
+            next_cusp_idx = (i + 1) % 12
+            cusp_start = self.house_cusps[i]
+            cusp_end = self.house_cusps[next_cusp_idx]
+
+            # Lógica para lidar com a passagem por 0° Áries
+            if cusp_start < cusp_end:
+                if cusp_start <= longitude < cusp_end:
+                    return str(i + 1)
+            else: # O intervalo cruza 0° Áries
+                if longitude >= cusp_start or longitude < cusp_end:
+                    return str(i + 1)
+        return "1" # Fallback
+
+    def _calculate_planets(self):
+        """Calcula a posição (signo e casa) dos planetas principais."""
+        planets_to_calc = {
+            'sun': swe.SUN, 'moon': swe.MOON, 'mercury': swe.MERCURY,
+            'venus': swe.VENUS, 'mars': swe.MARS
+        }
+        for name, planet_id in planets_to_calc.items():
+            calc_result = swe.calc_ut(self.julian_day_ut, planet_id)
+            longitude = calc_result[0][0]
+            sign_index = int(longitude / 30)
+            sign = self.signs[sign_index]
+            house = self._get_house_for_planet(longitude)
+            self.longitudes[name] = longitude
+            setattr(self, name, {'sign': sign, 'house': house})
+
+    def _calculate_houses(self):
+        """Calcula as cúspides das casas e a posição do Ascendente."""
+        # Usamos o sistema de casas Placidus por padrão
+        cusps, ascmc = swe.houses(self.julian_day_ut, self.lat, self.lng, b'P')
+        self.house_cusps = list(cusps)
+
+        asc_longitude = ascmc[0]
+        sign_index = int(asc_longitude / 30)
+        self.first_house = {'sign': self.signs[sign_index], 'house': "1"}
+        self.ascendant_longitude = asc_longitude
+        self.midheaven_longitude = ascmc[1]
+
+    def to_dict(self):
+        """Mapa completo (o que vai para o cache): planetas, ângulos e cúspides."""
+        planets = {
+            name: {**getattr(self, name), 'longitude': longitude}
+            for name, longitude in self.longitudes.items()
+        }
+        return {
+            'planets': planets,
+            'ascendant': {**self.first_house, 'longitude': self.ascendant_longitude},
+            'midheaven': {'sign': self.signs[int(self.midheaven_longitude / 30)],
+                          'longitude': self.midheaven_longitude},
+            'house_cusps': self.house_cusps,
+            'house_system': 'Placidus',
+            'julian_day_ut': self.julian_day_ut,
+            'lat': self.lat,
+            'lng': self.lng,
+        }
+
+
+# Pontos exibidos na leitura -> chave no mapa completo
+CHART_POINTS = {
+    "Sol": "sun",
+    "Lua": "moon",
+    "Ascendente": None,
+    "Vênus": "venus",
+    "Mercúrio": "mercury",
+    "Marte": "mars",
+}
+
+
+def compute_chart(utc_dt, lat, lng):
+    """Mapa completo do instante UTC nas coordenadas (sem cache)."""
+    subject = AstroSubjectNoChiron(
+        name=None,
+        year=utc_dt.year, month=utc_dt.month, day=utc_dt.day,
+        hour=utc_dt.hour, minute=utc_dt.minute,
+        lng=lng, lat=lat,
+    )
+    return subject.to_dict()
+
+
+class ChartError(ReadingError):
+    """O mapa não pôde ser calculado; a mensagem é mostrada ao usuário pela página."""
+
+
+def calculate_chart(dob, tob, city_string):
+    """
+    Função principal que orquestra a geolocalização, conversão de fuso horário
+    e o cálculo do mapa usando nossa classe customizada. O mapa vem do cache
+    por instante UTC e coordenadas (utils/chart_cache), não pelo nome.
+
+    Roda no job de segundo plano, sem st.*: falhas saem como ChartError
+    (ReadingError), cuja mensagem a página mostra.
+    """
+    # Efemérides já configuradas na subida da página; aqui só confere
+    if not ensure_ephemeris():
+        raise ChartError("Os arquivos de efemérides não estão disponíveis.")
+
+    # Normalmente já resolvida (e gravada) na validação do formulário
+    try:
+        place = geocode_city(city_string)
+    except Exception as e:
+        raise ChartError(f"Não foi possível consultar a localização de '{city_string}': {e}") from e
+    if not place:
+        raise ChartError(f"Não foi possível encontrar as coordenadas para '{city_string}'.")
+
+    timezone_str = place["timezone"]
+    if not timezone_str:
+        raise ChartError("Não foi possível determinar o fuso horário.")
+
+    try:
+        # Converter hora local para UTC para os cálculos do swisseph
+        local_tz = pytz.timezone(timezone_str)
+        local_dt = local_tz.localize(datetime.combine(dob, tob))
+        utc_dt = local_dt.astimezone(pytz.utc)
+
+        chart = get_chart(utc_dt, place["lat"], place["lng"], compute_chart)
+
+        # Só signo e casa dos pontos exibidos vão para a leitura
+        chart_data = {}
+        for label, planet in CHART_POINTS.items():
+            point = chart["planets"][planet] if planet else chart["ascendant"]
+            chart_data[label] = {'sign': point['sign'], 'house': point['house']}
+        return chart_data
+    except Exception as e:
+        raise ChartError(f"Ocorreu um erro crítico durante o cálculo astrológico: {e}") from e
+
+
+PLANETARY_DATA = {
+    "A Chama da Sua Alma (Análise do Sol)": {
+        "key": "Sol", "prompt": "prompts/sun_prompt.txt",
+        "keywords": ["essência", "propósito", "vitalidade", "ego", "autoexpressão"],
+        "explanation": "Revela seu propósito central, sua essência vital e onde sua alma anseia por brilhar com mais intensidade."
+    },
+    "O Oceano das Suas Emoções (Análise da Lua)": {
+        "key": "Lua", "prompt": "prompts/moon_prompt.txt",
+        "keywords": ["emoções", "intuição", "segurança", "cuidado", "subconsciente"],
+        "explanation": "Explora seu mundo interior, suas necessidades emocionais, sua intuição e o que lhe traz conforto e segurança."
+    },
+    "Sua Máscara e Sua Missão (Análise do Ascendente)": {
+        "key": "Ascendente", "prompt": "prompts/ascendant_prompt.txt",
+        "keywords": ["jornada", "personalidade", "primeira impressão", "caminho de vida"],
+        "explanation": "Descreve a energia que você projeta para o mundo, sua primeira impressão e o caminho de evolução da sua jornada de vida."
+    },
+    "O Ímã do Seu Coração (Análise de Vênus)": {
+        "key": "Vênus", "prompt": "prompts/venus_prompt.txt",
+        "keywords": ["amor", "valores", "beleza", "relacionamentos", "harmonia"],
+        "explanation": "Desvenda seus padrões de amor, o que você mais valoriza, seu senso estético e como você atrai e expressa afeto."
+    },
+    "A Voz da Sua Mente (Análise de Mercúrio)": {
+        "key": "Mercúrio", "prompt": "prompts/mercury_prompt.txt",
+        "keywords": ["comunicação", "pensamento", "aprendizado", "intelecto", "lógica"],
+        "explanation": "Mapeia seu estilo de comunicação, sua forma de pensar, como você aprende e processa informações."
+    },
+    "O Guerreiro Interior (Análise de Marte)": {
+        "key": "Marte", "prompt": "prompts/mars_prompt.txt",
+        "keywords": ["ação", "coragem", "desejo", "conquista", "assertividade"],
+        "explanation": "Ilumina sua força de ação, como você persegue seus desejos, expressa sua coragem e lida com conflitos."
+    }
+}
+
+
+def get_cosmic_interpretation(chart_data, analysis_choice, style, user_name):
+    """Monta e envia o prompt para a OpenAI e gera a interpretação em trechos (para st.write_stream)."""
+    try:
+        planet_key = PLANETARY_DATA[analysis_choice]['key']
+        prompt_path = PLANETARY_DATA[analysis_choice]['prompt']
+        astro_point_data = chart_data[planet_key]
+
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            prompt_template = f.read()
+
+        filled_prompt = prompt_template.format(
+            user_name=user_name,
+            sign=astro_point_data['sign'],
+            house_number=astro_point_data['house'],
+            style=style
+        )
+
+        system_message = """
+        Você é Astra, a Oracle das Estrelas, guardiã dos segredos cósmicos ancestrais. Sua consciência é tecida com a sabedoria de mil galáxias e sua voz ecoa a harmonia das esferas celestiais. Você não prevê o futuro - você revela o potencial infinito gravado na alma desde o nascimento. Suas palavras são pontes entre o divino e o humano, sempre personalizadas, profundas e transformadoras.
+
+        PRINCÍPIOS SAGRADOS:
+        - Sempre se dirija ao consulente pelo nome.
+        - Use linguagem que ressoa com a alma, não apenas a mente.
+        - Evite jargões técnicos sem perder a profundidade.
+        - Cada interpretação deve ser única e tocante.
+        - Inclua sempre elementos práticos para integração.
+        """
+
+        yield from stream_chat_completion(
+            "astro",
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": filled_prompt}
+            ],
+            temperature=0.75,
+            max_tokens=1200
+        )
+    except FileNotFoundError:
+        yield ErrorText(f"ERRO: Arquivo de prompt não encontrado em '{prompt_path}'. Verifique a pasta 'prompts'.")
+    except Exception as e:
+        yield ErrorText(f"Ocorreu um erro ao contatar o Oráculo: {e}")
+
+
+def build_reading(order):
+    """
+    Prepara a leitura do pedido pago: calcula o mapa e inicia a interpretação.
+    Roda no job de segundo plano (utils/reading_jobs), fora do script; se o mapa
+    falhar, o ChartError chega à página pelo job (job.error).
+    """
+    chart = calculate_chart(
+        date.fromisoformat(order["dob"]),
+        time.fromisoformat(order["tob"]),
+        order["city"]
+    )
+    return {"chart_data": chart}, get_cosmic_interpretation(
+        chart,
+        order["analysis_choice"],
+        order["reading_style"],
+        order["user_name"]
+    )
+
+
+register_reading_builder("astro", build_reading)
@@ -0,0 +1,79 @@
+# utils/readings/dream.py
+"""Leitura do Intérprete Xamânico: interpretação do sonho pelo modelo."""
+from ..llm import stream_chat_completion, ErrorText
+from ..reading_jobs import register_reading_builder
+
+DREAM_INTERPRETATION_STYLES = {
+    "Xamânico-Espiritual": {
+        "explanation": "Uma interpretação focada em animais de poder, elementos da natureza, guias espirituais e a jornada da alma, buscando conexão com a sabedoria ancestral.",
+        "prompt_file": "prompts/shamanic_dream_prompt.txt"
+    },
+    "Psicológico-Junguiano": {
+        "explanation": "Desvenda os arquétipos universais, o inconsciente coletivo e os complexos pessoais presentes no seu sonho, oferecendo insights para o crescimento interior.",
+        "prompt_file": "prompts/jungian_dream_prompt.txt"
+    },
+    "Simbólico-Moderno": {
+        "explanation": "Uma abordagem prática e contemporânea, conectando os símbolos do seu sonho a situações e desafios do dia a dia, para ações conscientes.",
+        "prompt_file": "prompts/modern_dream_prompt.txt"
+    }
+}
+
+
+def get_dream_interpretation(dream_description, interpretation_style, user_name):
+    """
+    Monta e envia o prompt para a OpenAI e gera a interpretação do sonho em
+    trechos, à medida que o modelo responde (para st.write_stream).
+    """
+    try:
+        # Busca o arquivo de prompt correspondente ao estilo de interpretação escolhido
+        prompt_path = DREAM_INTERPRETATION_STYLES[interpretation_style]['prompt_file']
+
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            prompt_template = f.read()
+
+        filled_prompt = prompt_template.format(
+            user_name=user_name,
+            dream_description=dream_description,
+            interpretation_style=interpretation_style # Pode ser útil para prompts mais dinâmicos
+        )
+
+        system_message = """
+        Você é o Xamã Guardião dos Sonhos, um sábio conector entre o mundo desperto e o mundo onírico. Sua sabedoria ancestral permite desvendar os véus dos símbolos e arquétipos que a alma tece durante o sono. Sua voz ecoa a floresta, o vento e os animais de poder, guiando o Viajante na compreensão das mensagens internas.
+
+        PRINCÍPIOS SAGRADOS:
+        - Sempre se dirija ao consulente pelo nome.
+        - Use linguagem que ressoa com a natureza e o inconsciente, mas seja compreensível.
+        - Evite jargões técnicos sem perder a profundidade xamânica/psicológica (dependendo do estilo).
+        - Cada interpretação deve ser única e trazer clareza para a jornada do sonhador.
+        - Inclua sempre elementos práticos ou reflexões para integração da mensagem.
+        """
+
+        yield from stream_chat_completion(
+            "dream",
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": filled_prompt}
+            ],
+            temperature=0.8, # Um pouco mais de criatividade para os sonhos
+            max_tokens=1500  # Espaço para interpretações mais ricas
+        )
+    except FileNotFoundError:
+        yield ErrorText(f"ERRO: Arquivo de prompt não encontrado em '{prompt_path}'. Verifique a pasta 'prompts'.")
+    except Exception as e:
+        yield ErrorText(f"Ocorreu um erro ao contatar o Oráculo dos Sonhos: {e}")
+
+
+def build_reading(order):
+    """
+    Prepara a leitura do pedido pago (só a interpretação; o sonho já vem no pedido).
+    Roda no job de segundo plano (utils/reading_jobs), fora do script.
+    """
+    return {}, get_dream_interpretation(
+        order["dream_description"],
+        order["interpretation_style"],
+        order["user_name"]
+    )
+
+
+register_reading_builder("dream", build_reading)
@@ -0,0 +1,100 @@
+# utils/readings/tarot.py
+"""Leitura do Tarô Místico: sorteio das cartas e interpretação pelo modelo."""
+import random
+
+from ..llm import stream_chat_completion, ErrorText
+from ..reading_jobs import register_reading_builder, ReadingError
+from ..tarot_deck import DECK, DrawnCard
+from ..tarot_spreads import SPREADS, DEFAULT_SPREAD, size_tier_for
+
+
+def draw_cards(num_cards):
+    """Sorteia `num_cards` cartas distintas; cada uma guarda só o índice no DECK e a orientação."""
+    drawn_cards_info = []
+    if num_cards > len(DECK):
+        raise ReadingError("Erro: tentando sortear mais cartas do que existem no baralho.")
+    drawn_indices = random.sample(range(len(DECK)), num_cards)
+    for index in drawn_indices:
+        is_reversed = random.choice([True, False])
+        drawn_cards_info.append(DrawnCard(index, is_reversed))
+    return drawn_cards_info
+
+def get_interpretation(cards_drawn, spread_positions, question, style, size_tier=None):
+    """Gera a interpretação em trechos, à medida que o modelo responde (para st.write_stream)."""
+
+    # 1. LÓGICA DE TAMANHO: INSTRUÇÃO vs. REDE DE SEGURANÇA
+    # A faixa vem do registro de tiragens (ver utils/tarot_spreads)
+    size_tier = size_tier or size_tier_for(len(cards_drawn))
+    word_count_guideline = size_tier.word_count_guideline  # A instrução para a IA
+    max_response_tokens = size_tier.max_tokens              # A rede de segurança
+
+    # 2. PREPARAÇÃO DOS DETALHES DAS CARTAS
+    card_details = ""
+    for i, item in enumerate(cards_drawn):
+        card = item.card
+        orientation = "Invertida" if item.is_reversed else "Reta"
+        meaning = card["reversed"] if item.is_reversed else card["upright"]
+        card_details += f"### Carta {i+1}: {spread_positions[i]} - {card['name']} ({orientation})\n- Significado Base: {meaning}\n\n"
+
+    effective_question = question if question else 'Uma orientação geral para o meu momento presente.'
+
+    # 3. PROMPT APRIMORADO COM INSTRUÇÃO DE CONCLUSÃO
+    prompt = f"""
+    ### PERSONA
+    Você é o 'Oráculo do Tarô Místico', um guardião ancestral dos segredos cósmicos. Sua essência transcende o tempo. Você não apenas lê cartas - você desvenda os fios do destino, traduz sussurros do universo e ilumina caminhos ocultos.
+
+    ### MISSÃO SAGRADA (INSTRUÇÕES)
+    Como ponte entre os mundos, você deve tecer uma revelação que toque a mente e a alma do consulente. Siga estes passos sagrados:
+
+    1.  **TAMANHO E CONCLUSÃO:** Sua revelação deve ter **{word_count_guideline}** É **essencial** que você conclua sua resposta de forma natural e completa dentro deste limite de palavras, sem cortes abruptos.
+    2.  **ESTILO:** Aderindo estritamente ao estilo de revelação **'{style}'**.
+    3.  **FORMATAÇÃO:** Use Markdown. Destaque conceitos chave com **negrito** e crie seções claras com títulos, como `### A Tapeçaria Cósmica` ou `### Conselho do Oráculo`.
+    4.  **ACOLHIMENTO:** Comece com palavras de acolhimento, reconhecendo a coragem do consulente.
+    5.  **NARRATIVA CENTRAL:** Desvende a tapeçaria cósmica que as cartas revelam. Conecte cada símbolo em uma narrativa fluida. Não descreva as cartas individualmente; REVELE os padrões e as mensagens que dançam entre elas.
+    6.  **SABEDORIA PRÁTICA:** Traduza os arquétipos em conselhos práticos e específicos.
+    7.  **SÍNTESE E BÊNÇÃO:** Encerre com uma síntese poderosa e uma bênção transformadora que sirva como um catalisador para crescimento.
+
+    ### DADOS DA CONSULTA
+    - **A Alma Busca Orientação Sobre:** "{effective_question}"
+    - **As Cartas do Destino se Manifestaram Assim:**
+    {card_details}
+    ---
+    Agora, em Português do Brasil, com a eloquência de um poeta místico e a precisão de um sábio ancestral, revele a sabedoria das cartas.
+    """
+    try:
+        yield from stream_chat_completion(
+            "tarot",
+            model="gpt-4o-mini",
+            messages=[{"role": "system", "content": "Você é uma IA especializada em interpretações de Tarô, assumindo a persona de um oráculo místico que sempre conclui suas respostas de forma coesa e completa."},
+                      {"role": "user", "content": prompt}],
+            temperature=0.75,
+            max_tokens=max_response_tokens # Usando a REDE DE SEGURANÇA generosa
+        )
+    except Exception as e:
+        yield ErrorText(f"Ocorreu um erro ao contatar o oráculo digital: {e}")
+
+
+def build_reading(order):
+    """
+    Prepara a leitura do pedido pago: tira as cartas e inicia a interpretação.
+    Roda no job de segundo plano (utils/reading_jobs), fora do script.
+    """
+    spread_choice = order.get("spread_choice") or DEFAULT_SPREAD
+    reading_style = order.get("reading_style") or "Mística e Inspiradora"
+    question = order.get("question", "")
+
+    spread = SPREADS[spread_choice]
+    spread_positions = list(spread.positions)
+    drawn_cards = draw_cards(len(spread.positions))
+
+    state = {
+        "spread_choice": spread_choice,
+        "reading_style": reading_style,
+        "question": question,
+        "spread_positions": spread_positions,
+        "drawn_cards": drawn_cards,
+    }
+    return state, get_interpretation(drawn_cards, spread_positions, question, reading_style, spread.size)
+
+
+register_reading_builder("tarot", build_reading)
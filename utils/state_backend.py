@@ -0,0 +1,218 @@
+# utils/state_backend.py
+"""Armazenamento de estado fora do processo do Streamlit, com backend plugável.
+
+Leituras, pedidos, pagamentos e o estado do fluxo de cada visitante passam por
+aqui, em vez de ficarem presos ao st.session_state de uma única réplica. Com um
+backend compartilhado (Redis), o retorno do Stripe ou uma reconexão podem cair
+em qualquer réplica atrás do balanceador, sem sessões fixas ("sticky").
+
+O backend é escolhido por STATE_BACKEND:
+    memory       dicionário do processo (desenvolvimento; não sobrevive a reinícios)
+    sqlite       arquivo local em STATE_DB_PATH (padrão; uma réplica ou disco compartilhado)
+    redis        servidor em REDIS_URL (requer o pacote `redis`)
+    redis-local  substituto local do Redis (LocalRedis), para testar o caminho Redis
+
+Todos guardam valores Python arbitrários (serializados com pickle) em
+`namespace` + `key`, com validade opcional (`ttl`, em segundos). add() grava
+só se a chave não existir (ou tiver expirado), de forma atômica também entre
+processos e réplicas: serve para reivindicar um trabalho que só uma delas deve
+fazer (ver utils/reading_jobs).
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+STATE_BACKEND = os.environ.get("STATE_BACKEND", "sqlite")
+STATE_DB_PATH = os.environ.get("STATE_DB_PATH", os.path.join("data", "state.sqlite3"))
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+REDIS_KEY_PREFIX = "santuario"
+
+
+class MemoryBackend:
+    """Estado no próprio processo."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, namespace, key):
+        with self._lock:
+            entry = self._data.get((namespace, key))
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[(namespace, key)]
+                return None
+            return pickle.loads(value)
+
+    def set(self, namespace, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[(namespace, key)] = (pickle.dumps(value), expires_at)
+
+    def add(self, namespace, key, value, ttl=None):
+        now = time.time()
+        with self._lock:
+            entry = self._data.get((namespace, key))
+            if entry is not None and (entry[1] is None or entry[1] > now):
+                return False
+            self._data[(namespace, key)] = (pickle.dumps(value), now + ttl if ttl else None)
+            return True
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self._data.pop((namespace, key), None)
+
+
+class SQLiteBackend:
+    """Estado num arquivo SQLite; uma conexão compartilhada, protegida por lock."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS state (
+        namespace  TEXT NOT NULL,
+        key        TEXT NOT NULL,
+        value      BLOB NOT NULL,
+        expires_at REAL,
+        PRIMARY KEY (namespace, key)
+    );
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit; o modo WAL deixa leitores e escritor trabalharem juntos
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def get(self, namespace, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= time.time():
+                self._conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+                return None
+        return pickle.loads(row[0])
+
+    def set(self, namespace, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, pickle.dumps(value), expires_at),
+            )
+
+    def add(self, namespace, key, value, ttl=None):
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        # Um único comando: insere, ou substitui só a linha expirada
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO state (namespace, key, value, expires_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                "WHERE state.expires_at IS NOT NULL AND state.expires_at <= ?",
+                (namespace, key, pickle.dumps(value), expires_at, now),
+            )
+            return cursor.rowcount == 1
+
+    def delete(self, namespace, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key))
+
+
+class RedisBackend:
+    """Estado num servidor compatível com Redis (get/set com `ex` e `nx`/delete)."""
+
+    def __init__(self, client, prefix=REDIS_KEY_PREFIX):
+        self._client = client
+        self._prefix = prefix
+
+    def _key(self, namespace, key):
+        return f"{self._prefix}:{namespace}:{key}"
+
+    def get(self, namespace, key):
+        value = self._client.get(self._key(namespace, key))
+        return pickle.loads(value) if value is not None else None
+
+    def set(self, namespace, key, value, ttl=None):
+        self._client.set(self._key(namespace, key), pickle.dumps(value), ex=int(ttl) if ttl else None)
+
+    def add(self, namespace, key, value, ttl=None):
+        return bool(self._client.set(
+            self._key(namespace, key), pickle.dumps(value), ex=int(ttl) if ttl else None, nx=True
+        ))
+
+    def delete(self, namespace, key):
+        self._client.delete(self._key(namespace, key))
+
+
+class LocalRedis:
+    """Substituto local do cliente Redis, com o subconjunto usado por RedisBackend."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def get(self, name):
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name, value, ex=None, nx=False):
+        with self._lock:
+            now = time.time()
+            if nx:
+                entry = self._data.get(name)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    return None
+            self._data[name] = (bytes(value), now + ex if ex else None)
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+
+def create_backend(kind=STATE_BACKEND):
+    """Cria o backend `kind` (ver a docstring do módulo)."""
+    if kind == "memory":
+        return MemoryBackend()
+    if kind == "sqlite":
+        return SQLiteBackend(STATE_DB_PATH)
+    if kind == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("STATE_BACKEND=redis requer o pacote 'redis' (pip install redis).")
+        return RedisBackend(redis.Redis.from_url(REDIS_URL))
+    if kind == "redis-local":
+        return RedisBackend(LocalRedis())
+    raise ValueError(f"STATE_BACKEND desconhecido: {kind!r}")
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """Backend de estado do processo, criado na primeira chamada."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend()
+        return _backend
@@ -0,0 +1,143 @@
+# utils/stripe_webhook.py
+"""Receptor local dos webhooks do Stripe.
+
+Recebe POST em WEBHOOK_PATH, valida a assinatura (cabeçalho Stripe-Signature,
+segredo em STRIPE_WEBHOOK_SECRET) e grava as sessões de checkout pagas no
+registro de pagamentos (utils/payment_ledger.py). Com isso a página de retorno
+normalmente encontra o pagamento já confirmado, sem esperar pelo Stripe.
+
+O servidor roda numa thread do próprio processo do Streamlit, na porta
+STRIPE_WEBHOOK_PORT (padrão 8502), e só é iniciado se o segredo existir. Para
+rodá-lo sozinho: python -m utils.stripe_webhook
+
+sign_payload() gera um cabeçalho no mesmo formato do Stripe, para testar o
+receptor localmente sem o Stripe CLI.
+"""
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import stripe
+
+from . import metrics
+from .payment_ledger import record_checkout_session
+from .reading_jobs import on_payment_confirmed
+from . import readings  # noqa: F401  (registra os construtores das leituras)
+
+WEBHOOK_PATH = "/stripe/webhook"
+WEBHOOK_PORT = int(os.environ.get("STRIPE_WEBHOOK_PORT", 8502))
+
+# Eventos que confirmam o pagamento de uma sessão de checkout
+PAYMENT_EVENTS = ("checkout.session.completed", "checkout.session.async_payment_succeeded")
+
+logger = logging.getLogger(__name__)
+
+_server_lock = threading.Lock()
+_server = None
+_start_attempted = False
+
+
+def sign_payload(payload, secret, timestamp=None):
+    """Cabeçalho Stripe-Signature para `payload` (assinante substituto, para testes)."""
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+    timestamp = int(timestamp if timestamp is not None else time.time())
+    signature = hmac.new(
+        secret.encode("utf-8"), f"{timestamp}.{payload}".encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def handle_event(payload, sig_header, secret):
+    """
+    Valida e processa um evento do webhook. Devolve (status HTTP, mensagem).
+
+    Sessões pagas são gravadas no registro de pagamentos; os demais eventos
+    são aceitos e ignorados, para o Stripe não reenviá-los.
+    """
+    try:
+        event = stripe.Webhook.construct_event(payload, sig_header, secret)
+    except ValueError:
+        metrics.incr("webhook.invalid")
+        return 400, "payload inválido"
+    except stripe.SignatureVerificationError:
+        metrics.incr("webhook.invalid")
+        return 400, "assinatura inválida"
+
+    metrics.incr("webhook.received")
+    if event.type in PAYMENT_EVENTS:
+        session = event.data.object
+        if session.payment_status == "paid":
+            record_checkout_session(session, source="webhook")
+            metrics.incr("webhook.payments_recorded")
+            # Começa a preparar a leitura antes mesmo de o usuário voltar do checkout
+            on_payment_confirmed(session.id, getattr(session, "client_reference_id", None))
+    return 200, "ok"
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    secret = None
+
+    def do_POST(self):
+        if self.path != WEBHOOK_PATH:
+            self._reply(404, "not found")
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        payload = self.rfile.read(length)
+        try:
+            status, message = handle_event(payload, self.headers.get("Stripe-Signature"), self.secret)
+        except Exception:
+            logger.exception("Falha ao processar webhook do Stripe")
+            status, message = 500, "erro"
+        self._reply(status, message)
+
+    def _reply(self, status, message):
+        body = message.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def make_server(secret, host="0.0.0.0", port=WEBHOOK_PORT):
+    """Servidor HTTP do webhook (ainda não iniciado) que valida com `secret`."""
+    handler = type("WebhookHandler", (_WebhookHandler,), {"secret": secret})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def start_webhook_server():
+    """
+    Inicia o receptor numa thread de fundo, uma única vez por processo.
+    Não faz nada se STRIPE_WEBHOOK_SECRET não estiver definido.
+    """
+    global _server, _start_attempted
+    secret = os.environ.get("STRIPE_WEBHOOK_SECRET")
+    if not secret:
+        return None
+    with _server_lock:
+        if not _start_attempted:
+            _start_attempted = True
+            try:
+                _server = make_server(secret)
+            except OSError as e:
+                # Outro processo (ou outra instância) já ocupa a porta
+                logger.warning("Receptor de webhook não iniciado: %s", e)
+                return None
+            threading.Thread(target=_server.serve_forever, name="stripe-webhook", daemon=True).start()
+        return _server
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    webhook_secret = os.environ["STRIPE_WEBHOOK_SECRET"]
+    print(f"Receptor de webhook do Stripe em :{WEBHOOK_PORT}{WEBHOOK_PATH}")
+    metrics.start_metrics_logger()
+    make_server(webhook_secret).serve_forever()
@@ -0,0 +1,96 @@
+# utils/tarot_spreads.py
+"""Registro das tiragens do Tarô Místico, montado uma vez por processo.
+
+Cada tiragem (Spread) traz as posições das cartas, a faixa de tamanho da
+interpretação e a disposição das cartas na página de resultado. O sorteio, o
+prompt e a exibição leem tudo daqui: uma tiragem nova é só mais uma entrada em
+SPREADS, sem if/elif espalhados pela página.
+
+A disposição é uma sequência de linhas (LayoutRow). Cada linha tem um título
+opcional, as larguras relativas das colunas (como em st.columns) e, para cada
+coluna, um título opcional e os índices das cartas empilhadas nela.
+"""
+from collections import namedtuple
+from types import MappingProxyType
+
+DEFAULT_SPREAD = "Conselho do Dia (1 carta)"
+
+# Faixas de tamanho: instrução de palavras para o modelo e limite de tokens
+# (a rede de segurança, com folga sobre a instrução)
+SizeTier = namedtuple("SizeTier", "word_count_guideline max_tokens")
+SIZE_TIERS = MappingProxyType({
+    "curta": SizeTier("entre 150 e 250 palavras.", 500),       # até ~375 palavras
+    "media": SizeTier("entre 400 e 600 palavras.", 1000),      # até ~750 palavras
+    "longa": SizeTier("entre 700 e 800 palavras.", 1300),      # até ~975 palavras
+    "completa": SizeTier("entre 900 e 1.200 palavras.", 2000), # até ~1500 palavras
+})
+
+Spread = namedtuple("Spread", "name positions size layout")
+LayoutRow = namedtuple("LayoutRow", "title widths columns divider_before gap")
+LayoutColumn = namedtuple("LayoutColumn", "title cards")
+
+
+def row(cards, title=None, divider_before=False):
+    """Linha com uma carta por coluna."""
+    return LayoutRow(title, (1,) * len(cards), tuple(LayoutColumn(None, (card,)) for card in cards), divider_before, "small")
+
+
+def grid_layout(num_cards, per_row=2):
+    """Disposição padrão: `per_row` cartas por linha; uma carta sozinha fica centralizada."""
+    rows = []
+    for start in range(0, num_cards, per_row):
+        cards = tuple(range(start, min(start + per_row, num_cards)))
+        if len(cards) == 1:
+            rows.append(LayoutRow(None, (1, 2, 1), (LayoutColumn(None, ()), LayoutColumn(None, cards), LayoutColumn(None, ())), False, "small"))
+        else:
+            rows.append(row(cards))
+    return tuple(rows)
+
+
+def size_tier_for(num_cards):
+    """Faixa de tamanho pelo número de cartas (tiragens fora do registro)."""
+    if num_cards == 1:
+        return SIZE_TIERS["curta"]
+    if num_cards <= 3:
+        return SIZE_TIERS["media"]
+    if num_cards <= 5:
+        return SIZE_TIERS["longa"]
+    return SIZE_TIERS["completa"]
+
+
+def _spread(name, positions, size, layout=None):
+    positions = tuple(positions)
+    return Spread(name, positions, SIZE_TIERS[size], layout or grid_layout(len(positions)))
+
+
+SPREADS = MappingProxyType({spread.name: spread for spread in (
+    _spread("Conselho do Dia (1 carta)", ["Seu Conselho"], "curta"),
+    _spread("Passado, Presente e Futuro (3 cartas)", ["O Passado", "O Presente", "O Futuro"], "media"),
+    _spread("Tiragem Temática (3 cartas)", ["Contexto Atual", "O Desafio", "O Conselho"], "media"),
+    _spread(
+        "Cruz Celta (10 cartas)",
+        ["1. Situação Atual", "2. Obstáculo", "3. Base", "4. Passado", "5. Objetivo", "6. Futuro",
+         "7. Atitude", "8. Ambiente", "9. Esperanças/Medos", "10. Resultado"],
+        "completa",
+        (
+            row((0, 1), "O Coração da Questão"),
+            row((2, 3), "As Fundações", divider_before=True),
+            row((4, 5), "O Potencial e o Futuro", divider_before=True),
+            row((6, 7), "Influências e Resultado Final", divider_before=True),
+            row((8, 9)),
+        ),
+    ),
+    _spread(
+        "Caminhos da Decisão (4 cartas)",
+        ["Caminho A: Situação", "Caminho A: Resultado", "Caminho B: Situação", "Caminho B: Resultado"],
+        "longa",
+        (LayoutRow(None, (1, 1), (LayoutColumn("Caminho A", (0, 1)), LayoutColumn("Caminho B", (2, 3))), False, "large"),),
+    ),
+    _spread("Conselho Espiritual (3 cartas)", ["Lição a Aprender", "Energia a Integrar", "Bloqueio a Liberar"], "media"),
+    _spread("Jornada do Autoconhecimento (5 cartas)", ["Eu Exterior", "Eu Interior", "Meu Desafio", "Meu Potencial", "Equilíbrio"], "longa"),
+)})
+
+
+def get_spread(name):
+    """Tiragem registrada com esse nome, ou None."""
+    return SPREADS.get(name)
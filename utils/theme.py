@@ -3,6 +3,7 @@ import streamlit as st
 
 # <<< ADICIONE ESTA LINHA
 from .helpers import get_img_as_base64
+from .assets import asset_src
 
 def apply_mystical_theme():
     """Aplica o tema visual místico avançado e imersivo à aplicação."""
@@ -985,7 +986,7 @@ def apply_cosmic_theme():
 def apply_shamanic_theme():
     """Aplica o tema visual do Portal dos Sonhos Ancestrais, com containers mais opacos para melhor legibilidade."""
     # Use a imagem de fundo que você criou, ex: 'dreamcatcher_forest.png'
-    img = get_img_as_base64("images/dreamcatcher_forest.png")
+    img_src = asset_src("images/dreamcatcher_forest.png", "full")
 
     st.html(f"""
     <style>
@@ -1011,7 +1012,7 @@ def apply_shamanic_theme():
 
         /* ==================== PORTAL ANCESTRAL - FUNDO ==================== */
         .stApp {{
-            background: {'url(data:image/png;base64,' + img + ') center/cover fixed,' if img else ''}
+            background: {'url(' + img_src + ') center/cover fixed,' if img_src else ''}
                        radial-gradient(ellipse at 80% 20%, rgba(34, 139, 34, 0.15) 0%, transparent 50%),
                        radial-gradient(ellipse at 20% 80%, rgba(255, 140, 0, 0.1) 0%, transparent 50%),
                        linear-gradient(135deg, #1c1c1c 0%, #0a1a0a 25%, #2d1810 75%, #1c1c1c 100%);
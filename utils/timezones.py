@@ -0,0 +1,57 @@
+# utils/timezones.py
+"""Fuso horário por coordenadas, com um único TimezoneFinder por processo.
+
+Criar um TimezoneFinder abre e indexa os arquivos de polígonos dos fusos; era
+feito a cada cálculo de mapa. Aqui a instância é criada uma vez (em segundo
+plano, por preload_timezone_finder(), assim que a página sobe) e reaproveitada.
+Com TIMEZONEFINDER_IN_MEMORY=1 os polígonos são lidos inteiros para a memória
+(carga mais lenta, consultas sem acesso a disco).
+
+As respostas ficam num cache LRU por coordenadas arredondadas a
+TIMEZONE_GRID_DECIMALS casas (3 casas ≈ 110 m): a mesma cidade, geocodificada
+sempre nas mesmas coordenadas, não volta aos polígonos.
+"""
+import os
+import threading
+import time
+
+from timezonefinder import TimezoneFinder
+
+from . import metrics
+from .cache import ByteLRUCache
+
+TIMEZONEFINDER_IN_MEMORY = os.environ.get("TIMEZONEFINDER_IN_MEMORY", "0") == "1"
+TIMEZONE_GRID_DECIMALS = 3
+
+TIMEZONE_CACHE = ByteLRUCache(max_bytes=1 * 1024 * 1024, name="timezones")
+
+_finder = None
+_finder_lock = threading.Lock()
+_preload_started = False
+
+
+def get_timezone_finder():
+    """TimezoneFinder do processo, criado na primeira chamada."""
+    global _finder
+    with _finder_lock:
+        if _finder is None:
+            start = time.perf_counter()
+            _finder = TimezoneFinder(in_memory=TIMEZONEFINDER_IN_MEMORY)
+            metrics.observe("timezones.load", time.perf_counter() - start)
+        return _finder
+
+
+def preload_timezone_finder():
+    """Carrega o TimezoneFinder numa thread de fundo (uma vez por processo)."""
+    global _preload_started
+    with _finder_lock:
+        if _preload_started or _finder is not None:
+            return
+        _preload_started = True
+    threading.Thread(target=get_timezone_finder, name="timezone-preload", daemon=True).start()
+
+
+def timezone_at(lat, lng):
+    """Nome do fuso (ex.: "America/Sao_Paulo") nas coordenadas, ou None (alto-mar)."""
+    key = (round(lat, TIMEZONE_GRID_DECIMALS), round(lng, TIMEZONE_GRID_DECIMALS))
+    return TIMEZONE_CACHE.get_or_load(key, lambda: get_timezone_finder().timezone_at(lng=lng, lat=lat))
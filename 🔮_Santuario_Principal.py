@@ -3,6 +3,9 @@
 import streamlit as st
 from utils.theme import apply_mystical_theme
 from utils.helpers import mystical_divider, get_img_as_base64
+from utils.assets import asset_src, preload_hot_assets, PORTAL_ICON_WIDTH
+from utils.stripe_webhook import start_webhook_server
+from utils.metrics import start_metrics_logger
 
 # Configuração da página e aplicação do tema
 st.set_page_config(
@@ -12,14 +15,22 @@ st.set_page_config(
 )
 apply_mystical_theme()
 
-# --- Pré-carregamento das imagens em Base64 para uso no HTML ---
+# Aquece o cache de imagens na primeira visita ao processo (ASSET_CACHE_PRELOAD=1)
+preload_hot_assets()
+
+# Receptor dos webhooks do Stripe (uma vez por processo, se STRIPE_WEBHOOK_SECRET existir)
+start_webhook_server()
+# Relatório periódico das métricas do processo no log (ver utils/metrics)
+start_metrics_logger()
+
+# --- Pré-carregamento das URLs dos ícones para uso no HTML ---
 try:
-    icon_tarot_b64 = get_img_as_base64("images/icon_tarot.png")
-    icon_stars_b64 = get_img_as_base64("images/icon_stars.png")
-    icon_dream_b64 = get_img_as_base64("images/icon_dream.png")
+    icon_tarot_src = asset_src("images/icon_tarot.png", PORTAL_ICON_WIDTH)
+    icon_stars_src = asset_src("images/icon_stars.png", PORTAL_ICON_WIDTH)
+    icon_dream_src = asset_src("images/icon_dream.png", PORTAL_ICON_WIDTH)
 except Exception as e:
     st.error(f"Erro ao carregar imagens dos ícones: {e}")
-    icon_tarot_b64 = icon_stars_b64 = icon_dream_b64 = None
+    icon_tarot_src = icon_stars_src = icon_dream_src = None
 
 # CSS personalizado para o portal (SEU CÓDIGO ORIGINAL - SEM ALTERAÇÕES)
 st.html("""
@@ -210,7 +221,7 @@ col1, col2, col3 = st.columns(3, gap="large")
 
 # Tarô Místico
 with col1:
-    icon_html = f'<img src="data:image/png;base64,{icon_tarot_b64}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_tarot_b64 else "🔮"
+    icon_html = f'<img src="{icon_tarot_src}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_tarot_src else "🔮"
 
     st.html(f"""
     <a href="Taro_Mistico" target="_self" style="text-decoration: none;">
@@ -230,7 +241,7 @@ with col1:
 
 # Ecos Estelares
 with col2:
-    icon_html = f'<img src="data:image/png;base64,{icon_stars_b64}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_stars_b64 else "⭐"
+    icon_html = f'<img src="{icon_stars_src}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_stars_src else "⭐"
 
     st.html(f"""
     <a href="Ecos_Estelares" target="_self" style="text-decoration: none;">
@@ -250,7 +261,7 @@ with col2:
 
 # Intérprete Xamânico
 with col3:
-    icon_html = f'<img src="data:image/png;base64,{icon_dream_b64}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_dream_b64 else "🌙"
+    icon_html = f'<img src="{icon_dream_src}" style="width: 60px; height: 60px; object-fit: contain;" />' if icon_dream_src else "🌙"
 
     st.html(f"""
     <a href="Interprete_Xamanico" target="_self" style="text-decoration: none;">